@@ -0,0 +1,236 @@
+"""
+Streaming attachment handling for the contact API.
+RequestSizeLimit rejects a request as soon as the body, or any one part of
+a multipart body, passes its limit while streaming in. Accepted uploads are
+used from the temp files Starlette spooled them to, and outgoing messages
+are written to the mail spool part by part, so a request never holds more
+than a chunk in memory.
+"""
+
+import base64
+import mimetypes
+import os
+from dataclasses import dataclass
+from email.mime.base import MIMEBase
+from email.mime.text import MIMEText
+from email.message import EmailMessage, Message
+from email.policy import SMTP
+from email.utils import formatdate, make_msgid
+from typing import BinaryIO, Optional
+
+from fastapi import HTTPException, UploadFile
+from python_multipart.multipart import MultipartParseError, MultipartParser, parse_options_header
+from starlette.types import ASGIApp, Message as ASGIMessage, Receive, Scope, Send
+
+# Base64 turns 57 bytes into one 76-character line, so read multiples of 57
+ENCODE_CHUNK_SIZE = 57 * 1024
+
+# File signatures accepted per extension; text files must not contain NUL bytes
+MAGIC_BYTES = {
+    ".pdf": (b"%PDF-",),
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".doc": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),  # OLE compound file
+    ".docx": (b"PK\x03\x04",),  # ZIP container
+}
+TEXT_EXTENSIONS = {".txt"}
+SNIFF_BYTES = 512
+
+
+class AttachmentError(ValueError):
+    """An upload was rejected; the message is safe to show the user."""
+
+
+@dataclass
+class SpooledAttachment:
+    """An accepted upload, read from the file Starlette spooled it to."""
+
+    filename: str
+    file: BinaryIO
+    size: int
+    content_type: str
+
+
+def matches_type(ext: str, head: bytes) -> bool:
+    """Check a file's first bytes fit its extension (unknown extensions pass)."""
+    if ext in TEXT_EXTENSIONS:
+        return b"\x00" not in head
+    signatures = MAGIC_BYTES.get(ext)
+    return head.startswith(signatures) if signatures else True
+
+
+async def check_upload(
+    upload: UploadFile, allowed_extensions: set[str], max_size: int
+) -> SpooledAttachment:
+    """
+    Accept an upload if its extension is allowed, its first bytes match
+    the extension's magic bytes and it is no larger than `max_size`.
+
+    The size is normally enforced earlier, by RequestSizeLimit while the
+    body streams in; this check covers apps mounted without it. The upload
+    is not copied: the attachment reads Starlette's spooled file, so it is
+    only valid until the request ends.
+
+    Raises:
+        AttachmentError: If the type is not allowed, does not match its
+            content, or the file is larger than `max_size`
+    """
+    ext = os.path.splitext(upload.filename)[1].lower()
+    if ext not in allowed_extensions:
+        raise AttachmentError(
+            f"File type {ext} not allowed. Allowed: {', '.join(allowed_extensions)}"
+        )
+
+    size = upload.size
+    if size is None:
+        upload.file.seek(0, os.SEEK_END)
+        size = upload.file.tell()
+    if size > max_size:
+        raise AttachmentError(f"File too large (max {max_size // (1024 * 1024)}MB)")
+
+    await upload.seek(0)
+    head = await upload.read(SNIFF_BYTES)
+    await upload.seek(0)
+    if not matches_type(ext, head):
+        raise AttachmentError(f"File content does not match its {ext} extension")
+
+    return SpooledAttachment(
+        filename=os.path.basename(upload.filename),
+        file=upload.file,
+        size=size,
+        content_type=mimetypes.guess_type(upload.filename)[0] or "application/octet-stream",
+    )
+
+
+def write_message(
+    out: BinaryIO,
+    headers: dict[str, str],
+    body_html: str,
+    attachments: list[SpooledAttachment],
+):
+    """
+    Write a multipart message with base64 attachments to `out`, encoding
+    each attachment from its file one chunk at a time.
+    """
+    boundary = f"=={make_msgid(domain='contact').strip('<>')}"
+
+    envelope = EmailMessage(policy=SMTP)
+    for name, value in headers.items():
+        envelope[name] = value
+    envelope["Date"] = formatdate(localtime=False)
+    envelope["Message-ID"] = make_msgid()
+    envelope["MIME-Version"] = "1.0"
+    envelope["Content-Type"] = f'multipart/mixed; boundary="{boundary}"'
+    _write_headers(out, envelope)
+
+    delimiter = f"--{boundary}\r\n".encode()
+    out.write(delimiter)
+    out.write(MIMEText(body_html, "html", "utf-8").as_bytes(policy=SMTP))
+
+    for attachment in attachments:
+        # Headers only; the body is streamed below
+        part = MIMEBase(*attachment.content_type.split("/", 1))
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", "attachment", filename=attachment.filename)
+        out.write(b"\r\n" + delimiter)
+        _write_headers(out, part)
+
+        attachment.file.seek(0)
+        while chunk := attachment.file.read(ENCODE_CHUNK_SIZE):
+            out.write(base64.encodebytes(chunk).replace(b"\n", b"\r\n"))
+
+    out.write(f"\r\n--{boundary}--\r\n".encode())
+
+
+def _write_headers(out: BinaryIO, message: Message):
+    """Write a header block and the blank line ending it, without any body."""
+    for name, value in message.items():
+        out.write(SMTP.fold_binary(name, value))
+    out.write(b"\r\n")
+
+
+class RequestSizeLimit:
+    """
+    ASGI middleware rejecting request bodies over `max_size` with 413,
+    up front from Content-Length or as soon as a streamed body passes it.
+
+    With `max_part_size`, multipart bodies are also parsed as they arrive,
+    and the request is rejected as soon as any one part (an uploaded file)
+    passes that size, before the rest of the body is read.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int, max_part_size: Optional[int] = None):
+        self.app = app
+        self.max_size = max_size
+        self.max_part_size = max_part_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_type = b""
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_size:
+                await self._reject(send)
+                return
+            if name == b"content-type":
+                content_type = value
+
+        received = 0
+        parts = self._part_monitor(content_type)
+
+        async def limited_receive() -> ASGIMessage:
+            nonlocal received, parts
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                received += len(body)
+                if received > self.max_size:
+                    raise HTTPException(status_code=413, detail="Request too large")
+                if parts is not None:
+                    try:
+                        parts.write(body)
+                    except MultipartParseError:
+                        # Malformed; leave the error to the app's own parser
+                        parts = None
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _part_monitor(self, content_type: bytes) -> Optional[MultipartParser]:
+        """Parser that raises 413 when a part passes `max_part_size`, if the body is multipart."""
+        if self.max_part_size is None:
+            return None
+        media_type, options = parse_options_header(content_type)
+        boundary = options.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            return None
+
+        part_size = 0
+
+        def on_part_begin():
+            nonlocal part_size
+            part_size = 0
+
+        def on_part_data(data: bytes, start: int, end: int):
+            nonlocal part_size
+            part_size += end - start
+            if part_size > self.max_part_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large (max {self.max_part_size // (1024 * 1024)}MB)",
+                )
+
+        return MultipartParser(
+            boundary, {"on_part_begin": on_part_begin, "on_part_data": on_part_data}
+        )
+
+    async def _reject(self, send: Send):
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": b'{"detail":"Request too large"}'})
@@ -0,0 +1,388 @@
+"""
+Background mail delivery for the contact API.
+Messages are spooled to disk, then sent over persistent SMTP connections
+with retry and backoff, so form submissions never wait on SMTP.
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from email.message import Message
+from typing import BinaryIO, Callable, Optional
+
+import aiosmtplib
+
+# Retry schedule: 30s, 1m, 2m, ... capped at an hour, about 8 hours in all
+MAX_ATTEMPTS = 15
+RETRY_BASE = 30
+RETRY_MAX = 3600
+
+# A claimed message is picked up again if its worker dies mid-send
+LEASE_SECONDS = 300
+
+# How often to look for due retries and mail spooled by other workers
+POLL_INTERVAL = 15
+
+# How long `stop` waits for the dispatcher and workers to exit
+STOP_TIMEOUT = 10
+
+
+@dataclass
+class SmtpConfig:
+    """SMTP server and credentials."""
+
+    host: str
+    port: int
+    username: str
+    password: str
+    from_email: str
+    connections: int = 1
+    idle_timeout: float = 60  # Close a connection after this long unused
+    timeout: float = 30
+
+    @classmethod
+    def from_env(cls) -> "SmtpConfig":
+        """Read SMTP settings from the environment."""
+        return cls(
+            host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=os.getenv("SMTP_USER", ""),
+            password=os.getenv("SMTP_PASS", ""),
+            from_email=os.getenv("FROM_EMAIL", "noreply@itsjesse.dev"),
+            connections=int(os.getenv("SMTP_CONNECTIONS", "1")),
+            idle_timeout=float(os.getenv("SMTP_IDLE_TIMEOUT", "60")),
+        )
+
+    @property
+    def configured(self) -> bool:
+        """True if credentials are set."""
+        return bool(self.username and self.password)
+
+
+@dataclass
+class SpooledMail:
+    """A message waiting in the spool."""
+
+    id: str
+    sender: str
+    recipients: list[str]
+    attempts: int
+
+
+class MailSpool:
+    """
+    Durable message store: one .eml file per message plus a SQLite index
+    of recipients and retry state. Safe to share between uvicorn workers.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(os.path.join(directory, "messages"), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "spool.db"),
+            isolation_level=None,
+            check_same_thread=False,
+            timeout=30,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS mail (
+                id TEXT PRIMARY KEY,
+                sender TEXT NOT NULL,
+                recipients TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                failed INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_mail_due ON mail (failed, next_attempt_at)"
+        )
+
+    def put(self, sender: str, recipients: list[str], data: bytes) -> str:
+        """Write a message to disk and index it for delivery. Returns its id."""
+        return self.put_stream(sender, recipients, lambda f: f.write(data))
+
+    def put_stream(
+        self, sender: str, recipients: list[str], write: Callable[[BinaryIO], None]
+    ) -> str:
+        """Like `put`, with the message written to the spool file by `write`."""
+        mail_id = uuid.uuid4().hex
+        path = self.path(mail_id)
+
+        # Write then rename, so a crash never leaves a half-written message
+        try:
+            with open(f"{path}.tmp", "wb") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.remove(f"{path}.tmp")
+            raise
+        os.replace(f"{path}.tmp", path)
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO mail (id, sender, recipients, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (mail_id, sender, ",".join(recipients), now, now),
+            )
+        return mail_id
+
+    def claim(self, limit: int, lease: float = LEASE_SECONDS) -> list[SpooledMail]:
+        """Take due messages, hiding them from other workers for `lease` seconds."""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT id, sender, recipients, attempts FROM mail "
+                    "WHERE failed = 0 AND next_attempt_at <= ? "
+                    "ORDER BY next_attempt_at LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE mail SET next_attempt_at = ? WHERE id = ?",
+                    [(now + lease, row[0]) for row in rows],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+        return [
+            SpooledMail(id=id, sender=sender, recipients=recipients.split(","), attempts=attempts)
+            for id, sender, recipients, attempts in rows
+        ]
+
+    def path(self, mail_id: str) -> str:
+        """Location of a message's .eml file."""
+        return os.path.join(self.directory, "messages", f"{mail_id}.eml")
+
+    def read(self, mail: SpooledMail) -> bytes:
+        """Load a message's raw bytes."""
+        with open(self.path(mail.id), "rb") as f:
+            return f.read()
+
+    def delivered(self, mail: SpooledMail):
+        """Remove a sent message."""
+        with self._lock:
+            self._db.execute("DELETE FROM mail WHERE id = ?", (mail.id,))
+        try:
+            os.remove(self.path(mail.id))
+        except FileNotFoundError:
+            pass
+
+    def retry(self, mail: SpooledMail, error: str, delay: float):
+        """Schedule another attempt after `delay` seconds."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE mail SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                (time.time() + delay, error, mail.id),
+            )
+
+    def fail(self, mail: SpooledMail, error: str):
+        """Give up on a message. Its file is kept for manual inspection."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE mail SET attempts = attempts + 1, failed = 1, last_error = ? WHERE id = ?",
+                (error, mail.id),
+            )
+
+    def next_due(self) -> Optional[float]:
+        """Time the next pending message is due, or None if the spool is empty."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM mail WHERE failed = 0"
+            ).fetchone()
+        return row[0]
+
+    def counts(self) -> dict[str, int]:
+        """Number of pending and failed messages."""
+        with self._lock:
+            pending, failed = self._db.execute(
+                "SELECT COUNT(*) - COALESCE(SUM(failed), 0), COALESCE(SUM(failed), 0) FROM mail"
+            ).fetchone()
+        return {"pending": pending, "failed": failed}
+
+    def close(self):
+        """Close the index."""
+        with self._lock:
+            self._db.close()
+
+
+class SmtpConnection:
+    """One authenticated SMTP session, reconnected on demand."""
+
+    def __init__(self, config: SmtpConfig):
+        self.config = config
+        self._client: Optional[aiosmtplib.SMTP] = None
+
+    async def send(self, sender: str, recipients: list[str], data: bytes):
+        """Send one message, reconnecting once if the server dropped the session."""
+        for attempt in range(2):
+            client = await self._connect()
+            try:
+                await client.sendmail(sender, recipients, data)
+                return
+            except aiosmtplib.SMTPServerDisconnected:
+                self._client = None
+                if attempt:
+                    raise
+
+    async def close(self):
+        """Log out and close the session, if open."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await asyncio.wait_for(client.quit(), timeout=5)
+        except Exception:
+            client.close()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Current session, or a new one after STARTTLS and login."""
+        if self._client is not None and self._client.is_connected:
+            return self._client
+
+        client = aiosmtplib.SMTP(
+            hostname=self.config.host,
+            port=self.config.port,
+            start_tls=True,
+            timeout=self.config.timeout,
+        )
+        await client.connect()
+        await client.login(self.config.username, self.config.password)
+        self._client = client
+        return client
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter after `attempts` failures."""
+    delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+class MailQueue:
+    """
+    Spool-backed delivery queue.
+
+    `enqueue` returns once the message is on disk. A dispatcher claims due
+    messages from the spool and hands them to `connections` workers, each
+    holding one SMTP session open while there is mail to send. Failed sends
+    are retried with backoff; recipient or sender rejections are not.
+    """
+
+    def __init__(self, config: SmtpConfig, spool: MailSpool):
+        self.config = config
+        self.spool = spool
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._ready: asyncio.Queue[SpooledMail] = asyncio.Queue(maxsize=config.connections)
+
+    async def enqueue(self, message: Message, recipients: list[str]) -> str:
+        """Spool a message for delivery. Returns its id."""
+        mail_id = await asyncio.to_thread(
+            self.spool.put, self.config.from_email, recipients, message.as_bytes()
+        )
+        self._wake.set()
+        return mail_id
+
+    async def enqueue_stream(
+        self, write: Callable[[BinaryIO], None], recipients: list[str]
+    ) -> str:
+        """Spool a message written straight to disk by `write`. Returns its id."""
+        mail_id = await asyncio.to_thread(
+            self.spool.put_stream, self.config.from_email, recipients, write
+        )
+        self._wake.set()
+        return mail_id
+
+    def start(self):
+        """Start the dispatcher and connection workers."""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._tasks.append(asyncio.create_task(self._dispatch()))
+        for _ in range(self.config.connections):
+            self._tasks.append(asyncio.create_task(self._worker(SmtpConnection(self.config))))
+
+    async def stop(self):
+        """Stop delivering. Unsent mail stays in the spool for the next start."""
+        # The flag stops the loops even if a cancel is swallowed: on 3.11,
+        # wait_for drops it when its inner wait completes at the same moment
+        self._stopping = True
+        self._wake.set()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=STOP_TIMEOUT)
+            if pending:
+                print(f"Warning: {len(pending)} mail tasks still running after {STOP_TIMEOUT}s")
+        self._tasks = []
+
+    async def _dispatch(self):
+        """Feed due messages to the workers, sleeping until the next is due."""
+        while not self._stopping:
+            self._wake.clear()
+            batch = await asyncio.to_thread(self.spool.claim, self.config.connections)
+            for mail in batch:
+                await self._ready.put(mail)
+            if batch:
+                continue
+
+            due = await asyncio.to_thread(self.spool.next_due)
+            delay = POLL_INTERVAL if due is None else min(POLL_INTERVAL, max(0.0, due - time.time()))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self, connection: SmtpConnection):
+        """Deliver messages over one connection, closing it when idle."""
+        try:
+            while not self._stopping:
+                try:
+                    mail = await asyncio.wait_for(
+                        self._ready.get(), timeout=self.config.idle_timeout
+                    )
+                except asyncio.TimeoutError:
+                    await connection.close()
+                    continue
+                await self._deliver(connection, mail)
+        finally:
+            await connection.close()
+
+    async def _deliver(self, connection: SmtpConnection, mail: SpooledMail):
+        """Send one message and record the outcome in the spool."""
+        try:
+            data = await asyncio.to_thread(self.spool.read, mail)
+            await connection.send(mail.sender, mail.recipients, data)
+        except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused) as e:
+            print(f"Mail {mail.id} rejected: {e}")
+            await asyncio.to_thread(self.spool.fail, mail, str(e))
+            return
+        except (aiosmtplib.SMTPException, OSError) as e:
+            attempts = mail.attempts + 1
+            if attempts >= MAX_ATTEMPTS:
+                print(f"Mail {mail.id} failed after {attempts} attempts: {e}")
+                await asyncio.to_thread(self.spool.fail, mail, str(e))
+            else:
+                delay = retry_delay(attempts)
+                print(f"Mail {mail.id} send error, retrying in {delay:.0f}s: {e}")
+                await asyncio.to_thread(self.spool.retry, mail, str(e), delay)
+            return
+
+        await asyncio.to_thread(self.spool.delivered, mail)
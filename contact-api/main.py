@@ -8,23 +8,40 @@ import re
 import time
 import hashlib
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import Optional
-from collections import defaultdict
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from functools import partial
 
-import aiosmtplib
 from fastapi import FastAPI, Form, File, UploadFile, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
 from dotenv import load_dotenv
 
+from attachments import AttachmentError, RequestSizeLimit, SpooledAttachment, check_upload, write_message
+from delivery import MailQueue, MailSpool, SmtpConfig
+from ratelimit import create_rate_limiter
+from spam import SpamClassifier, load_domains
+
 load_dotenv()
 
-app = FastAPI(title="itsjesse.dev Contact API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background mail delivery and the rate limiter; unsent mail stays spooled across restarts."""
+    spool = MailSpool(os.getenv("MAIL_SPOOL_DIR", "spool"))
+    app.state.mail_queue = MailQueue(SmtpConfig.from_env(), spool)
+    app.state.mail_queue.start()
+    app.state.rate_limiter = create_rate_limiter(
+        os.getenv("RATE_LIMIT_BACKEND"), RATE_LIMIT_MAX, RATE_LIMIT_WINDOW
+    )
+    yield
+    await app.state.mail_queue.stop()
+    await app.state.rate_limiter.close()
+    spool.close()
+
+
+app = FastAPI(title="itsjesse.dev Contact API", lifespan=lifespan)
 
 # CORS for frontend
 app.add_middleware(
@@ -43,27 +60,47 @@ app.add_middleware(
 # SPAM PROTECTION
 # ============================================================================
 
-# Rate limiting: track submissions per IP
-rate_limit_store: dict[str, list[float]] = defaultdict(list)
+# Rate limiting per IP (backend set by RATE_LIMIT_BACKEND, see ratelimit.py)
 RATE_LIMIT_MAX = 3  # Max submissions per window
 RATE_LIMIT_WINDOW = 3600  # 1 hour in seconds
 
 # Time-based check: form must be open for at least this many seconds
 MIN_FORM_TIME = 3
 
-# Blocked patterns in message content
-SPAM_PATTERNS = [
-    r'(?i)\bcrypto\b.*\binvest',
-    r'(?i)\bbitcoin\b.*\bprofit',
-    r'(?i)\bmake\s+\$?\d+.*\bday\b',
-    r'(?i)\bviagra\b',
-    r'(?i)\bcasino\b',
-    r'(?i)\bSEO\s+service',
-    r'(?i)\bbuy\s+followers',
-    r'(?i)\bbacklink',
-    r'(?i)click\s+here.*\bhttp',
+# Spam rules, weighted; a message scoring SPAM_THRESHOLD or more is dropped
+SPAM_THRESHOLD = 1.0
+
+# Words and phrases (case-insensitive, whole words, any whitespace between words)
+SPAM_PHRASES = {
+    "viagra": 1.0,
+    "casino": 1.0,
+}
+
+# Regular expressions for anything a phrase can't express (case-insensitive),
+# including word prefixes such as "backlink" in "backlinking"
+SPAM_PATTERNS = {
+    r'\bcrypto\b.*?\binvest': 1.0,
+    r'\bbitcoin\b.*?\bprofit': 1.0,
+    r'\bmake\s+\$?\d+.*?\bday\b': 1.0,
+    r'\bseo\s+service': 1.0,
+    r'\bbuy\s+followers': 1.0,
+    r'\bbacklink': 1.0,
+    r'click\s+here.*?\bhttp': 1.0,
+}
+
+# Disposable email providers: known domains (DISPOSABLE_DOMAINS_FILE) plus name fragments
+DISPOSABLE_DOMAIN_KEYWORDS = [
+    'tempmail', 'throwaway', 'guerrilla', 'mailinator',
+    'fakeinbox', '10minute', 'temp-mail', 'disposable'
 ]
 
+spam_classifier = SpamClassifier(
+    SPAM_PHRASES,
+    SPAM_PATTERNS,
+    disposable_domains=load_domains(os.getenv("DISPOSABLE_DOMAINS_FILE")),
+    domain_keywords=DISPOSABLE_DOMAIN_KEYWORDS,
+)
+
 
 def get_client_ip(request: Request) -> str:
     """Extract client IP from request, handling proxies."""
@@ -73,17 +110,9 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-def check_rate_limit(ip: str) -> bool:
+async def check_rate_limit(ip: str) -> bool:
     """Check if IP has exceeded rate limit. Returns True if allowed."""
-    now = time.time()
-    # Clean old entries
-    rate_limit_store[ip] = [t for t in rate_limit_store[ip] if now - t < RATE_LIMIT_WINDOW]
-
-    if len(rate_limit_store[ip]) >= RATE_LIMIT_MAX:
-        return False
-
-    rate_limit_store[ip].append(now)
-    return True
+    return await app.state.rate_limiter.allow(ip)
 
 
 def check_honeypot(honeypot_value: str) -> bool:
@@ -97,22 +126,14 @@ def check_form_time(form_loaded_at: int) -> bool:
     return (now - form_loaded_at) >= MIN_FORM_TIME
 
 
-def check_spam_content(text: str) -> bool:
-    """Check for spam patterns. Returns True if clean."""
-    for pattern in SPAM_PATTERNS:
-        if re.search(pattern, text):
-            return False
-    return True
+def check_spam_content(text: str) -> float:
+    """Score text against the spam rules. 0 means no rule matched."""
+    return spam_classifier.score(text).score
 
 
 def validate_email_domain(email: str) -> bool:
-    """Basic check for suspicious email domains."""
-    suspicious_domains = [
-        'tempmail', 'throwaway', 'guerrilla', 'mailinator',
-        'fakeinbox', '10minute', 'temp-mail', 'disposable'
-    ]
-    domain = email.split('@')[-1].lower()
-    return not any(s in domain for s in suspicious_domains)
+    """Check the email is not on a disposable domain. Returns True if allowed."""
+    return not spam_classifier.is_disposable(email)
 
 
 # ============================================================================
@@ -124,42 +145,26 @@ async def send_email(
     subject: str,
     body_html: str,
     reply_to: str,
-    attachments: list[tuple[str, bytes]] = None
+    attachments: list[SpooledAttachment] = None
 ):
-    """Send email via Google Workspace SMTP."""
-    smtp_host = os.getenv("SMTP_HOST", "smtp.gmail.com")
-    smtp_port = int(os.getenv("SMTP_PORT", "587"))
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_pass = os.getenv("SMTP_PASS")
-    from_email = os.getenv("FROM_EMAIL", "noreply@itsjesse.dev")
-
-    if not smtp_user or not smtp_pass:
+    """
+    Queue email for delivery via Google Workspace SMTP.
+    Returns once the message is spooled to disk; sending happens in the background.
+    Attachments are base64-encoded from their upload files straight into the spool.
+    """
+    mail_queue: MailQueue = app.state.mail_queue
+    if not mail_queue.config.configured:
         raise HTTPException(status_code=500, detail="Email configuration error")
 
-    msg = MIMEMultipart()
-    msg["From"] = f"itsjesse.dev Contact <{from_email}>"
-    msg["To"] = to_email
-    msg["Subject"] = subject
-    msg["Reply-To"] = reply_to
-
-    msg.attach(MIMEText(body_html, "html"))
-
-    # Handle attachments
-    if attachments:
-        for filename, content in attachments:
-            part = MIMEBase("application", "octet-stream")
-            part.set_payload(content)
-            encoders.encode_base64(part)
-            part.add_header("Content-Disposition", f"attachment; filename={filename}")
-            msg.attach(part)
-
-    await aiosmtplib.send(
-        msg,
-        hostname=smtp_host,
-        port=smtp_port,
-        username=smtp_user,
-        password=smtp_pass,
-        start_tls=True,
+    headers = {
+        "From": f"itsjesse.dev Contact <{mail_queue.config.from_email}>",
+        "To": to_email,
+        "Subject": subject,
+        "Reply-To": reply_to,
+    }
+    await mail_queue.enqueue_stream(
+        partial(write_message, headers=headers, body_html=body_html, attachments=attachments or []),
+        [to_email],
     )
 
 
@@ -172,6 +177,12 @@ ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx', '.txt', '.png', '.jpg', '.jpeg'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_FILES = 3
 
+# Whole request body: files plus room for the form fields. Both limits are
+# enforced while the body streams in, MAX_FILE_SIZE for each multipart part.
+MAX_REQUEST_SIZE = MAX_FILES * MAX_FILE_SIZE + 1024 * 1024
+
+app.add_middleware(RequestSizeLimit, max_size=MAX_REQUEST_SIZE, max_part_size=MAX_FILE_SIZE)
+
 
 @app.post("/contact")
 async def submit_contact(
@@ -199,7 +210,7 @@ async def submit_contact(
         return {"success": True, "message": "Thank you for your message!"}
 
     # 2. Rate limit check
-    if not check_rate_limit(client_ip):
+    if not await check_rate_limit(client_ip):
         raise HTTPException(
             status_code=429,
             detail="Too many submissions. Please try again later."
@@ -212,7 +223,7 @@ async def submit_contact(
 
     # 4. Spam content check
     full_text = f"{name} {company or ''} {message}"
-    if not check_spam_content(full_text):
+    if check_spam_content(full_text) >= SPAM_THRESHOLD:
         return {"success": True, "message": "Thank you for your message!"}
 
     # 5. Disposable email check
@@ -244,23 +255,16 @@ async def submit_contact(
     if len(attachments) > MAX_FILES:
         raise HTTPException(status_code=400, detail=f"Maximum {MAX_FILES} attachments allowed")
 
-    processed_attachments = []
-    for file in attachments:
-        if file.filename:
-            # Check extension
-            ext = os.path.splitext(file.filename)[1].lower()
-            if ext not in ALLOWED_EXTENSIONS:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File type {ext} not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+    # Checked for type, content and size; used in place from Starlette's spooled files
+    processed_attachments: list[SpooledAttachment] = []
+    try:
+        for file in attachments:
+            if file.filename:
+                processed_attachments.append(
+                    await check_upload(file, ALLOWED_EXTENSIONS, MAX_FILE_SIZE)
                 )
-
-            # Read and check size
-            content = await file.read()
-            if len(content) > MAX_FILE_SIZE:
-                raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-
-            processed_attachments.append((file.filename, content))
+    except AttachmentError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # ---- ROUTE EMAIL ----
 
@@ -316,8 +320,10 @@ async def submit_contact(
             reply_to=email,
             attachments=processed_attachments if processed_attachments else None
         )
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Email send error: {e}")
+        print(f"Email queue error: {e}")
         raise HTTPException(status_code=500, detail="Failed to send message. Please try again.")
 
     return {
@@ -329,4 +335,5 @@ async def submit_contact(
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    mail = await asyncio.to_thread(app.state.mail_queue.spool.counts)
+    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat(), "mail": mail}
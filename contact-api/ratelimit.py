@@ -0,0 +1,200 @@
+"""
+Token-bucket rate limiting for the contact API.
+Each key (client IP) gets a bucket of `limit` submissions that refills over
+`window` seconds. A check is O(1), and idle buckets are dropped once full,
+since a full bucket is the same as no bucket.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Keys kept by the in-memory backend; past this the least recently seen go first
+MEMORY_MAX_KEYS = 100_000
+
+# SQLite rows for idle keys are purged every this many checks
+SQLITE_PURGE_EVERY = 1000
+
+
+class RateLimitBackend(Protocol):
+    """Storage for token buckets."""
+
+    async def hit(self, key: str, capacity: float, rate: float, ttl: float, now: float) -> bool:
+        """Refill the key's bucket, take one token if there is one. Returns True if taken."""
+        ...
+
+    async def close(self):
+        """Release connections."""
+        ...
+
+
+class MemoryBackend:
+    """
+    Per-process buckets in an LRU-ordered dict. Memory is capped at
+    `max_keys` buckets no matter how many distinct IPs show up; an evicted
+    IP simply starts again with a full bucket.
+    """
+
+    def __init__(self, max_keys: int = MEMORY_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def hit(self, key: str, capacity: float, rate: float, ttl: float, now: float) -> bool:
+        bucket = self._buckets.pop(key, None)
+        tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+
+        # Least recently seen first: stop at the first bucket still in use
+        while self._buckets:
+            _, (_, updated_at) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_keys and now - updated_at < ttl:
+                break
+            self._buckets.popitem(last=False)
+
+        return allowed
+
+    async def close(self):
+        pass
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SqliteBackend:
+    """Buckets in a SQLite file shared by all workers on one host."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                allowed INTEGER NOT NULL
+            )
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_rate_limit_updated ON rate_limit (updated_at)"
+        )
+
+    async def hit(self, key: str, capacity: float, rate: float, ttl: float, now: float) -> bool:
+        return await asyncio.to_thread(self._hit, key, capacity, rate, ttl, now)
+
+    def _hit(self, key: str, capacity: float, rate: float, ttl: float, now: float) -> bool:
+        # One atomic upsert: refill, take a token if available, report which
+        refilled = "MIN(:capacity, tokens + (:now - updated_at) * :rate)"
+        with self._lock:
+            (allowed,) = self._db.execute(
+                f"""
+                INSERT INTO rate_limit (key, tokens, updated_at, allowed)
+                VALUES (:key, :capacity - 1, :now, 1)
+                ON CONFLICT (key) DO UPDATE SET
+                    tokens = CASE WHEN {refilled} >= 1 THEN {refilled} - 1 ELSE {refilled} END,
+                    allowed = {refilled} >= 1,
+                    updated_at = :now
+                RETURNING allowed
+                """,
+                {"key": key, "capacity": capacity, "rate": rate, "now": now},
+            ).fetchone()
+
+            self._hits += 1
+            if self._hits % SQLITE_PURGE_EVERY == 0:
+                self._db.execute("DELETE FROM rate_limit WHERE updated_at < ?", (now - ttl,))
+
+        return bool(allowed)
+
+    async def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class RedisBackend:
+    """Buckets in Redis, shared by every worker and host; keys expire when idle."""
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated_at) * rate)
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return allowed
+    """
+
+    def __init__(self, url: str, prefix: str = "contact:ratelimit:"):
+        self.prefix = prefix
+        self._client = aioredis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def hit(self, key: str, capacity: float, rate: float, ttl: float, now: float) -> bool:
+        allowed = await self._script(
+            keys=[self.prefix + key], args=[capacity, rate, now, int(ttl) + 1]
+        )
+        return bool(allowed)
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class RateLimiter:
+    """Allow `limit` hits per key per `window` seconds, refilling continuously."""
+
+    def __init__(self, backend: RateLimitBackend, limit: int, window: float):
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+
+    async def allow(self, key: str) -> bool:
+        """Record a hit. Returns True if the key is within its limit."""
+        return await self.backend.hit(
+            key,
+            capacity=self.limit,
+            rate=self.limit / self.window,
+            ttl=self.window,
+            now=time.time(),
+        )
+
+    async def close(self):
+        await self.backend.close()
+
+
+def create_rate_limiter(url: Optional[str], limit: int, window: float) -> RateLimiter:
+    """
+    Build a limiter from a backend URL: "memory" (default, one process),
+    "sqlite:///path/to/file.db" (workers on one host) or "redis://..." (any).
+    """
+    url = url or "memory"
+    if url.startswith("sqlite:///"):
+        backend: RateLimitBackend = SqliteBackend(url[len("sqlite:///"):])
+    elif url.startswith(("redis://", "rediss://")):
+        if REDIS_AVAILABLE:
+            backend = RedisBackend(url)
+        else:
+            print("Warning: redis not installed, rate limits are per process")
+            backend = MemoryBackend()
+    else:
+        backend = MemoryBackend()
+    return RateLimiter(backend, limit, window)
@@ -0,0 +1,187 @@
+"""
+Spam scoring for the contact API.
+All phrase rules are compiled into one trie-shaped regex, so a message is
+scanned once no matter how many phrases there are. Pattern rules that start
+with a literal word are only run when that word occurs in the message.
+Disposable email domains are a set.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+DEFAULT_DOMAINS_FILE = os.path.join(os.path.dirname(__file__), "disposable_domains.txt")
+
+# Shortest leading literal worth using to prefilter a pattern
+MIN_ANCHOR_LENGTH = 3
+
+_LEADING_LITERAL = re.compile(r"(?:\\b)?([A-Za-z0-9]+)(.?)")
+
+
+@dataclass
+class SpamScore:
+    """Total weight of the rules a message matched, and which ones."""
+
+    score: float = 0.0
+    matches: list[str] = field(default_factory=list)
+
+
+def _phrase_char(ch: str) -> str:
+    """Regex for one phrase character; spaces match any run of whitespace."""
+    return r"\s+" if ch == " " else re.escape(ch)
+
+
+def _trie_regex(phrases: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the phrases, factored by common prefix
+    (e.g. back(?:link(?:s)?|order)) so the engine never backtracks through
+    thousands of alternatives at each position.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [_phrase_char(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _anchor(pattern: str) -> Optional[str]:
+    """Literal text every match of the pattern starts with, if long enough to filter on."""
+    match = _LEADING_LITERAL.match(pattern)
+    if not match or "|" in pattern:
+        # A (possibly top-level) alternation has more than one start
+        return None
+    literal, following = match.groups()
+    if following and following in "?*{":
+        # The last character is optional
+        literal = literal[:-1]
+    return literal.lower() if len(literal) >= MIN_ANCHOR_LENGTH else None
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace, the form phrases are stored in."""
+    return " ".join(text.lower().split())
+
+
+class SpamClassifier:
+    """
+    Scores text against weighted rules.
+
+    Phrases are plain words or word sequences matched case-insensitively on
+    word boundaries. Patterns are regular expressions for anything else,
+    e.g. two words appearing in the same line.
+
+    Patterns are grouped by their leading literal (the anchor). One scan of
+    the message finds which anchors occur, and only the patterns behind them
+    are run; the rest go into a single alternation.
+    """
+
+    def __init__(
+        self,
+        phrases: dict[str, float],
+        patterns: dict[str, float],
+        disposable_domains: Iterable[str] = (),
+        domain_keywords: Iterable[str] = (),
+    ):
+        """
+        Args:
+            phrases: Weight per phrase
+            patterns: Weight per regular expression
+            disposable_domains: Domains whose addresses (and subdomains) are rejected
+            domain_keywords: Substrings that mark a domain as disposable
+        """
+        self.phrase_weights = {_normalize(p): w for p, w in phrases.items() if p.strip()}
+        self._phrases = (
+            re.compile(rf"\b{_trie_regex(self.phrase_weights)}\b", re.IGNORECASE)
+            if self.phrase_weights else None
+        )
+
+        self.pattern_weights = dict(patterns)
+        self._anchored: dict[str, list[tuple[str, re.Pattern]]] = {}
+        unanchored = []
+        for pattern in patterns:
+            anchor = _anchor(pattern)
+            if anchor:
+                self._anchored.setdefault(anchor, []).append(
+                    (pattern, re.compile(pattern, re.IGNORECASE))
+                )
+            else:
+                unanchored.append(pattern)
+
+        # Zero-width, so anchors starting at every position are found
+        self._anchors = (
+            re.compile(f"(?=({_trie_regex(self._anchored)}))", re.IGNORECASE)
+            if self._anchored else None
+        )
+        # One named group per pattern tells which one matched
+        self._unanchored = unanchored
+        self._patterns = (
+            re.compile("|".join(f"(?P<p{i}>{p})" for i, p in enumerate(unanchored)), re.IGNORECASE)
+            if unanchored else None
+        )
+
+        self.disposable_domains = {d.strip().lower() for d in disposable_domains if d.strip()}
+        keywords = [re.escape(k.lower()) for k in domain_keywords]
+        self._domain_keywords = re.compile("|".join(keywords)) if keywords else None
+
+    def score(self, text: str) -> SpamScore:
+        """Sum the weights of the distinct rules the text matches."""
+        matched: dict[str, float] = {}
+
+        if self._phrases:
+            for match in self._phrases.finditer(text):
+                phrase = _normalize(match.group())
+                matched[phrase] = self.phrase_weights[phrase]
+
+        if self._anchors:
+            for anchor in self._anchors_in(text):
+                for pattern, compiled in self._anchored[anchor]:
+                    if pattern not in matched and compiled.search(text):
+                        matched[pattern] = self.pattern_weights[pattern]
+
+        if self._patterns:
+            for match in self._patterns.finditer(text):
+                pattern = self._unanchored[int(match.lastgroup[1:])]
+                matched[pattern] = self.pattern_weights[pattern]
+
+        return SpamScore(score=sum(matched.values()), matches=list(matched))
+
+    def _anchors_in(self, text: str) -> set[str]:
+        """Anchors occurring in the text."""
+        found = set()
+        for match in self._anchors.finditer(text):
+            # The trie matches the longest anchor; shorter ones may end inside it
+            longest = match.group(1).lower()
+            for end in range(MIN_ANCHOR_LENGTH, len(longest) + 1):
+                if longest[:end] in self._anchored:
+                    found.add(longest[:end])
+        return found
+
+    def is_disposable(self, email: str) -> bool:
+        """True if the address is on a disposable domain or any subdomain of one."""
+        domain = email.rsplit("@", 1)[-1].lower()
+        if self._domain_keywords and self._domain_keywords.search(domain):
+            return True
+
+        labels = domain.split(".")
+        return any(".".join(labels[i:]) in self.disposable_domains for i in range(len(labels) - 1))
+
+
+def load_domains(path: Optional[str] = None) -> list[str]:
+    """Read a domain list, one per line; blank lines and # comments are skipped."""
+    path = path or DEFAULT_DOMAINS_FILE
+    if not os.path.exists(path):
+        print(f"Warning: disposable domain list {path} not found")
+        return []
+    with open(path) as f:
+        return [line.split("#", 1)[0].strip() for line in f if line.split("#", 1)[0].strip()]
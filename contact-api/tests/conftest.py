@@ -0,0 +1,25 @@
+"""Shared test fixtures."""
+
+import pytest
+
+import delivery
+import ratelimit
+
+
+class Clock:
+    """Controllable stand-in for time.time()."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time in the delivery and rate limit modules."""
+    clock = Clock()
+    monkeypatch.setattr(delivery.time, "time", clock)
+    monkeypatch.setattr(ratelimit.time, "time", clock)
+    return clock
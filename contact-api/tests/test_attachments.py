@@ -0,0 +1,152 @@
+"""Tests for attachment checks, the request size limits and message writing."""
+
+import asyncio
+import email
+import io
+import os
+from email import policy
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from attachments import AttachmentError, RequestSizeLimit, SpooledAttachment, check_upload, write_message
+
+PDF = b"%PDF-1.7\n" + b"x" * 1000
+ALLOWED = {".pdf", ".txt"}
+
+
+def make_upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(content), size=len(content), filename=filename)
+
+
+class TestCheckUpload:
+    """Test type, content and size checks on uploads."""
+
+    def test_accepts_and_reuses_upload_file(self):
+        """Test an accepted upload is read from the upload's own file, not a copy."""
+        upload = make_upload("docs/report.pdf", PDF)
+
+        attachment = asyncio.run(check_upload(upload, ALLOWED, 1024 * 1024))
+
+        assert attachment.file is upload.file
+        assert attachment.filename == "report.pdf"
+        assert attachment.size == len(PDF)
+        assert attachment.content_type == "application/pdf"
+        assert attachment.file.read() == PDF
+
+    def test_rejects_extension(self):
+        """Test extensions outside the allowed set are rejected."""
+        with pytest.raises(AttachmentError, match="not allowed"):
+            asyncio.run(check_upload(make_upload("run.exe", b"MZ"), ALLOWED, 1024))
+
+    def test_rejects_mismatched_content(self):
+        """Test a file whose magic bytes don't fit its extension is rejected."""
+        with pytest.raises(AttachmentError, match="does not match"):
+            asyncio.run(check_upload(make_upload("report.pdf", b"\x89PNG\r\n\x1a\n"), ALLOWED, 1024))
+        with pytest.raises(AttachmentError, match="does not match"):
+            asyncio.run(check_upload(make_upload("notes.txt", b"a\x00b"), ALLOWED, 1024))
+
+    def test_rejects_oversize(self):
+        """Test files over max_size are rejected, with or without a known size."""
+        with pytest.raises(AttachmentError, match="too large"):
+            asyncio.run(check_upload(make_upload("report.pdf", PDF), ALLOWED, 100))
+
+        unsized = UploadFile(io.BytesIO(PDF), filename="report.pdf")
+        with pytest.raises(AttachmentError, match="too large"):
+            asyncio.run(check_upload(unsized, ALLOWED, 100))
+
+
+class TestRequestSizeLimit:
+    """Test the middleware rejects large bodies and large parts while streaming."""
+
+    @pytest.fixture
+    def received(self):
+        return []
+
+    @pytest.fixture
+    def client(self, received):
+        app = FastAPI()
+        app.add_middleware(RequestSizeLimit, max_size=8 * 1024 * 1024, max_part_size=1024 * 1024)
+
+        @app.post("/upload")
+        async def upload(files: list[UploadFile] = File(...)):
+            received.extend(f.filename for f in files)
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_accepts_parts_under_limit(self, client, received):
+        """Test parts under the per-part limit reach the endpoint."""
+        files = [("files", ("a.pdf", b"a" * 900_000)), ("files", ("b.pdf", b"b" * 900_000))]
+
+        response = client.post("/upload", files=files)
+
+        assert response.status_code == 200
+        assert received == ["a.pdf", "b.pdf"]
+
+    def test_rejects_large_part(self, client, received):
+        """Test a part over the per-part limit is rejected before the endpoint runs."""
+        files = [("files", ("a.pdf", b"a" * 100)), ("files", ("b.pdf", b"b" * 1_100_000))]
+
+        response = client.post("/upload", files=files)
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "File too large (max 1MB)"}
+        assert received == []
+
+    def test_rejects_large_content_length(self, client, received):
+        """Test a declared body over the request limit is rejected up front."""
+        response = client.post("/upload", content=b"x" * (8 * 1024 * 1024 + 1))
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request too large"}
+        assert received == []
+
+
+class TestWriteMessage:
+    """Test streamed MIME message writing."""
+
+    def test_round_trip(self):
+        """Test a written message parses back to the same body and attachment bytes."""
+        payload = os.urandom(200_000)
+        attachment = SpooledAttachment(
+            filename="report.pdf",
+            file=io.BytesIO(payload),
+            size=len(payload),
+            content_type="application/pdf",
+        )
+        attachment.file.read(10)  # Written from the start wherever the file was left
+
+        out = io.BytesIO()
+        write_message(
+            out,
+            {"From": "noreply@example.com", "To": "hire@example.com", "Subject": "Hello – again"},
+            "<p>Hi there</p>",
+            [attachment],
+        )
+        raw = out.getvalue()
+
+        assert all(len(line) <= 998 for line in raw.split(b"\r\n"))
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+
+        message = email.message_from_bytes(raw, policy=policy.default)
+        assert message["Subject"] == "Hello – again"
+        assert message["To"] == "hire@example.com"
+        assert message["Message-ID"]
+        assert message.get_content_type() == "multipart/mixed"
+
+        body, part = list(message.iter_parts())
+        assert body.get_content_type() == "text/html"
+        assert body.get_content().strip() == "<p>Hi there</p>"
+        assert part.get_content_type() == "application/pdf"
+        assert part.get_filename() == "report.pdf"
+        assert part.get_content() == payload
+
+    def test_without_attachments(self):
+        """Test a message with no attachments has just the body part."""
+        out = io.BytesIO()
+        write_message(out, {"Subject": "Hi"}, "<p>Hi</p>", [])
+
+        message = email.message_from_bytes(out.getvalue(), policy=policy.default)
+        assert [p.get_content_type() for p in message.iter_parts()] == ["text/html"]
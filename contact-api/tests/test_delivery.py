@@ -0,0 +1,217 @@
+"""Tests for the mail spool and delivery queue."""
+
+import asyncio
+import email
+import os
+
+import aiosmtplib
+import pytest
+
+import delivery
+from delivery import MAX_ATTEMPTS, MailQueue, MailSpool, SmtpConfig
+
+
+@pytest.fixture
+def spool(tmp_path):
+    """Empty mail spool in a temp directory."""
+    spool = MailSpool(str(tmp_path / "spool"))
+    yield spool
+    spool.close()
+
+
+class TestMailSpool:
+    """Test spooled message state transitions."""
+
+    def test_claim_leases_message(self, spool, clock):
+        """Test a claimed message is hidden until its lease runs out."""
+        mail_id = spool.put("from@example.com", ["to@example.com"], b"Subject: hi\r\n\r\nbody")
+
+        claimed = spool.claim(limit=10, lease=300)
+        assert [mail.id for mail in claimed] == [mail_id]
+        assert claimed[0].recipients == ["to@example.com"]
+        assert spool.read(claimed[0]) == b"Subject: hi\r\n\r\nbody"
+
+        assert spool.claim(limit=10) == []
+
+        # A worker that died mid-send loses its lease
+        clock.now += 301
+        assert [mail.id for mail in spool.claim(limit=10)] == [mail_id]
+
+    def test_claim_limit(self, spool, clock):
+        """Test claims take at most `limit` messages, oldest due first."""
+        ids = []
+        for i in range(3):
+            ids.append(spool.put("from@example.com", ["to@example.com"], b"x"))
+            clock.now += 1
+
+        assert [mail.id for mail in spool.claim(limit=2)] == ids[:2]
+        assert [mail.id for mail in spool.claim(limit=2)] == ids[2:]
+
+    def test_retry_schedules_next_attempt(self, spool, clock):
+        """Test a retried message counts the attempt and waits out its delay."""
+        spool.put("from@example.com", ["to@example.com"], b"x")
+        mail = spool.claim(limit=1)[0]
+
+        spool.retry(mail, "451 try later", delay=60)
+
+        assert spool.next_due() == clock.now + 60
+        clock.now += 59
+        assert spool.claim(limit=1) == []
+        clock.now += 1
+        assert spool.claim(limit=1)[0].attempts == 1
+
+    def test_fail_keeps_file(self, spool, clock):
+        """Test a failed message is never claimed again but stays on disk."""
+        spool.put("from@example.com", ["to@example.com"], b"x")
+        mail = spool.claim(limit=1)[0]
+
+        spool.fail(mail, "550 no such user")
+
+        clock.now += 86400
+        assert spool.claim(limit=1) == []
+        assert spool.next_due() is None
+        assert spool.counts() == {"pending": 0, "failed": 1}
+        assert os.path.exists(spool.path(mail.id))
+
+    def test_delivered_removes_message(self, spool):
+        """Test a delivered message is removed from the index and disk."""
+        spool.put("from@example.com", ["to@example.com"], b"x")
+        mail = spool.claim(limit=1)[0]
+
+        spool.delivered(mail)
+
+        assert spool.counts() == {"pending": 0, "failed": 0}
+        assert not os.path.exists(spool.path(mail.id))
+
+    def test_failed_write_leaves_nothing(self, spool):
+        """Test a writer error leaves no partial file or index entry."""
+        def write(f):
+            f.write(b"partial")
+            raise RuntimeError("writer failed")
+
+        with pytest.raises(RuntimeError):
+            spool.put_stream("from@example.com", ["to@example.com"], write)
+
+        assert spool.counts() == {"pending": 0, "failed": 0}
+        assert os.listdir(os.path.join(spool.directory, "messages")) == []
+
+
+class StubConnection:
+    """SmtpConnection double that fails sends to chosen recipients."""
+
+    attempts: list = []
+    sent: list = []
+    errors: dict = {}
+
+    def __init__(self, config):
+        self.config = config
+
+    async def send(self, sender, recipients, data):
+        self.attempts.append(recipients[0])
+        error = self.errors.get(recipients[0])
+        if error:
+            raise error
+        self.sent.append((sender, recipients, data))
+
+    async def close(self):
+        pass
+
+
+class TestMailQueue:
+    """Test the delivery queue against a stub SMTP connection."""
+
+    @pytest.fixture(autouse=True)
+    def stub_smtp(self, monkeypatch):
+        StubConnection.attempts = []
+        StubConnection.sent = []
+        StubConnection.errors = {}
+        monkeypatch.setattr(delivery, "SmtpConnection", StubConnection)
+        return StubConnection
+
+    def run_queue(self, spool, recipients, done):
+        """Enqueue one message per recipient and run the queue until `done()`."""
+        async def run():
+            queue = MailQueue(
+                SmtpConfig("smtp.example.com", 587, "user", "pass", "from@example.com"),
+                spool,
+            )
+            queue.start()
+            try:
+                for recipient in recipients:
+                    await queue.enqueue(email.message_from_string("Subject: hi\n\nbody"), [recipient])
+                for _ in range(500):
+                    if done():
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await queue.stop()
+
+        asyncio.run(run())
+
+    def test_delivers_and_removes(self, spool, stub_smtp):
+        """Test sent messages leave the spool."""
+        self.run_queue(
+            spool, ["a@example.com", "b@example.com"], lambda: spool.next_due() is None
+        )
+
+        assert sorted(recipients[0] for _, recipients, _ in stub_smtp.sent) == [
+            "a@example.com", "b@example.com",
+        ]
+        assert spool.counts() == {"pending": 0, "failed": 0}
+
+    def test_rejection_fails_permanently(self, spool, stub_smtp):
+        """Test a refused recipient is failed without retrying."""
+        stub_smtp.errors["bad@example.com"] = aiosmtplib.SMTPRecipientsRefused([
+            aiosmtplib.SMTPRecipientRefused(550, "no such user", "bad@example.com")
+        ])
+
+        self.run_queue(spool, ["bad@example.com"], lambda: spool.counts()["failed"] == 1)
+
+        assert spool.counts() == {"pending": 0, "failed": 1}
+
+    def test_transient_error_retried(self, spool, stub_smtp, clock):
+        """Test a transient error leaves the message pending with backoff."""
+        stub_smtp.errors["slow@example.com"] = aiosmtplib.SMTPResponseException(451, "try later")
+
+        # Claimed mail is leased for LEASE_SECONDS; the retry brings it back sooner
+        self.run_queue(
+            spool,
+            ["slow@example.com"],
+            lambda: stub_smtp.attempts and spool.next_due() < clock.now + delivery.LEASE_SECONDS,
+        )
+
+        assert spool.counts() == {"pending": 1, "failed": 0}
+        assert stub_smtp.attempts == ["slow@example.com"]
+        assert (
+            clock.now + delivery.RETRY_BASE * 0.8
+            <= spool.next_due()
+            <= clock.now + delivery.RETRY_BASE * 1.2
+        )
+
+        clock.now = spool.next_due()
+        assert spool.claim(limit=1)[0].attempts == 1
+
+    def test_gives_up_after_max_attempts(self, spool, stub_smtp):
+        """Test the last allowed attempt fails the message."""
+        stub_smtp.errors["slow@example.com"] = aiosmtplib.SMTPResponseException(451, "try later")
+        spool.put("from@example.com", ["slow@example.com"], b"x")
+        mail = spool.claim(limit=1)[0]
+        mail.attempts = MAX_ATTEMPTS - 1
+
+        queue = MailQueue(SmtpConfig("smtp.example.com", 587, "u", "p", "from@example.com"), spool)
+        asyncio.run(queue._deliver(StubConnection(queue.config), mail))
+
+        assert spool.counts() == {"pending": 0, "failed": 1}
+
+    def test_stop_right_after_enqueue(self, spool):
+        """Test stop returns promptly when mail was just enqueued."""
+        async def run():
+            config = SmtpConfig("smtp.example.com", 587, "user", "pass", "from@example.com")
+            for _ in range(20):
+                queue = MailQueue(config, spool)
+                queue.start()
+                await asyncio.sleep(0.01)
+                await queue.enqueue(email.message_from_string("Subject: hi\n\nbody"), ["a@example.com"])
+                await asyncio.wait_for(queue.stop(), timeout=delivery.STOP_TIMEOUT)
+
+        asyncio.run(run())
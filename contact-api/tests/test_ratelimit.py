@@ -0,0 +1,82 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+import ratelimit
+from ratelimit import MemoryBackend, RateLimiter, SqliteBackend
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def rate_backend(request, tmp_path, monkeypatch):
+    """Each rate limit backend; Redis is faked and needs Lua support."""
+    if request.param == "memory":
+        return MemoryBackend()
+    if request.param == "sqlite":
+        return SqliteBackend(str(tmp_path / "ratelimit.db"))
+
+    pytest.importorskip("lupa")
+    import fakeredis.aioredis
+
+    monkeypatch.setattr(
+        ratelimit.aioredis, "from_url", lambda url: fakeredis.aioredis.FakeRedis()
+    )
+    return ratelimit.RedisBackend("redis://localhost")
+
+
+class TestRateLimiter:
+    """Test token-bucket limits on every backend."""
+
+    def test_burst_then_refill(self, rate_backend, clock):
+        """Test `limit` hits pass, the next is refused, and tokens refill over time."""
+        limiter = RateLimiter(rate_backend, limit=3, window=60)
+
+        async def hits(n):
+            return [await limiter.allow("1.2.3.4") for _ in range(n)]
+
+        async def run():
+            try:
+                burst = await hits(4)
+                # One token every 20 seconds
+                clock.now += 20
+                refilled = await hits(2)
+                clock.now += 60
+                full = await hits(4)
+            finally:
+                await limiter.close()
+            return burst, refilled, full
+
+        burst, refilled, full = asyncio.run(run())
+
+        assert burst == [True, True, True, False]
+        assert refilled == [True, False]
+        assert full == [True, True, True, False]
+
+    def test_keys_independent(self, rate_backend, clock):
+        """Test each key has its own bucket."""
+        limiter = RateLimiter(rate_backend, limit=1, window=60)
+
+        async def run():
+            try:
+                return [
+                    await limiter.allow("1.1.1.1"),
+                    await limiter.allow("1.1.1.1"),
+                    await limiter.allow("2.2.2.2"),
+                ]
+            finally:
+                await limiter.close()
+
+        assert asyncio.run(run()) == [True, False, True]
+
+    def test_memory_backend_bounded(self, clock):
+        """Test the in-memory backend evicts the least recently seen keys."""
+        backend = MemoryBackend(max_keys=2)
+        limiter = RateLimiter(backend, limit=1, window=60)
+
+        async def run():
+            for key in ("a", "b", "c"):
+                await limiter.allow(key)
+
+        asyncio.run(run())
+        assert len(backend) == 2
@@ -0,0 +1,89 @@
+"""Tests for spam scoring and disposable email domains."""
+
+import re
+
+import pytest
+
+from main import DISPOSABLE_DOMAIN_KEYWORDS, SPAM_PATTERNS, SPAM_PHRASES, SPAM_THRESHOLD
+from spam import SpamClassifier, load_domains
+
+
+# Rules as they were before the classifier, each matched with re.search
+LEGACY_SPAM_PATTERNS = [
+    r'(?i)\bcrypto\b.*\binvest',
+    r'(?i)\bbitcoin\b.*\bprofit',
+    r'(?i)\bmake\s+\$?\d+.*\bday\b',
+    r'(?i)\bviagra\b',
+    r'(?i)\bcasino\b',
+    r'(?i)\bSEO\s+service',
+    r'(?i)\bbuy\s+followers',
+    r'(?i)\bbacklink',
+    r'(?i)click\s+here.*\bhttp',
+]
+
+SPAM_SAMPLES = [
+    "Hi Jesse, I'd like to talk about a contract role next month.",
+    "Grow your crypto portfolio! Invest today.",
+    "crypto is interesting\nbut I won't invest",
+    "Earn bitcoin PROFITS fast",
+    "Make $500 a day from home",
+    "make 500 dollars every day",
+    "Cheap Viagra here",
+    "viagras",
+    "Best online CASINO",
+    "casinos",
+    "We offer SEO   services for your site",
+    "seo serviceable",
+    "Buy followers now",
+    "buy followership",
+    "Quality backlinks and backlinking",
+    "Click here: https://example.com",
+    "click here to read",
+    "I could help with your investment in crypto",
+]
+
+
+class TestSpamClassifier:
+    """Test spam scoring and disposable domain lookups."""
+
+    @pytest.fixture
+    def classifier(self):
+        return SpamClassifier(
+            SPAM_PHRASES,
+            SPAM_PATTERNS,
+            disposable_domains=["yopmail.com", "guerrillamail.com"],
+            domain_keywords=DISPOSABLE_DOMAIN_KEYWORDS,
+        )
+
+    @pytest.mark.parametrize("text", SPAM_SAMPLES)
+    def test_matches_legacy_rules(self, classifier, text):
+        """Test messages are blocked exactly when a legacy pattern matched."""
+        legacy = any(re.search(pattern, text) for pattern in LEGACY_SPAM_PATTERNS)
+        assert (classifier.score(text).score >= SPAM_THRESHOLD) == legacy
+
+    def test_score_lists_distinct_matches(self, classifier):
+        """Test repeated matches of one rule count once."""
+        result = classifier.score("casino casino, viagra and a CASINO")
+
+        assert result.score == 2.0
+        assert sorted(result.matches) == ["casino", "viagra"]
+
+    def test_disposable_subdomains(self, classifier):
+        """Test listed domains match with any subdomain but not as a suffix of another name."""
+        assert classifier.is_disposable("x@yopmail.com")
+        assert classifier.is_disposable("x@eu.mail.YOPMAIL.com")
+        assert not classifier.is_disposable("x@notyopmail.com")
+        assert not classifier.is_disposable("x@yopmail.com.example.org")
+        assert not classifier.is_disposable("x@gmail.com")
+
+    def test_disposable_keywords(self, classifier):
+        """Test name fragments flag unlisted providers."""
+        assert classifier.is_disposable("x@my-tempmail.net")
+        assert classifier.is_disposable("x@10minutemail.co")
+
+    def test_default_domain_list(self):
+        """Test the bundled domain list loads without comments or blanks."""
+        domains = load_domains()
+
+        assert "10minutemail.com" in domains
+        assert all(d and not d.startswith("#") and d == d.strip() for d in domains)
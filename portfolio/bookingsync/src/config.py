@@ -1,7 +1,7 @@
 """Application configuration"""
 
 from pydantic_settings import BaseSettings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 
 
@@ -55,6 +55,7 @@ class Settings(BaseSettings):
     appointment_buffer_minutes: int = 15
     min_booking_notice_hours: int = 2
     max_booking_days_ahead: int = 30
+    slot_interval_minutes: int = 30
 
     # Reminder settings
     reminder_hours_before: str = "24,2"
@@ -73,7 +74,7 @@ class Settings(BaseSettings):
         return schedule
 
     # Business hours (Mon-Fri, 9 AM - 5 PM by default)
-    business_hours: Dict[str, Dict[str, str]] = {
+    business_hours: Dict[str, Dict[str, Optional[str]]] = {
         'monday': {'start': '09:00', 'end': '17:00'},
         'tuesday': {'start': '09:00', 'end': '17:00'},
         'wednesday': {'start': '09:00', 'end': '17:00'},
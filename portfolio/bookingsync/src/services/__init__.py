@@ -1,5 +1,6 @@
 """Service integrations"""
 
+from .availability import AvailabilityEngine
 from .calendar import CalendarService
 from .booking import BookingService
 from .reminder import ReminderService
@@ -8,6 +9,7 @@ from .email_sender import EmailService
 from .stripe_payments import StripePaymentService
 
 __all__ = [
+    "AvailabilityEngine",
     "CalendarService",
     "BookingService",
     "ReminderService",
@@ -0,0 +1,162 @@
+"""Availability engine: bookable slots from business hours and busy periods"""
+
+from bisect import bisect_left
+from datetime import datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+
+DAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+Interval = Tuple[datetime, datetime]
+
+
+def merge_intervals(periods: List[Dict[str, datetime]]) -> List[Interval]:
+    """Sort busy periods and merge overlapping or touching ones"""
+    merged: List[Interval] = []
+    for start, end in sorted((p['start'], p['end']) for p in periods):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class BusyIndex:
+    """Merged busy intervals of one calendar, answering overlap queries by bisection"""
+
+    def __init__(self, periods: List[Dict[str, datetime]]):
+        intervals = merge_intervals(periods)
+        self.starts = [start for start, _ in intervals]
+        self.ends = [end for _, end in intervals]
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """True if [start, end) overlaps no busy interval"""
+        # Merged intervals are disjoint, so only the last one starting
+        # before `end` can overlap
+        i = bisect_left(self.starts, end) - 1
+        return i < 0 or self.ends[i] <= start
+
+
+class AvailabilityEngine:
+    """
+    Generates bookable slots for one or many calendars (staff, rooms).
+
+    Business hours are parsed once into per-weekday templates of slot
+    offsets. Busy periods are sorted and merged once per calendar, then
+    every candidate slot is checked by bisection, so a query costs
+    O(busy log busy + slots log busy) rather than O(slots x busy).
+    """
+
+    def __init__(
+        self,
+        business_hours: Optional[Dict[str, Dict[str, Optional[str]]]] = None,
+        slot_interval_minutes: Optional[int] = None
+    ):
+        self.slot_interval = timedelta(
+            minutes=slot_interval_minutes or settings.slot_interval_minutes
+        )
+        self._hours: Dict[int, Optional[Tuple[time, time]]] = {}
+        for weekday, day_name in enumerate(DAY_NAMES):
+            hours = (business_hours or settings.business_hours).get(day_name)
+            if hours and hours.get('start') and hours.get('end'):
+                self._hours[weekday] = (
+                    datetime.strptime(hours['start'], '%H:%M').time(),
+                    datetime.strptime(hours['end'], '%H:%M').time(),
+                )
+            else:
+                self._hours[weekday] = None
+        self._templates: Dict[Tuple[int, int], List[Tuple[timedelta, timedelta]]] = {}
+
+    def available_slots(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        busy_periods: List[Dict[str, datetime]]
+    ) -> List[Dict[str, datetime]]:
+        """Slots between start_date and end_date that avoid every busy period"""
+        busy = BusyIndex(busy_periods)
+        return [
+            {'start': start, 'end': end}
+            for start, end in self._candidate_slots(start_date, end_date, duration_minutes)
+            if busy.is_free(start, end)
+        ]
+
+    def available_slots_by_resource(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        busy_by_resource: Dict[str, List[Dict[str, datetime]]]
+    ) -> Dict[str, List[Dict[str, datetime]]]:
+        """Free slots per resource, from one pass over the candidate slots"""
+        indexes = {
+            resource: BusyIndex(periods)
+            for resource, periods in busy_by_resource.items()
+        }
+        slots: Dict[str, List[Dict[str, datetime]]] = {resource: [] for resource in indexes}
+
+        for start, end in self._candidate_slots(start_date, end_date, duration_minutes):
+            for resource, busy in indexes.items():
+                if busy.is_free(start, end):
+                    slots[resource].append({'start': start, 'end': end})
+
+        return slots
+
+    def pooled_slots(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        busy_by_resource: Dict[str, List[Dict[str, datetime]]]
+    ) -> List[Dict]:
+        """Slots at least one resource can take, with the resources free for each"""
+        indexes = {
+            resource: BusyIndex(periods)
+            for resource, periods in busy_by_resource.items()
+        }
+        slots = []
+        for start, end in self._candidate_slots(start_date, end_date, duration_minutes):
+            free = [resource for resource, busy in indexes.items() if busy.is_free(start, end)]
+            if free:
+                slots.append({'start': start, 'end': end, 'resources': free})
+        return slots
+
+    def _candidate_slots(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int
+    ) -> List[Interval]:
+        """Every slot inside business hours, one day at a time from start_date"""
+        candidates = []
+        current = start_date
+        while current < end_date:
+            offsets = self._template(current.weekday(), duration_minutes)
+            if offsets:
+                midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+                candidates.extend(
+                    (midnight + start, midnight + end) for start, end in offsets
+                )
+            current += timedelta(days=1)
+        return candidates
+
+    def _template(self, weekday: int, duration_minutes: int) -> List[Tuple[timedelta, timedelta]]:
+        """Slot (start, end) offsets from midnight for a weekday, cached per duration"""
+        key = (weekday, duration_minutes)
+        if key not in self._templates:
+            offsets = []
+            hours = self._hours[weekday]
+            if hours:
+                day_start = timedelta(hours=hours[0].hour, minutes=hours[0].minute)
+                day_end = timedelta(hours=hours[1].hour, minutes=hours[1].minute)
+                duration = timedelta(minutes=duration_minutes)
+
+                slot = day_start
+                while slot + duration <= day_end:
+                    offsets.append((slot, slot + duration))
+                    slot += self.slot_interval
+            self._templates[key] = offsets
+        return self._templates[key]
@@ -5,6 +5,7 @@ from typing import List, Dict, Optional
 import logging
 
 from ..config import settings
+from .availability import AvailabilityEngine
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ class CalendarService:
     def __init__(self):
         self.demo_mode = settings.demo_mode
         self.calendar_id = settings.google_calendar_id
+        self.availability = AvailabilityEngine()
 
         if not self.demo_mode:
             try:
@@ -41,34 +43,68 @@ class CalendarService:
             return self._get_mock_availability(start_date, end_date, duration_minutes)
 
         try:
-            # Get busy times from calendar
-            body = {
-                'timeMin': start_date.isoformat(),
-                'timeMax': end_date.isoformat(),
-                'items': [{'id': self.calendar_id}]
-            }
-
-            events_result = self.service.freebusy().query(body=body).execute()
-            busy_times = events_result['calendars'][self.calendar_id]['busy']
-
-            # Convert to datetime objects
-            busy_periods = [
-                {
-                    'start': datetime.fromisoformat(period['start'].replace('Z', '+00:00')),
-                    'end': datetime.fromisoformat(period['end'].replace('Z', '+00:00'))
-                }
-                for period in busy_times
-            ]
+            busy_periods = self._get_busy_periods(start_date, end_date, [self.calendar_id])
 
             # Generate available slots
             return self._generate_available_slots(
-                start_date, end_date, duration_minutes, busy_periods
+                start_date, end_date, duration_minutes, busy_periods[self.calendar_id]
             )
 
         except Exception as e:
             logger.error(f"Error fetching availability: {e}")
             return self._get_mock_availability(start_date, end_date, duration_minutes)
 
+    async def get_team_availability(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        calendar_ids: List[str]
+    ) -> Dict[str, List[Dict[str, datetime]]]:
+        """Get available time slots for several staff or resource calendars at once"""
+        if self.demo_mode:
+            return self.availability.available_slots_by_resource(
+                start_date, end_date, duration_minutes,
+                {calendar_id: [] for calendar_id in calendar_ids}
+            )
+
+        try:
+            busy_periods = self._get_busy_periods(start_date, end_date, calendar_ids)
+            return self.availability.available_slots_by_resource(
+                start_date, end_date, duration_minutes, busy_periods
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching team availability: {e}")
+            return {calendar_id: [] for calendar_id in calendar_ids}
+
+    def _get_busy_periods(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_ids: List[str]
+    ) -> Dict[str, List[Dict[str, datetime]]]:
+        """Get busy times for each calendar from one free/busy query"""
+        body = {
+            'timeMin': start_date.isoformat(),
+            'timeMax': end_date.isoformat(),
+            'items': [{'id': calendar_id} for calendar_id in calendar_ids]
+        }
+
+        events_result = self.service.freebusy().query(body=body).execute()
+
+        # Convert to datetime objects
+        return {
+            calendar_id: [
+                {
+                    'start': datetime.fromisoformat(period['start'].replace('Z', '+00:00')),
+                    'end': datetime.fromisoformat(period['end'].replace('Z', '+00:00'))
+                }
+                for period in events_result['calendars'][calendar_id]['busy']
+            ]
+            for calendar_id in calendar_ids
+        }
+
     async def create_event(
         self,
         title: str,
@@ -209,57 +245,9 @@ class CalendarService:
         busy_periods: List[Dict[str, datetime]]
     ) -> List[Dict[str, datetime]]:
         """Generate available slots excluding busy periods"""
-        slots = []
-        current = start_date
-
-        while current < end_date:
-            day_name = current.strftime('%A').lower()
-            business_hours = settings.business_hours.get(day_name)
-
-            if not business_hours or not business_hours['start']:
-                current += timedelta(days=1)
-                continue
-
-            # Parse business hours
-            start_time = datetime.strptime(business_hours['start'], '%H:%M').time()
-            end_time = datetime.strptime(business_hours['end'], '%H:%M').time()
-
-            day_start = current.replace(
-                hour=start_time.hour,
-                minute=start_time.minute,
-                second=0,
-                microsecond=0
-            )
-            day_end = current.replace(
-                hour=end_time.hour,
-                minute=end_time.minute,
-                second=0,
-                microsecond=0
-            )
-
-            # Generate slots for this day
-            slot_time = day_start
-            while slot_time + timedelta(minutes=duration_minutes) <= day_end:
-                slot_end = slot_time + timedelta(minutes=duration_minutes)
-
-                # Check if slot conflicts with busy periods
-                is_available = True
-                for busy in busy_periods:
-                    if (slot_time < busy['end'] and slot_end > busy['start']):
-                        is_available = False
-                        break
-
-                if is_available:
-                    slots.append({
-                        'start': slot_time,
-                        'end': slot_end
-                    })
-
-                slot_time += timedelta(minutes=30)  # 30-minute intervals
-
-            current += timedelta(days=1)
-
-        return slots
+        return self.availability.available_slots(
+            start_date, end_date, duration_minutes, busy_periods
+        )
 
 
 # Singleton instance
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from httpx import AsyncClient
 
 from src.main import app
+from src.services.availability import AvailabilityEngine
 
 
 @pytest.mark.asyncio
@@ -143,3 +144,37 @@ async def test_create_customer():
         assert data["email"] == customer_data["email"]
         assert data["name"] == customer_data["name"]
         assert data["total_bookings"] == 0
+
+
+def test_available_slots_skip_busy_periods():
+    """Test slots overlapping merged busy periods are excluded"""
+    engine = AvailabilityEngine(slot_interval_minutes=30)
+    monday = datetime(2024, 1, 15)
+    busy = [
+        {'start': monday.replace(hour=10), 'end': monday.replace(hour=10, minute=30)},
+        {'start': monday.replace(hour=10, minute=15), 'end': monday.replace(hour=11)},
+    ]
+
+    slots = engine.available_slots(monday, monday + timedelta(days=1), 60, busy)
+    starts = [slot['start'].strftime('%H:%M') for slot in slots]
+
+    assert starts[:3] == ['09:00', '11:00', '11:30']
+    assert starts[-1] == '16:00'
+
+
+def test_team_availability():
+    """Test slots per staff member and pooled across staff"""
+    engine = AvailabilityEngine(slot_interval_minutes=30)
+    saturday = datetime(2024, 1, 13)
+    monday = datetime(2024, 1, 15)
+    busy = {
+        'alex': [{'start': monday.replace(hour=9), 'end': monday.replace(hour=17)}],
+        'sam': [],
+    }
+
+    by_staff = engine.available_slots_by_resource(saturday, saturday + timedelta(days=3), 30, busy)
+    assert by_staff['alex'] == []
+    assert len(by_staff['sam']) == 16
+
+    pooled = engine.pooled_slots(monday, monday + timedelta(days=1), 30, busy)
+    assert all(slot['resources'] == ['sam'] for slot in pooled)
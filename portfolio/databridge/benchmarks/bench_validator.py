@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+DataValidator Benchmark
+
+Compares the vectorized rule engine against the previous per-row
+implementation on a synthetic customer table.
+
+Usage:
+    python -m benchmarks.bench_validator [--rows 1000000]
+"""
+
+import argparse
+import re
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.models.validation import (
+    ValidationIssue,
+    ValidationLevel,
+    ValidationRule,
+    ValidationType,
+)
+from src.services.validator import DataValidator
+
+
+def build_dataframe(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Build a customer table with a few percent of bad cells."""
+    rng = np.random.default_rng(seed)
+
+    emails = np.array([f"user{i}@example.com" for i in range(rows)], dtype=object)
+    emails[rng.random(rows) < 0.02] = "not-an-email"
+
+    ages = rng.integers(10, 90, rows).astype(object)
+    ages[rng.random(rows) < 0.01] = "unknown"
+
+    names = np.array(["Alice", "Bob", "Christopher", "Di", None], dtype=object)
+
+    return pd.DataFrame({
+        "id": rng.integers(0, rows * 50, rows),
+        "email": emails,
+        "age": ages,
+        "name": names[rng.integers(0, len(names), rows)],
+    })
+
+
+def build_rules() -> List[ValidationRule]:
+    """Rules covering every vectorized check."""
+    return [
+        ValidationRule(field="name", rule_type=ValidationType.REQUIRED),
+        ValidationRule(
+            field="age",
+            rule_type=ValidationType.TYPE,
+            params={"expected_type": "int"},
+        ),
+        ValidationRule(
+            field="age",
+            rule_type=ValidationType.RANGE,
+            params={"min": 18, "max": 80},
+        ),
+        ValidationRule(
+            field="email",
+            rule_type=ValidationType.REGEX,
+            params={"pattern": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"},
+        ),
+        ValidationRule(
+            field="name",
+            rule_type=ValidationType.LENGTH,
+            level=ValidationLevel.WARNING,
+            params={"min_length": 3, "max_length": 10},
+        ),
+        ValidationRule(field="id", rule_type=ValidationType.UNIQUE),
+    ]
+
+
+def validate_row_wise(df: pd.DataFrame, rules: List[ValidationRule]) -> List[ValidationIssue]:
+    """Reference per-row implementation the vectorized engine replaced."""
+    issues = []
+
+    def issue(idx, rule, value, message):
+        issues.append(
+            ValidationIssue(
+                record_index=int(idx),
+                field=rule.field,
+                rule=rule,
+                value=value,
+                message=message,
+            )
+        )
+
+    for rule in rules:
+        column = df[rule.field]
+
+        if rule.rule_type == ValidationType.REQUIRED:
+            null_mask = column.isnull()
+            for idx in null_mask[null_mask].index:
+                issue(idx, rule, None, rule.get_message())
+
+        elif rule.rule_type == ValidationType.TYPE:
+            expected_type = rule.params["expected_type"]
+            for idx, value in column.items():
+                if pd.isna(value):
+                    continue
+                if not isinstance(value, int):
+                    issue(idx, rule, value, f"{rule.get_message()}: expected {expected_type}, "
+                                            f"got {type(value).__name__}")
+
+        elif rule.rule_type == ValidationType.RANGE:
+            min_val, max_val = rule.params["min"], rule.params["max"]
+            for idx, value in column.items():
+                if pd.isna(value):
+                    continue
+                try:
+                    numeric_value = float(value)
+                except (ValueError, TypeError):
+                    continue
+                if numeric_value < min_val:
+                    issue(idx, rule, value, f"{rule.get_message()}: {value} < {min_val}")
+                if numeric_value > max_val:
+                    issue(idx, rule, value, f"{rule.get_message()}: {value} > {max_val}")
+
+        elif rule.rule_type == ValidationType.REGEX:
+            regex = re.compile(rule.params["pattern"])
+            for idx, value in column.items():
+                if pd.isna(value):
+                    continue
+                if not regex.match(str(value)):
+                    issue(idx, rule, value, rule.get_message())
+
+        elif rule.rule_type == ValidationType.LENGTH:
+            min_len, max_len = rule.params["min_length"], rule.params["max_length"]
+            for idx, value in column.items():
+                if pd.isna(value):
+                    continue
+                length = len(str(value))
+                if length < min_len or length > max_len:
+                    issue(idx, rule, value, rule.get_message())
+
+        elif rule.rule_type == ValidationType.UNIQUE:
+            for idx, value in column[column.duplicated(keep=False)].items():
+                if pd.isna(value):
+                    continue
+                issue(idx, rule, value, rule.get_message())
+
+    return issues
+
+
+def timed(func, *args):
+    """Run func and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = build_dataframe(args.rows)
+    rules = build_rules()
+    validator = DataValidator()
+
+    legacy_issues, legacy_time = timed(validate_row_wise, df, rules)
+    result, vector_time = timed(validator.validate_dataframe, df, rules)
+    _, materialize_time = timed(lambda: result.issues)
+
+    issue_count = sum(len(failures) for failures in result.failures)
+    assert issue_count == len(legacy_issues), (issue_count, len(legacy_issues))
+
+    print(f"Rows: {args.rows:,}  Rules: {len(rules)}  Issues: {issue_count:,}")
+    print(f"  per-row:              {legacy_time:8.3f}s")
+    print(f"  vectorized:           {vector_time:8.3f}s  ({legacy_time / vector_time:.1f}x)")
+    print(f"  + materialize issues: {materialize_time:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
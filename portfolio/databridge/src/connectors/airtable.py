@@ -1,60 +1,94 @@
 """Airtable connector."""
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
+from urllib.parse import quote
 from .base import BaseConnector
+from .rest import RestClient
 
-try:
-    from pyairtable import Api
-    AIRTABLE_AVAILABLE = True
-except ImportError:
-    AIRTABLE_AVAILABLE = False
+AIRTABLE_API_URL = "https://api.airtable.com"
 
+# Airtable caps list pages at 100 records and writes at 10 records
+PAGE_SIZE = 100
+MAX_BATCH_SIZE = 10
 
-class AirtableConnector(BaseConnector):
-    """Connector for Airtable."""
-
-    def __init__(self, api_key: str, base_id: str, table_name: str):
-        if not AIRTABLE_AVAILABLE:
-            raise ImportError("pyairtable is required for Airtable connector")
 
+class AirtableConnector(BaseConnector):
+    """
+    Connector for Airtable.
+
+    Reads follow the ``offset`` cursor across all pages. Writes send
+    10-record batches concurrently through a rate-limited worker pool
+    (Airtable allows 5 requests/second per base).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        table_name: str,
+        base_url: str = AIRTABLE_API_URL,
+        max_workers: int = 5,
+        requests_per_second: float = 5.0,
+    ):
         self.api_key = api_key
         self.base_id = base_id
         self.table_name = table_name
-        self.api: Optional[Api] = None
-        self.table = None
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.client: Optional[RestClient] = None
+
+    @property
+    def table_path(self) -> str:
+        """API path of the table."""
+        return f"/v0/{self.base_id}/{quote(self.table_name, safe='')}"
 
     def connect(self) -> bool:
         """Initialize Airtable connection."""
         try:
-            self.api = Api(self.api_key)
-            self.table = self.api.table(self.base_id, self.table_name)
+            self.client = RestClient(
+                self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                max_workers=self.max_workers,
+                requests_per_second=self.requests_per_second,
+            )
             return True
         except Exception as e:
             print(f"Failed to connect to Airtable: {e}")
             return False
 
     def disconnect(self) -> bool:
-        """Airtable doesn't need explicit disconnection."""
-        self.api = None
-        self.table = None
+        """Close pooled HTTP connections."""
+        if self.client:
+            self.client.close()
+        self.client = None
         return True
 
     def read_data(self) -> pd.DataFrame:
         """Read data from Airtable table."""
-        if not self.table:
-            self.connect()
-
         try:
-            records = self.table.all()
-            # Extract fields from records
-            data = [record["fields"] for record in records]
-            return pd.DataFrame(data)
+            records = []
+            for page in self._iter_pages():
+                records.extend(page)
+            return pd.DataFrame(records)
         except Exception as e:
             print(f"Failed to read from Airtable: {e}")
             return pd.DataFrame()
 
-    def write_data(self, df: pd.DataFrame, batch_size: int = 10) -> bool:
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Page through the table, yielding chunks of ``chunksize`` records."""
+        pending: List[Dict[str, Any]] = []
+        for page in self._iter_pages():
+            pending.extend(page)
+            while len(pending) >= chunksize:
+                yield pd.DataFrame(pending[:chunksize])
+                pending = pending[chunksize:]
+
+        if pending:
+            yield pd.DataFrame(pending)
+
+    def write_data(self, df: pd.DataFrame, batch_size: int = MAX_BATCH_SIZE) -> bool:
         """
         Write DataFrame to Airtable.
 
@@ -62,23 +96,23 @@ class AirtableConnector(BaseConnector):
             df: DataFrame to write
             batch_size: Number of records per batch (Airtable max is 10)
         """
-        if not self.table:
+        if not self.client:
             self.connect()
 
-        try:
-            # Convert DataFrame to list of dicts
-            records = df.to_dict("records")
-
-            # Write in batches (Airtable max batch size is 10)
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                # Remove None values
-                batch = [
-                    {k: v for k, v in record.items() if pd.notna(v)}
-                    for record in batch
-                ]
-                self.table.batch_create(batch)
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
 
+        try:
+            # Remove None values
+            records = [
+                {"fields": {k: v for k, v in record.items() if pd.notna(v)}}
+                for record in df.to_dict("records")
+            ]
+            batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+
+            self.client.map(
+                lambda batch: self.client.post(self.table_path, {"records": batch}),
+                batches,
+            )
             return True
         except Exception as e:
             print(f"Failed to write to Airtable: {e}")
@@ -86,12 +120,13 @@ class AirtableConnector(BaseConnector):
 
     def get_schema(self) -> List[str]:
         """Get list of fields in table."""
-        if not self.table:
+        if not self.client:
             self.connect()
 
         try:
             # Get first record to determine schema
-            records = self.table.all(max_records=1)
+            response = self.client.get(self.table_path, params={"maxRecords": 1})
+            records = response.get("records", [])
             if records:
                 return list(records[0]["fields"].keys())
             return []
@@ -104,15 +139,31 @@ class AirtableConnector(BaseConnector):
         try:
             if self.connect():
                 # Try to get first record
-                records = self.table.all(max_records=1)
+                response = self.client.get(self.table_path, params={"maxRecords": 1})
                 return {
                     "success": True,
                     "base_id": self.base_id,
                     "table_name": self.table_name,
-                    "has_records": len(records) > 0,
+                    "has_records": len(response.get("records", [])) > 0,
                 }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
             }
+
+    def _iter_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Follow the offset cursor, yielding record fields per page."""
+        if not self.client:
+            self.connect()
+
+        params: Dict[str, Any] = {"pageSize": PAGE_SIZE}
+
+        while True:
+            response = self.client.get(self.table_path, params=params)
+            yield [record["fields"] for record in response.get("records", [])]
+
+            offset = response.get("offset")
+            if not offset:
+                break
+            params["offset"] = offset
@@ -1,7 +1,7 @@
 """Base connector interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import pandas as pd
 
 
@@ -28,6 +28,28 @@ class BaseConnector(ABC):
         """Write DataFrame to target."""
         pass
 
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield source data in DataFrames of at most ``chunksize`` rows.
+
+        The default implementation slices ``read_data()``; connectors that
+        can page through their source should override it so that only one
+        chunk is held in memory at a time.
+        """
+        df = self.read_data()
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    def append_data(self, df: pd.DataFrame) -> bool:
+        """
+        Append DataFrame to target after an initial ``write_data`` call.
+
+        Most targets are append-only already, so this defaults to
+        ``write_data``. File based connectors override it to avoid
+        overwriting what was written by previous chunks.
+        """
+        return self.write_data(df)
+
     @abstractmethod
     def get_schema(self) -> List[str]:
         """Get list of available fields."""
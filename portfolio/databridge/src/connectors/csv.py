@@ -1,17 +1,65 @@
 """CSV file connector."""
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from pathlib import Path
 from .base import BaseConnector
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Bytes parsed per block by the pyarrow streaming reader
+PYARROW_BLOCK_SIZE = 64 << 20
+
+
+def _arrow_type(dtype: Any) -> "pa.DataType":
+    """Arrow type to parse a column as so it casts cleanly to a pandas dtype."""
+    try:
+        pandas_dtype = pd.api.types.pandas_dtype(dtype)
+        # Nullable extension dtypes (Int64, boolean) carry their numpy type
+        numpy_dtype = getattr(pandas_dtype, "numpy_dtype", pandas_dtype)
+        if numpy_dtype.kind != "O":
+            return pa.from_numpy_dtype(numpy_dtype)
+    except (TypeError, AttributeError, NotImplementedError, pa.ArrowNotImplementedError):
+        pass
+    # category, string, object and anything Arrow can't parse directly
+    return pa.string()
+
 
 class CSVConnector(BaseConnector):
-    """Connector for CSV files."""
+    """
+    Connector for CSV files.
+
+    ``dtype`` takes explicit column types, e.g. from
+    ``DataProfiler.suggest_read_dtypes``, so large files are read with
+    categoricals and nullable integers instead of inferred object columns.
+    ``engine="pyarrow"`` parses with multithreaded pyarrow; ``memory_map``
+    maps the file for the default C engine. When streaming with pyarrow,
+    columns without a ``dtype`` entry are read as strings, so a value
+    seen only in a later block can't break the types inferred from the
+    first one; pass a type for every column to get typed chunks.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        encoding: str = "utf-8",
+        dtype: Optional[Dict[str, Any]] = None,
+        engine: Optional[str] = None,
+        memory_map: bool = False,
+    ):
+        if engine == "pyarrow" and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for the pyarrow CSV engine")
 
-    def __init__(self, file_path: str, encoding: str = "utf-8"):
         self.file_path = Path(file_path)
         self.encoding = encoding
+        self.dtype = dtype
+        self.engine = engine
+        self.memory_map = memory_map
         self.df: Optional[pd.DataFrame] = None
 
     def connect(self) -> bool:
@@ -25,9 +73,20 @@ class CSVConnector(BaseConnector):
 
     def read_data(self) -> pd.DataFrame:
         """Read CSV file into DataFrame."""
-        self.df = pd.read_csv(self.file_path, encoding=self.encoding)
+        self.df = pd.read_csv(self.file_path, **self._read_options())
         return self.df
 
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Stream CSV file in chunks of ``chunksize`` rows."""
+        if self.engine == "pyarrow":
+            yield from self._iter_pyarrow_chunks(chunksize)
+            return
+
+        with pd.read_csv(
+            self.file_path, chunksize=chunksize, **self._read_options()
+        ) as reader:
+            yield from reader
+
     def write_data(self, df: pd.DataFrame, output_path: Optional[str] = None) -> bool:
         """Write DataFrame to CSV file."""
         try:
@@ -38,11 +97,27 @@ class CSVConnector(BaseConnector):
             print(f"Failed to write CSV: {e}")
             return False
 
+    def append_data(self, df: pd.DataFrame, output_path: Optional[str] = None) -> bool:
+        """Append DataFrame rows to an existing CSV file without a header."""
+        try:
+            target_path = Path(output_path) if output_path else self.file_path
+            df.to_csv(
+                target_path,
+                mode="a",
+                header=not target_path.exists(),
+                index=False,
+                encoding=self.encoding,
+            )
+            return True
+        except Exception as e:
+            print(f"Failed to append CSV: {e}")
+            return False
+
     def get_schema(self) -> List[str]:
-        """Get list of columns."""
-        if self.df is None:
-            self.read_data()
-        return list(self.df.columns) if self.df is not None else []
+        """Get list of columns from the header row only."""
+        if self.df is not None:
+            return list(self.df.columns)
+        return list(pd.read_csv(self.file_path, nrows=0, encoding=self.encoding).columns)
 
     def test_connection(self) -> Dict[str, Any]:
         """Test if file exists and is readable."""
@@ -66,3 +141,56 @@ class CSVConnector(BaseConnector):
                 "success": False,
                 "error": str(e),
             }
+
+    def _read_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by pandas reads."""
+        options: Dict[str, Any] = {"encoding": self.encoding}
+        if self.dtype:
+            options["dtype"] = self.dtype
+        if self.engine:
+            options["engine"] = self.engine
+        if self.memory_map and self.engine != "pyarrow":
+            options["memory_map"] = True
+        return options
+
+    def _iter_pyarrow_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Stream record batches with pyarrow and regroup them into chunks."""
+        # Types are fixed up front: inferred types come from the first block
+        # only, and inferring "zip" as an integer would drop leading zeros
+        dtype = self.dtype or {}
+        column_types = {
+            col: _arrow_type(dtype[col]) if col in dtype else pa.string()
+            for col in self.get_schema()
+        }
+        reader = pacsv.open_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(
+                encoding=self.encoding, block_size=PYARROW_BLOCK_SIZE
+            ),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            ),
+        )
+
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+
+            while pending_rows >= chunksize:
+                table = pa.Table.from_batches(pending)
+                yield self._apply_dtype(table.slice(0, chunksize).to_pandas())
+
+                rest = table.slice(chunksize)
+                pending = rest.to_batches()
+                pending_rows = rest.num_rows
+
+        if pending_rows:
+            yield self._apply_dtype(pa.Table.from_batches(pending).to_pandas())
+
+    def _apply_dtype(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast columns to the configured dtypes."""
+        if not self.dtype:
+            return df
+        return df.astype({col: t for col, t in self.dtype.items() if col in df.columns})
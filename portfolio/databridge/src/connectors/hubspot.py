@@ -1,99 +1,149 @@
 """HubSpot CRM connector."""
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from .base import BaseConnector
+from .rest import RestClient
 
-try:
-    from hubspot import HubSpot
-    from hubspot.crm.contacts import SimplePublicObjectInput
-    HUBSPOT_AVAILABLE = True
-except ImportError:
-    HUBSPOT_AVAILABLE = False
+HUBSPOT_API_URL = "https://api.hubapi.com"
 
+# HubSpot caps list pages and batch inputs at 100 objects
+PAGE_SIZE = 100
+MAX_BATCH_SIZE = 100
 
-class HubSpotConnector(BaseConnector):
-    """Connector for HubSpot CRM."""
-
-    def __init__(self, api_key: str):
-        if not HUBSPOT_AVAILABLE:
-            raise ImportError("hubspot-api-client is required for HubSpot connector")
 
+class HubSpotConnector(BaseConnector):
+    """
+    Connector for HubSpot CRM.
+
+    Reads follow the v3 objects API cursor until every page is fetched.
+    Writes go through the batch create/upsert endpoints, sent concurrently
+    by a rate-limited worker pool (HubSpot allows about 10 requests/second
+    for private apps).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = HUBSPOT_API_URL,
+        max_workers: int = 8,
+        requests_per_second: float = 10.0,
+    ):
         self.api_key = api_key
-        self.client: Optional[HubSpot] = None
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.client: Optional[RestClient] = None
 
     def connect(self) -> bool:
         """Initialize HubSpot client."""
         try:
-            self.client = HubSpot(access_token=self.api_key)
+            self.client = RestClient(
+                self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                max_workers=self.max_workers,
+                requests_per_second=self.requests_per_second,
+            )
             return True
         except Exception as e:
             print(f"Failed to initialize HubSpot client: {e}")
             return False
 
     def disconnect(self) -> bool:
-        """HubSpot API doesn't need explicit disconnection."""
+        """Close pooled HTTP connections."""
+        if self.client:
+            self.client.close()
         self.client = None
         return True
 
-    def read_data(self, object_type: str = "contacts", limit: int = 100) -> pd.DataFrame:
+    def read_data(
+        self,
+        object_type: str = "contacts",
+        limit: Optional[int] = None,
+        properties: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
         """
         Read data from HubSpot.
 
         Args:
             object_type: Type of object to read (contacts, companies, deals, etc.)
-            limit: Maximum number of records to retrieve
+            limit: Maximum number of records to retrieve; all when omitted
+            properties: Properties to request; HubSpot defaults when omitted
         """
-        if not self.client:
-            self.connect()
-
-        # This is a simplified implementation
-        # In production, you'd implement pagination and handle different object types
-
         try:
-            if object_type == "contacts":
-                response = self.client.crm.contacts.basic_api.get_page(limit=limit)
-                contacts = []
-                for contact in response.results:
-                    contacts.append(contact.properties)
-                return pd.DataFrame(contacts)
-            else:
-                raise ValueError(f"Unsupported object type: {object_type}")
+            records = []
+            for page in self._iter_pages(object_type, properties):
+                records.extend(page)
+                if limit is not None and len(records) >= limit:
+                    records = records[:limit]
+                    break
+            return pd.DataFrame(records)
         except Exception as e:
             print(f"Failed to read from HubSpot: {e}")
             return pd.DataFrame()
 
-    def write_data(self, df: pd.DataFrame, object_type: str = "contacts", batch_size: int = 100) -> bool:
+    def iter_chunks(
+        self,
+        chunksize: int,
+        object_type: str = "contacts",
+        properties: Optional[List[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Page through HubSpot objects, yielding chunks of ``chunksize`` records."""
+        pending: List[Dict[str, Any]] = []
+        for page in self._iter_pages(object_type, properties):
+            pending.extend(page)
+            while len(pending) >= chunksize:
+                yield pd.DataFrame(pending[:chunksize])
+                pending = pending[chunksize:]
+
+        if pending:
+            yield pd.DataFrame(pending)
+
+    def write_data(
+        self,
+        df: pd.DataFrame,
+        object_type: str = "contacts",
+        batch_size: int = MAX_BATCH_SIZE,
+        id_property: Optional[str] = None,
+    ) -> bool:
         """
         Write DataFrame to HubSpot.
 
         Args:
             df: DataFrame to write
             object_type: Type of object to create
-            batch_size: Number of records to write per batch
+            batch_size: Number of records per batch request (max 100)
+            id_property: Unique property (e.g. ``email``) to upsert on
+                instead of creating new objects
         """
         if not self.client:
             self.connect()
 
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
+
         try:
-            if object_type == "contacts":
-                # Write in batches
-                for i in range(0, len(df), batch_size):
-                    batch = df.iloc[i:i + batch_size]
-
-                    for _, row in batch.iterrows():
-                        properties = row.to_dict()
-                        # Remove None values
-                        properties = {k: str(v) for k, v in properties.items() if pd.notna(v)}
-
-                        contact_input = SimplePublicObjectInput(properties=properties)
-                        self.client.crm.contacts.basic_api.create(
-                            simple_public_object_input=contact_input
-                        )
-
-                return True
-            else:
-                raise ValueError(f"Unsupported object type: {object_type}")
+            inputs = []
+            for record in df.to_dict("records"):
+                # Remove None values
+                properties = {k: str(v) for k, v in record.items() if pd.notna(v)}
+                item: Dict[str, Any] = {"properties": properties}
+                if id_property:
+                    item["idProperty"] = id_property
+                    item["id"] = properties.get(id_property)
+                inputs.append(item)
+
+            action = "upsert" if id_property else "create"
+            path = f"/crm/v3/objects/{object_type}/batch/{action}"
+            batches = [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
+
+            # Upserts are safe to repeat after a 5xx; creates are not
+            self.client.map(
+                lambda batch: self.client.post(
+                    path, {"inputs": batch}, idempotent=id_property is not None
+                ),
+                batches,
+            )
+            return True
         except Exception as e:
             print(f"Failed to write to HubSpot: {e}")
             return False
@@ -104,13 +154,8 @@ class HubSpotConnector(BaseConnector):
             self.connect()
 
         try:
-            if object_type == "contacts":
-                properties = self.client.crm.properties.core_api.get_all(
-                    object_type="contacts"
-                )
-                return [prop.name for prop in properties.results]
-            else:
-                raise ValueError(f"Unsupported object type: {object_type}")
+            response = self.client.get(f"/crm/v3/properties/{object_type}")
+            return [prop["name"] for prop in response.get("results", [])]
         except Exception as e:
             print(f"Failed to get schema from HubSpot: {e}")
             return []
@@ -119,14 +164,37 @@ class HubSpotConnector(BaseConnector):
         """Test connection to HubSpot."""
         try:
             if self.connect():
-                # Try to get account info
-                account_info = self.client.settings.users.users_api.get_page()
+                response = self.client.get(
+                    "/crm/v3/objects/contacts", params={"limit": 1}
+                )
                 return {
                     "success": True,
-                    "user_count": len(account_info.results),
+                    "has_records": len(response.get("results", [])) > 0,
                 }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
             }
+
+    def _iter_pages(
+        self,
+        object_type: str,
+        properties: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Follow the paging cursor, yielding record properties per page."""
+        if not self.client:
+            self.connect()
+
+        params: Dict[str, Any] = {"limit": PAGE_SIZE}
+        if properties:
+            params["properties"] = ",".join(properties)
+
+        while True:
+            response = self.client.get(f"/crm/v3/objects/{object_type}", params=params)
+            yield [result["properties"] for result in response.get("results", [])]
+
+            after = response.get("paging", {}).get("next", {}).get("after")
+            if not after:
+                break
+            params["after"] = after
@@ -0,0 +1,153 @@
+"""Rate-limited REST client shared by the SaaS connectors."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Rate limited: the server rejected the request without applying it
+RATE_LIMIT_STATUS_CODES = {429}
+
+# Transient server errors: the request may or may not have been applied
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+
+# Methods safe to repeat after a transient error
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RestClient:
+    """
+    JSON REST client with a bounded worker pool.
+
+    Requests are spaced to stay under ``requests_per_second`` across all
+    workers. 429 responses are retried with exponential backoff, honouring
+    ``Retry-After``, and also pause every other worker so the pool backs off
+    as a whole. Transient 5xx responses are retried only for idempotent
+    requests: a create that fails with a 5xx may already have been applied,
+    and repeating it would duplicate the records.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_workers: int = 8,
+        requests_per_second: float = 10.0,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        # Keep-alive pool sized for the workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.headers.update(headers or {})
+
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send GET request and return decoded JSON."""
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, body: Any, idempotent: bool = False) -> Dict[str, Any]:
+        """
+        Send POST request with JSON body and return decoded JSON.
+
+        Pass ``idempotent=True`` for POSTs that are safe to repeat (searches,
+        upserts) so they are retried on transient 5xx responses too.
+        """
+        return self.request("POST", path, body=body, idempotent=idempotent)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        idempotent: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send request, retrying rate-limited and transient failures.
+
+        Args:
+            idempotent: Whether the request is safe to repeat after a 5xx
+                (defaults to whether ``method`` is idempotent)
+
+        Raises:
+            requests.HTTPError: If the request still fails after retries
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        data = json.dumps(body, default=str) if body is not None else None
+
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_status_codes = RATE_LIMIT_STATUS_CODES | (
+            TRANSIENT_STATUS_CODES if idempotent else set()
+        )
+
+        for attempt in range(self.max_retries + 1):
+            self._throttle()
+            response = self.session.request(
+                method, url, params=params, data=data, timeout=self.timeout
+            )
+
+            if response.status_code not in retry_status_codes or attempt == self.max_retries:
+                break
+
+            delay = self._retry_delay(response, attempt)
+            if response.status_code in RATE_LIMIT_STATUS_CODES:
+                self._pause(delay)
+            time.sleep(delay)
+
+        response.raise_for_status()
+        return response.json() if response.content else {}
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Run ``func`` over items on the worker pool, preserving order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def _throttle(self):
+        """Wait for the next request slot under the rate limit."""
+        interval = 1.0 / self.requests_per_second if self.requests_per_second else 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _pause(self, delay: float):
+        """Hold back all workers after a rate-limit response."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + delay)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff_factor * (2 ** attempt)
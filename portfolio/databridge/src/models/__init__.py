@@ -2,7 +2,7 @@
 
 from .migration import Migration, MigrationStatus, MigrationStep
 from .mapping import FieldMapping, MappingRule, TransformationType
-from .validation import ValidationRule, ValidationResult, ValidationLevel
+from .validation import ValidationRule, ValidationResult, ValidationLevel, RuleFailures
 
 __all__ = [
     "Migration",
@@ -14,4 +14,5 @@ __all__ = [
     "ValidationRule",
     "ValidationResult",
     "ValidationLevel",
+    "RuleFailures",
 ]
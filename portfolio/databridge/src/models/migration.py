@@ -83,3 +83,7 @@ class DataProfile(BaseModel):
     unique_counts: Dict[str, int]
     sample_values: Dict[str, List[Any]]
     field_statistics: Dict[str, Dict[str, Any]]
+
+    # Set by streaming profiles, whose counts and quantiles are estimates
+    approximate: bool = False
+    error_bounds: Dict[str, Dict[str, float]] = Field(default_factory=dict)
@@ -1,8 +1,9 @@
 """Validation models."""
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from typing import Dict, Iterator, List, Optional, Any
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 
 class ValidationLevel(str, Enum):
@@ -48,6 +49,37 @@ class ValidationRule(BaseModel):
         }
         return messages.get(self.rule_type, f"Validation failed for '{self.field}'")
 
+    def describe_failure(self, value: Any = None) -> str:
+        """Get validation message with details about a failing value."""
+        message = self.get_message()
+
+        if self.rule_type == ValidationType.TYPE:
+            expected_type = self.params.get("expected_type")
+            return f"{message}: expected {expected_type}, got {type(value).__name__}"
+
+        if self.rule_type == ValidationType.RANGE:
+            min_val = self.params.get("min")
+            max_val = self.params.get("max")
+            if min_val is not None and float(value) < min_val:
+                return f"{message}: {value} < {min_val}"
+            return f"{message}: {value} > {max_val}"
+
+        if self.rule_type == ValidationType.REGEX:
+            pattern = self.params.get("pattern")
+            return f"{message}: '{value}' does not match pattern '{pattern}'"
+
+        if self.rule_type == ValidationType.LENGTH:
+            length = len(str(value))
+            min_len = self.params.get("min_length")
+            if min_len is not None and length < min_len:
+                return f"{message}: length {length} < {min_len}"
+            return f"{message}: length {length} > {self.params.get('max_length')}"
+
+        if self.rule_type == ValidationType.UNIQUE:
+            return f"{message}: duplicate value '{value}'"
+
+        return message
+
 
 class ValidationIssue(BaseModel):
     """Single validation issue."""
@@ -58,17 +90,77 @@ class ValidationIssue(BaseModel):
     message: str
 
 
+class RuleFailures(BaseModel):
+    """Failing records of one rule, stored column-wise."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    rule_id: int  # Position of the rule in ValidationResult.rules
+    record_indices: np.ndarray
+    values: Optional[np.ndarray] = None  # None when the failing value is null
+    # Row positions in the validated frame; index labels may repeat
+    record_positions: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.record_indices)
+
+
 class ValidationResult(BaseModel):
-    """Validation results."""
+    """
+    Validation results.
+
+    Failures are kept as compact ``RuleFailures`` columns; ``ValidationIssue``
+    objects are only built when ``issues``/``errors``/``warnings``/``info``
+    are read.
+    """
     total_records: int
     valid_records: int
     invalid_records: int
-    issues: List[ValidationIssue] = Field(default_factory=list)
+    rules: List[ValidationRule] = Field(default_factory=list)
+    failures: List[RuleFailures] = Field(default_factory=list, exclude=True)
+
+    _extra_issues: List[ValidationIssue] = PrivateAttr(default_factory=list)
+    _issues: Optional[List[ValidationIssue]] = PrivateAttr(default=None)
 
-    # Group issues by level
-    errors: List[ValidationIssue] = Field(default_factory=list)
-    warnings: List[ValidationIssue] = Field(default_factory=list)
-    info: List[ValidationIssue] = Field(default_factory=list)
+    @computed_field
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        """All issues, materialized on first access."""
+        if self._issues is None:
+            self._issues = list(self.iter_issues())
+        return self._issues
+
+    @computed_field
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        """Error-level issues."""
+        return self._issues_at(ValidationLevel.ERROR)
+
+    @computed_field
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        """Warning-level issues."""
+        return self._issues_at(ValidationLevel.WARNING)
+
+    @computed_field
+    @property
+    def info(self) -> List[ValidationIssue]:
+        """Info-level issues."""
+        return self._issues_at(ValidationLevel.INFO)
+
+    @property
+    def error_count(self) -> int:
+        """Number of error-level issues, without materializing them."""
+        return self._count_at(ValidationLevel.ERROR)
+
+    @property
+    def warning_count(self) -> int:
+        """Number of warning-level issues, without materializing them."""
+        return self._count_at(ValidationLevel.WARNING)
+
+    @property
+    def info_count(self) -> int:
+        """Number of info-level issues, without materializing them."""
+        return self._count_at(ValidationLevel.INFO)
 
     @property
     def success_rate(self) -> float:
@@ -80,15 +172,49 @@ class ValidationResult(BaseModel):
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return self.error_count > 0
 
     def add_issue(self, issue: ValidationIssue):
         """Add validation issue."""
-        self.issues.append(issue)
-
-        if issue.rule.level == ValidationLevel.ERROR:
-            self.errors.append(issue)
-        elif issue.rule.level == ValidationLevel.WARNING:
-            self.warnings.append(issue)
-        else:
-            self.info.append(issue)
+        self._extra_issues.append(issue)
+        self._issues = None
+
+    def add_failures(self, failures: RuleFailures):
+        """Add column-wise failures for one rule."""
+        self.failures.append(failures)
+        self._issues = None
+
+    def iter_issues(self) -> Iterator[ValidationIssue]:
+        """Build ValidationIssue objects one at a time."""
+        yield from self._extra_issues
+
+        for failures in self.failures:
+            rule = self.rules[failures.rule_id]
+            indices = failures.record_indices.tolist()
+            values = (
+                failures.values.tolist()
+                if failures.values is not None
+                else [None] * len(indices)
+            )
+            for record_index, value in zip(indices, values):
+                yield ValidationIssue(
+                    record_index=int(record_index),
+                    field=rule.field,
+                    rule=rule,
+                    value=value,
+                    message=rule.describe_failure(value),
+                )
+
+    def _issues_at(self, level: ValidationLevel) -> List[ValidationIssue]:
+        """Materialized issues of a given level."""
+        return [issue for issue in self.issues if issue.rule.level == level]
+
+    def _count_at(self, level: ValidationLevel) -> int:
+        """Count issues of a given level from the columnar failures."""
+        count = sum(1 for issue in self._extra_issues if issue.rule.level == level)
+        count += sum(
+            len(failures)
+            for failures in self.failures
+            if self.rules[failures.rule_id].level == level
+        )
+        return count
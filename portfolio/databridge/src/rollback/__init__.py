@@ -1,5 +1,6 @@
 """Rollback management."""
 
 from .manager import RollbackManager
+from .catalog import BackupCatalog
 
-__all__ = ["RollbackManager"]
+__all__ = ["RollbackManager", "BackupCatalog"]
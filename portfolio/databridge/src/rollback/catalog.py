@@ -0,0 +1,127 @@
+"""Persistent SQLite index of backups."""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Iterator
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    backup_id TEXT PRIMARY KEY,
+    migration_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT '',
+    record_count INTEGER NOT NULL DEFAULT 0,
+    parent_backup_id TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_backups_migration
+    ON backups (migration_id, timestamp DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_backups_timestamp
+    ON backups (timestamp);
+CREATE INDEX IF NOT EXISTS idx_backups_parent
+    ON backups (parent_backup_id);
+"""
+
+# Newest first, matching the order list_backups has always returned
+NEWEST_FIRST = "ORDER BY timestamp DESC, created_at DESC"
+
+
+class BackupCatalog:
+    """Index of backup metadata, kept next to the backups it describes."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+
+    def exists(self) -> bool:
+        """Check whether the catalog database has been created."""
+        return self.db_path.exists()
+
+    def add(self, metadata: Dict[str, Any]):
+        """Insert or replace a backup entry."""
+        with self._connect() as conn:
+            self._insert(conn, [metadata])
+
+    def remove(self, backup_id: str):
+        """Remove a backup entry."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM backups WHERE backup_id = ?", (backup_id,))
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]):
+        """Replace all entries, e.g. after scanning the backup directory."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM backups")
+            self._insert(conn, entries)
+
+    def get(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        """Get metadata for one backup."""
+        rows = self._query("WHERE backup_id = ?", (backup_id,))
+        return rows[0] if rows else None
+
+    def list(self, migration_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List backups, newest first, optionally for one migration."""
+        if migration_id:
+            return self._query(f"WHERE migration_id = ? {NEWEST_FIRST}", (migration_id,))
+        return self._query(NEWEST_FIRST)
+
+    def latest(self, migration_id: str) -> Optional[Dict[str, Any]]:
+        """Get the newest backup of a migration."""
+        rows = self._query(
+            f"WHERE migration_id = ? {NEWEST_FIRST} LIMIT 1", (migration_id,)
+        )
+        return rows[0] if rows else None
+
+    def older_than(self, timestamp: str) -> List[Dict[str, Any]]:
+        """List backups taken before ``timestamp`` (``%Y%m%d_%H%M%S``), newest first."""
+        return self._query(f"WHERE timestamp < ? {NEWEST_FIRST}", (timestamp,))
+
+    def has_dependents(self, backup_id: str) -> bool:
+        """Check whether an incremental backup builds on this one."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM backups WHERE parent_backup_id = ? LIMIT 1",
+                (backup_id,),
+            ).fetchone()
+        return row is not None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open catalog connection for one transaction, creating the schema if needed."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executescript(SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _insert(self, conn: sqlite3.Connection, entries: Iterable[Dict[str, Any]]):
+        """Insert entries using an open connection."""
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO backups
+                (backup_id, migration_id, timestamp, created_at,
+                 record_count, parent_backup_id, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    meta["backup_id"],
+                    meta.get("migration_id", ""),
+                    meta.get("timestamp", ""),
+                    meta.get("created_at", ""),
+                    meta.get("record_count", 0),
+                    meta.get("parent_backup_id"),
+                    json.dumps(meta, default=str),
+                )
+                for meta in entries
+            ],
+        )
+
+    def _query(self, clause: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Select metadata of matching backups."""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT metadata FROM backups {clause}", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
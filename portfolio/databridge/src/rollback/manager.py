@@ -5,21 +5,69 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import numpy as np
 import pandas as pd
 
+from ..services.profiler import DataProfiler
+from .catalog import BackupCatalog
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Backup formats and the file extension each one writes
+BACKUP_FORMATS = {
+    "csv": "csv",
+    "parquet": "parquet",
+    "arrow": "arrow",  # Arrow IPC file, memory-mapped on restore
+}
+
 
 class RollbackManager:
-    """Manage migration rollback capabilities."""
+    """
+    Manage migration rollback capabilities.
+
+    Backups are written as compressed Parquet or Arrow IPC files when
+    pyarrow is installed (CSV otherwise). Incremental backups store only
+    the rows that changed since the previous backup of the same migration
+    and are restored by replaying the chain on top of its full snapshot.
+
+    Backup metadata is indexed in a SQLite catalog inside ``backup_dir``,
+    updated on create and delete and rebuilt from the backup directories
+    whenever it is missing.
+    """
+
+    def __init__(
+        self,
+        backup_dir: str = "./backups",
+        backup_format: Optional[str] = None,
+        compression: Optional[str] = "zstd",
+    ):
+        if backup_format is None:
+            backup_format = "arrow" if PYARROW_AVAILABLE else "csv"
+
+        if backup_format not in BACKUP_FORMATS:
+            raise ValueError(f"Unsupported backup format: {backup_format}")
+
+        if backup_format != "csv" and not PYARROW_AVAILABLE:
+            raise ImportError(f"pyarrow is required for {backup_format} backups")
 
-    def __init__(self, backup_dir: str = "./backups"):
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(exist_ok=True)
+        self.backup_format = backup_format
+        self.compression = compression
+        self._catalog = BackupCatalog(self.backup_dir / "catalog.db")
 
     def create_backup(
         self,
         migration_id: str,
         data: pd.DataFrame,
         metadata: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+        key_field: Optional[str] = None,
     ) -> str:
         """
         Create backup before migration.
@@ -28,19 +76,73 @@ class RollbackManager:
             migration_id: Migration identifier
             data: DataFrame to backup
             metadata: Additional metadata to store
+            incremental: Only store rows changed since the previous backup
+                of this migration
+            key_field: Primary key used to match rows between backups;
+                detected with DataProfiler when omitted
 
         Returns:
             Backup ID
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        now = datetime.utcnow()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         backup_id = f"{migration_id}_{timestamp}"
 
+        # Several backups within the same second get a counter suffix
+        suffix = 1
+        while (self.backup_dir / backup_id).exists():
+            suffix += 1
+            backup_id = f"{migration_id}_{timestamp}_{suffix}"
+
+        parent = None
+        if incremental:
+            parent = self.catalog.latest(migration_id)
+            if key_field is None:
+                key_field = parent.get("key_field") if parent else None
+            if key_field is None:
+                key_field = self._find_key_field(data)
+
+        if key_field is not None and (
+            key_field not in data.columns or data[key_field].duplicated().any()
+        ):
+            key_field = None
+
+        if parent is not None and (
+            key_field is None
+            or parent.get("key_field") != key_field
+            or parent.get("columns") != list(data.columns)
+        ):
+            parent = None
+
         backup_path = self.backup_dir / backup_id
         backup_path.mkdir(exist_ok=True)
 
+        # Save row hashes so the next incremental backup can diff against them
+        stored = data
+        deleted_keys = None
+        if key_field is not None:
+            hashes = pd.DataFrame({
+                key_field: data[key_field].to_numpy(),
+                # Stored as int64 so the hashes survive a CSV round trip
+                "row_hash": pd.util.hash_pandas_object(data, index=False)
+                .to_numpy()
+                .view(np.int64),
+            })
+            self._write_frame(hashes, backup_path / f"hashes.{self._extension}")
+
+            if parent is not None:
+                parent_hashes = self._read_frame(
+                    self.backup_dir / parent["backup_id"] / parent["hashes_file"],
+                    parent["format"],
+                )
+                changed, deleted = self._diff(hashes, parent_hashes, key_field)
+                stored = data[changed]
+                deleted_keys = parent_hashes.loc[deleted, [key_field]]
+                self._write_frame(deleted_keys, backup_path / f"deleted.{self._extension}")
+
         # Save data
-        data_file = backup_path / "data.csv"
-        data.to_csv(data_file, index=False)
+        data_file = f"data.{self._extension}"
+        self._write_frame(stored, backup_path / data_file)
 
         # Save metadata
         meta = metadata or {}
@@ -48,25 +150,42 @@ class RollbackManager:
             "migration_id": migration_id,
             "backup_id": backup_id,
             "timestamp": timestamp,
+            "created_at": now.isoformat(),
             "record_count": len(data),
             "columns": list(data.columns),
+            "format": self.backup_format,
+            "compression": self.compression if self.backup_format != "csv" else None,
+            "data_file": data_file,
+            "kind": "incremental" if parent is not None else "full",
+            "parent_backup_id": parent["backup_id"] if parent is not None else None,
+            "key_field": key_field,
+            "hashes_file": f"hashes.{self._extension}" if key_field is not None else None,
+            "deleted_file": f"deleted.{self._extension}" if deleted_keys is not None else None,
+            "stored_records": len(stored),
+            "deleted_records": len(deleted_keys) if deleted_keys is not None else 0,
         })
 
         meta_file = backup_path / "metadata.json"
         with open(meta_file, "w") as f:
-            json.dump(meta, f, indent=2)
+            json.dump(meta, f, indent=2, default=str)
+
+        self.catalog.add(meta)
 
         return backup_id
 
-    def list_backups(self, migration_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """
-        List available backups.
+    @property
+    def catalog(self) -> BackupCatalog:
+        """Backup catalog, rebuilt from disk if it has gone missing."""
+        if not self._catalog.exists():
+            self.rebuild_catalog()
+        return self._catalog
 
-        Args:
-            migration_id: Optional filter by migration ID
+    def rebuild_catalog(self) -> int:
+        """
+        Rebuild the catalog by scanning backup directories.
 
         Returns:
-            List of backup metadata
+            Number of backups indexed
         """
         backups = []
 
@@ -74,39 +193,58 @@ class RollbackManager:
             if not backup_path.is_dir():
                 continue
 
-            if migration_id and not backup_path.name.startswith(migration_id):
-                continue
-
             meta_file = backup_path / "metadata.json"
             if meta_file.exists():
                 with open(meta_file, "r") as f:
-                    metadata = json.load(f)
-                    backups.append(metadata)
+                    backups.append(json.load(f))
+
+        self._catalog.rebuild(backups)
+        return len(backups)
+
+    def list_backups(self, migration_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List available backups.
+
+        Args:
+            migration_id: Optional filter by migration ID
 
-        # Sort by timestamp, newest first
-        backups.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return backups
+        Returns:
+            List of backup metadata
+        """
+        return self.catalog.list(migration_id)
 
     def restore_backup(self, backup_id: str) -> pd.DataFrame:
         """
         Restore data from backup.
 
+        Incremental backups are rebuilt from their full snapshot by applying
+        each backup in the chain in order.
+
         Args:
             backup_id: Backup identifier
 
         Returns:
             Restored DataFrame
         """
-        backup_path = self.backup_dir / backup_id
+        chain = [self._read_metadata(backup_id)]
+        while chain[-1].get("parent_backup_id"):
+            chain.append(self._read_metadata(chain[-1]["parent_backup_id"]))
+        chain.reverse()
 
-        if not backup_path.exists():
-            raise ValueError(f"Backup not found: {backup_id}")
+        state = self._read_backup_file(chain[0], "data_file")
 
-        data_file = backup_path / "data.csv"
-        if not data_file.exists():
-            raise ValueError(f"Backup data file not found: {backup_id}")
+        for meta in chain[1:]:
+            key_field = meta["key_field"]
+            changed = self._read_backup_file(meta, "data_file")
+
+            replaced = state[key_field].isin(changed[key_field])
+            if meta.get("deleted_records"):
+                deleted = self._read_backup_file(meta, "deleted_file")
+                replaced |= state[key_field].isin(deleted[key_field])
 
-        return pd.read_csv(data_file)
+            state = pd.concat([state[~replaced], changed], ignore_index=True)
+
+        return state
 
     def delete_backup(self, backup_id: str) -> bool:
         """
@@ -124,6 +262,7 @@ class RollbackManager:
             return False
 
         shutil.rmtree(backup_path)
+        self.catalog.remove(backup_id)
         return True
 
     def rollback_migration(
@@ -142,12 +281,11 @@ class RollbackManager:
             Rollback result
         """
         # Find latest backup for migration
-        backups = self.list_backups(migration_id)
+        latest_backup = self.catalog.latest(migration_id)
 
-        if not backups:
+        if not latest_backup:
             raise ValueError(f"No backups found for migration: {migration_id}")
 
-        latest_backup = backups[0]
         backup_id = latest_backup["backup_id"]
 
         # Restore data
@@ -167,6 +305,8 @@ class RollbackManager:
         """
         Clean up backups older than specified days.
 
+        Backups that a newer incremental backup still builds on are kept.
+
         Args:
             days: Number of days to keep
 
@@ -178,13 +318,121 @@ class RollbackManager:
         cutoff = datetime.utcnow() - timedelta(days=days)
         deleted = 0
 
-        for backup in self.list_backups():
-            backup_time = datetime.strptime(
-                backup["timestamp"], "%Y%m%d_%H%M%S"
-            )
+        # Newest first, so dependents are deleted before their parents
+        for backup in self.catalog.older_than(cutoff.strftime("%Y%m%d_%H%M%S")):
+            if self.catalog.has_dependents(backup["backup_id"]):
+                continue
 
-            if backup_time < cutoff:
-                self.delete_backup(backup["backup_id"])
-                deleted += 1
+            self.delete_backup(backup["backup_id"])
+            deleted += 1
 
         return deleted
+
+    @property
+    def _extension(self) -> str:
+        """File extension for the configured backup format."""
+        return BACKUP_FORMATS[self.backup_format]
+
+    def _find_key_field(self, data: pd.DataFrame) -> Optional[str]:
+        """Pick a primary key for incremental backups."""
+        profiler = DataProfiler()
+        keys = profiler.identify_potential_keys(profiler.profile_dataframe(data))
+        return keys[0] if keys else None
+
+    def _diff(
+        self,
+        hashes: pd.DataFrame,
+        parent_hashes: pd.DataFrame,
+        key_field: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compare row hashes against the parent backup.
+
+        Returns:
+            Mask of new or changed current rows, and mask of parent rows
+            whose key no longer exists
+        """
+        parent_keys = pd.Index(parent_hashes[key_field])
+        positions = parent_keys.get_indexer(hashes[key_field])
+        parent_row_hash = parent_hashes["row_hash"].to_numpy(dtype=np.int64)
+
+        missing = positions == -1
+        previous = parent_row_hash[np.where(missing, 0, positions)]
+        changed = missing | (previous != hashes["row_hash"].to_numpy(dtype=np.int64))
+
+        deleted = ~parent_keys.isin(hashes[key_field])
+        return changed, deleted
+
+    def _read_metadata(self, backup_id: str) -> Dict[str, Any]:
+        """Read metadata of one backup."""
+        meta = self.catalog.get(backup_id)
+        if meta is not None:
+            return meta
+
+        backup_path = self.backup_dir / backup_id
+
+        if not backup_path.exists():
+            raise ValueError(f"Backup not found: {backup_id}")
+
+        meta_file = backup_path / "metadata.json"
+        if not meta_file.exists():
+            # Backups written before metadata tracked the format
+            return {"backup_id": backup_id, "format": "csv", "data_file": "data.csv"}
+
+        with open(meta_file, "r") as f:
+            return json.load(f)
+
+    def _read_backup_file(self, meta: Dict[str, Any], file_key: str) -> pd.DataFrame:
+        """Read one of a backup's data files."""
+        backup_format = meta.get("format", "csv")
+        file_name = meta.get(file_key, "data.csv")
+
+        data_file = self.backup_dir / meta["backup_id"] / file_name
+        if not data_file.exists():
+            raise ValueError(f"Backup data file not found: {meta['backup_id']}")
+
+        return self._read_frame(data_file, backup_format)
+
+    def _write_frame(self, df: pd.DataFrame, path: Path):
+        """Write DataFrame in the configured backup format."""
+        if self.backup_format == "csv":
+            df.to_csv(path, index=False)
+            return
+
+        table = self._to_arrow_table(df)
+
+        if self.backup_format == "parquet":
+            pq.write_table(table, path, compression=self.compression)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.OSFile(str(path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                    writer.write_table(table)
+
+    def _read_frame(self, path: Path, backup_format: str) -> pd.DataFrame:
+        """Read DataFrame written in the given backup format."""
+        if backup_format == "csv":
+            return pd.read_csv(path)
+
+        if not PYARROW_AVAILABLE:
+            raise ImportError(f"pyarrow is required to restore {backup_format} backups")
+
+        if backup_format == "parquet":
+            return pq.read_table(path, memory_map=True).to_pandas()
+
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    def _to_arrow_table(self, df: pd.DataFrame) -> "pa.Table":
+        """Convert DataFrame to Arrow, storing mixed-type columns as strings."""
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df = df.copy()
+            for col in df.columns:
+                if df[col].dtype == object:
+                    try:
+                        pa.array(df[col], from_pandas=True)
+                    except (pa.ArrowInvalid, pa.ArrowTypeError):
+                        df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+            return pa.Table.from_pandas(df, preserve_index=False)
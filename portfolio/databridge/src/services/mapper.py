@@ -1,14 +1,209 @@
 """Field mapping service."""
 
+import heapq
 import re
+from collections import defaultdict
 from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
 from ..models.mapping import FieldMapping, MappingRule, TransformationType
 
+# Target indexes kept per FieldMapper
+MAX_CACHED_INDEXES = 16
+
+# Best-scoring targets considered per source field
+MAX_CANDIDATES = 5
+
+# Targets compared with SequenceMatcher per source field, picked by shared
+# trigrams, and the trigram postings scanned to pick them
+MAX_FUZZY_CANDIDATES = 20
+MAX_SCANNED_POSTINGS = 500
+
+# Larger groups of competing fields are assigned greedily instead of optimally
+MAX_OPTIMAL_GROUP = 200
+
+# Match scores: any fuzzy match beats any semantic match
+FUZZY_SCORE = 1.0
+SEMANTIC_SCORE = 0.5
+
+# Common field name mappings: source pattern -> target name fragments
+SEMANTIC_PATTERNS: List[Tuple["re.Pattern[str]", List[str]]] = [
+    (re.compile(pattern), candidates)
+    for pattern, candidates in [
+        # ID fields
+        (r".*id$", ["id", "identifier", "key"]),
+        (r"^id", ["id", "identifier", "key"]),
+
+        # Name fields
+        (r".*name", ["name", "title", "label"]),
+        (r"first.*name", ["first_name", "firstname", "fname"]),
+        (r"last.*name", ["last_name", "lastname", "lname"]),
+
+        # Email/Phone
+        (r".*email", ["email", "email_address", "mail"]),
+        (r".*phone", ["phone", "telephone", "phone_number"]),
+
+        # Address fields
+        (r".*address", ["address", "street", "location"]),
+        (r".*city", ["city", "town"]),
+        (r".*state", ["state", "province", "region"]),
+        (r".*zip", ["zip", "zipcode", "postal_code", "postcode"]),
+
+        # Date fields
+        (r".*date", ["date", "timestamp", "created_at", "updated_at"]),
+        (r"created.*", ["created_at", "creation_date", "date_created"]),
+        (r"updated.*", ["updated_at", "modification_date", "date_modified"]),
+    ]
+]
+
+_PREFIX_PATTERN = re.compile(r"^(tbl|fld|col)_?", re.IGNORECASE)
+_SUFFIX_PATTERN = re.compile(r"_?(id|name|value)$", re.IGNORECASE)
+_SEPARATOR_PATTERN = re.compile(r"[_\-\.]")
+
+
+def normalize_field_name(field: str) -> str:
+    """Normalize field name for comparison."""
+    # Remove common prefixes/suffixes
+    normalized = _PREFIX_PATTERN.sub("", field)
+    normalized = _SUFFIX_PATTERN.sub("", normalized)
+
+    # Replace separators with spaces
+    normalized = _SEPARATOR_PATTERN.sub(" ", normalized)
+
+    # Remove extra whitespace
+    normalized = " ".join(normalized.split())
+
+    return normalized.lower()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Space-padded character trigrams of a normalized name."""
+    padded = f" {text} "
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TargetIndex:
+    """
+    Precomputed lookup structures over a list of target fields.
+
+    Holds exact-match keys, normalized names with a trigram inverted index
+    that narrows fuzzy matching to the targets sharing the most trigrams,
+    and the targets each semantic fragment occurs in, so matching a source
+    field only touches likely targets.
+    """
+
+    def __init__(self, target_fields: List[str], case_sensitive: bool = False):
+        self.target_fields = list(target_fields)
+        self.case_sensitive = case_sensitive
+
+        self.exact: Dict[str, int] = {}
+        for position, target in enumerate(self.target_fields):
+            self.exact.setdefault(self._exact_key(target), position)
+
+        self.normalized = [normalize_field_name(target) for target in self.target_fields]
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self.normalized):
+            for gram in trigrams(name):
+                self.postings[gram].append(position)
+
+        # SequenceMatcher caches its analysis of the second sequence, so one
+        # matcher per target is reused for every source
+        self.matchers = [SequenceMatcher(None, "", name) for name in self.normalized]
+
+        lowered = [target.lower() for target in self.target_fields]
+        fragments = {fragment for _, candidates in SEMANTIC_PATTERNS for fragment in candidates}
+        self.containing: Dict[str, List[int]] = {
+            fragment: [position for position, name in enumerate(lowered) if fragment in name]
+            for fragment in fragments
+        }
+
+    def exact_match(self, source: str) -> Optional[int]:
+        """Position of the target equal to ``source``."""
+        return self.exact.get(self._exact_key(source))
+
+    def fuzzy_matches(self, source: str, threshold: float) -> Dict[int, float]:
+        """Similarity of targets scoring at least ``threshold`` against ``source``."""
+        source_normalized = normalize_field_name(source)
+        source_length = len(source_normalized)
+
+        scores: Dict[int, float] = {}
+        for position in self._candidates(source_normalized):
+            target_length = len(self.normalized[position])
+            total = source_length + target_length
+            # ratio() can be at most 2 * min(len) / total
+            if total and 2.0 * min(source_length, target_length) / total < threshold:
+                continue
+
+            matcher = self.matchers[position]
+            matcher.set_seq1(source_normalized)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+
+            score = matcher.ratio()
+            if score >= threshold:
+                scores[position] = score
+                # Candidates come best-overlap first; enough good ones is enough
+                if len(scores) >= MAX_CANDIDATES:
+                    break
+
+        return scores
+
+    def _candidates(self, normalized: str) -> List[int]:
+        """
+        Targets sharing the most trigrams with a normalized source name.
+
+        Rare trigrams are scanned first and common ones only while the
+        posting budget lasts, so a prefix shared by every field (say
+        ``custom field``) does not turn each lookup into a full scan.
+        """
+        grams = sorted(
+            (self.postings[gram] for gram in trigrams(normalized) if gram in self.postings),
+            key=len,
+        )
+
+        shared: Dict[int, int] = defaultdict(int)
+        scanned = 0
+        for posting in grams:
+            if shared and scanned + len(posting) > MAX_SCANNED_POSTINGS:
+                break
+            scanned += len(posting)
+            for position in posting:
+                shared[position] += 1
+
+        return heapq.nsmallest(
+            MAX_FUZZY_CANDIDATES, shared, key=lambda position: (-shared[position], position)
+        )
+
+    def semantic_matches(self, source: str) -> List[int]:
+        """Targets suggested by semantic patterns, best first."""
+        source_lower = source.lower()
+        matches: List[int] = []
+        seen: Set[int] = set()
+
+        for pattern, candidates in SEMANTIC_PATTERNS:
+            if pattern.match(source_lower):
+                for candidate in candidates:
+                    for position in self.containing[candidate]:
+                        if position not in seen:
+                            seen.add(position)
+                            matches.append(position)
+
+        return matches
+
+    def _exact_key(self, field: str) -> str:
+        return field if self.case_sensitive else field.lower()
+
 
 class FieldMapper:
     """Intelligent field mapping between source and target schemas."""
 
+    def __init__(self):
+        self._indexes: Dict[Tuple[Tuple[str, ...], bool], TargetIndex] = {}
+
     def auto_map_fields(
         self,
         source_fields: List[str],
@@ -19,6 +214,11 @@ class FieldMapper:
         """
         Automatically map fields using various strategies.
 
+        Each source field is scored against its likely targets (exact, then
+        fuzzy, then semantic matches). Exact matches are taken first; the
+        remaining fields are paired one-to-one so that the total match score
+        is as high as possible, rather than first come, first served.
+
         Args:
             source_fields: List of source field names
             target_fields: List of target field names
@@ -28,39 +228,43 @@ class FieldMapper:
         Returns:
             FieldMapping with auto-generated mappings
         """
-        mappings: List[MappingRule] = []
-        mapped_targets = set()
-
-        for source_field in source_fields:
-            # Try exact match first
-            target = self._find_exact_match(
-                source_field, target_fields, case_sensitive
+        index = self.build_index(target_fields, case_sensitive)
+        assignment: Dict[int, int] = {}
+        mapped_targets: Set[int] = set()
+
+        # Exact matches are never traded away for better fuzzy totals
+        for source_position, source_field in enumerate(source_fields):
+            target_position = index.exact_match(source_field)
+            if target_position is not None and target_position not in mapped_targets:
+                assignment[source_position] = target_position
+                mapped_targets.add(target_position)
+
+        edges: Dict[int, Dict[int, float]] = {}
+        for source_position, source_field in enumerate(source_fields):
+            if source_position in assignment:
+                continue
+            scores = self._score_candidates(index, source_field, fuzzy_threshold)
+            scores = {t: s for t, s in scores.items() if t not in mapped_targets}
+            if scores:
+                best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+                edges[source_position] = dict(best[:MAX_CANDIDATES])
+
+        assignment.update(self._assign(edges))
+
+        mappings = [
+            MappingRule(
+                source_field=source_fields[source_position],
+                target_field=index.target_fields[assignment[source_position]],
+                transformation=TransformationType.DIRECT,
             )
-
-            # Try fuzzy match if no exact match
-            if not target:
-                target = self._find_fuzzy_match(
-                    source_field, target_fields, fuzzy_threshold
-                )
-
-            # Try semantic match (common patterns)
-            if not target:
-                target = self._find_semantic_match(source_field, target_fields)
-
-            if target and target not in mapped_targets:
-                mappings.append(
-                    MappingRule(
-                        source_field=source_field,
-                        target_field=target,
-                        transformation=TransformationType.DIRECT,
-                    )
-                )
-                mapped_targets.add(target)
+            for source_position in sorted(assignment)
+        ]
 
         # Identify unmapped fields
         mapped_sources = {m.source_field for m in mappings}
+        mapped_target_names = {m.target_field for m in mappings}
         unmapped_source = [f for f in source_fields if f not in mapped_sources]
-        unmapped_target = [f for f in target_fields if f not in mapped_targets]
+        unmapped_target = [f for f in target_fields if f not in mapped_target_names]
 
         return FieldMapping(
             migration_id="",  # Will be set by orchestrator
@@ -74,95 +278,180 @@ class FieldMapper:
             fuzzy_match_threshold=fuzzy_threshold,
         )
 
-    def _find_exact_match(
-        self, source: str, targets: List[str], case_sensitive: bool
-    ) -> Optional[str]:
-        """Find exact match in target fields."""
-        source_cmp = source if case_sensitive else source.lower()
-
-        for target in targets:
-            target_cmp = target if case_sensitive else target.lower()
-            if source_cmp == target_cmp:
-                return target
-
-        return None
-
-    def _find_fuzzy_match(
-        self, source: str, targets: List[str], threshold: float
-    ) -> Optional[str]:
-        """Find fuzzy match using string similarity."""
-        best_match = None
-        best_score = 0.0
-
-        source_normalized = self._normalize_field_name(source)
-
-        for target in targets:
-            target_normalized = self._normalize_field_name(target)
-
-            # Calculate similarity
-            score = SequenceMatcher(
-                None, source_normalized, target_normalized
-            ).ratio()
-
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = target
-
-        return best_match
-
-    def _find_semantic_match(
-        self, source: str, targets: List[str]
-    ) -> Optional[str]:
-        """Find semantic match using common field name patterns."""
-        # Common field name mappings
-        semantic_patterns = {
-            # ID fields
-            r".*id$": ["id", "identifier", "key"],
-            r"^id": ["id", "identifier", "key"],
-
-            # Name fields
-            r".*name": ["name", "title", "label"],
-            r"first.*name": ["first_name", "firstname", "fname"],
-            r"last.*name": ["last_name", "lastname", "lname"],
-
-            # Email/Phone
-            r".*email": ["email", "email_address", "mail"],
-            r".*phone": ["phone", "telephone", "phone_number"],
-
-            # Address fields
-            r".*address": ["address", "street", "location"],
-            r".*city": ["city", "town"],
-            r".*state": ["state", "province", "region"],
-            r".*zip": ["zip", "zipcode", "postal_code", "postcode"],
-
-            # Date fields
-            r".*date": ["date", "timestamp", "created_at", "updated_at"],
-            r"created.*": ["created_at", "creation_date", "date_created"],
-            r"updated.*": ["updated_at", "modification_date", "date_modified"],
-        }
+    def build_index(self, target_fields: List[str], case_sensitive: bool = False) -> TargetIndex:
+        """
+        Get the index over ``target_fields``, building it on first use.
 
-        source_lower = source.lower()
+        Args:
+            target_fields: List of target field names
+            case_sensitive: Whether exact matches are case-sensitive
 
-        for pattern, candidates in semantic_patterns.items():
-            if re.match(pattern, source_lower):
-                for candidate in candidates:
-                    # Check if any target field contains this candidate
-                    for target in targets:
-                        if candidate in target.lower():
-                            return target
+        Returns:
+            Cached TargetIndex
+        """
+        key = (tuple(target_fields), case_sensitive)
+
+        index = self._indexes.get(key)
+        if index is None:
+            index = TargetIndex(target_fields, case_sensitive)
+            if len(self._indexes) >= MAX_CACHED_INDEXES:
+                self._indexes.pop(next(iter(self._indexes)))
+            self._indexes[key] = index
+
+        return index
+
+    def _score_candidates(
+        self, index: TargetIndex, source: str, threshold: float
+    ) -> Dict[int, float]:
+        """Score the targets a non-exact source field could map to."""
+        scores = {
+            position: FUZZY_SCORE + score
+            for position, score in index.fuzzy_matches(source, threshold).items()
+        }
 
-        return None
+        # Earlier semantic suggestions score higher, all below any fuzzy match
+        for rank, position in enumerate(index.semantic_matches(source)):
+            scores.setdefault(position, SEMANTIC_SCORE / (rank + 1))
 
-    def _normalize_field_name(self, field: str) -> str:
-        """Normalize field name for comparison."""
-        # Remove common prefixes/suffixes
-        normalized = re.sub(r"^(tbl|fld|col)_?", "", field, flags=re.IGNORECASE)
-        normalized = re.sub(r"_?(id|name|value)$", "", normalized, flags=re.IGNORECASE)
+        return scores
 
-        # Replace separators with spaces
-        normalized = re.sub(r"[_\-\.]", " ", normalized)
+    def _assign(self, edges: Dict[int, Dict[int, float]]) -> Dict[int, int]:
+        """
+        Pair sources with targets one-to-one, maximizing the total score.
 
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
+        Sources only compete with sources sharing candidate targets, so each
+        connected group is solved on its own.
+        """
+        assignment: Dict[int, int] = {}
+
+        for sources, targets in self._connected_groups(edges):
+            if len(sources) == 1:
+                source = sources[0]
+                scores = edges[source]
+                assignment[source] = max(scores, key=lambda t: (scores[t], -t))
+            elif len(sources) <= MAX_OPTIMAL_GROUP and len(targets) <= MAX_OPTIMAL_GROUP:
+                assignment.update(self._assign_optimal(edges, sources, targets))
+            else:
+                assignment.update(self._assign_greedy(edges, sources))
+
+        return assignment
+
+    def _connected_groups(
+        self, edges: Dict[int, Dict[int, float]]
+    ) -> List[Tuple[List[int], List[int]]]:
+        """Split candidate pairs into groups of sources competing for targets."""
+        parent: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for source, scores in edges.items():
+            for target in scores:
+                parent[find(("s", source))] = find(("t", target))
+
+        groups: Dict[Tuple[str, int], Tuple[List[int], List[int]]] = {}
+        for source, scores in edges.items():
+            sources, _ = groups.setdefault(find(("s", source)), ([], []))
+            sources.append(source)
+        for target in {t for scores in edges.values() for t in scores}:
+            groups[find(("t", target))][1].append(target)
+
+        return [(sorted(sources), sorted(targets)) for sources, targets in groups.values()]
+
+    def _assign_optimal(
+        self,
+        edges: Dict[int, Dict[int, float]],
+        sources: List[int],
+        targets: List[int],
+    ) -> Dict[int, int]:
+        """Maximum-score assignment of one group (Hungarian algorithm)."""
+        column = {target: position for position, target in enumerate(targets)}
+        cost = np.zeros((len(sources), len(targets)))
+        for row, source in enumerate(sources):
+            for target, score in edges[source].items():
+                cost[row, column[target]] = -score
+
+        transposed = len(sources) > len(targets)
+        pairs = _hungarian(cost.T if transposed else cost)
+        if transposed:
+            pairs = [(row, col) for col, row in pairs]
+
+        # Pairs without a candidate edge only fill out the square problem
+        return {
+            sources[row]: targets[col]
+            for row, col in pairs
+            if targets[col] in edges[sources[row]]
+        }
+
+    def _assign_greedy(
+        self, edges: Dict[int, Dict[int, float]], sources: List[int]
+    ) -> Dict[int, int]:
+        """Assign the highest-scoring pairs first."""
+        pairs = sorted(
+            ((score, source, target) for source in sources for target, score in edges[source].items()),
+            key=lambda pair: (-pair[0], pair[1], pair[2]),
+        )
 
-        return normalized.lower()
+        assignment: Dict[int, int] = {}
+        taken: Set[int] = set()
+        for _, source, target in pairs:
+            if source not in assignment and target not in taken:
+                assignment[source] = target
+                taken.add(target)
+
+        return assignment
+
+
+def _hungarian(cost: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Minimum-cost assignment of every row of ``cost`` to a distinct column.
+
+    Shortest augmenting path form of the Hungarian algorithm, O(n^2 m),
+    with the inner loop over columns vectorized. Requires rows <= columns.
+    """
+    rows, cols = cost.shape
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    # match[j] is the 1-based row assigned to 1-based column j; 0 is free
+    match = np.zeros(cols + 1, dtype=np.int64)
+    way = np.zeros(cols + 1, dtype=np.int64)
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        current = 0
+        min_slack = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+
+        while True:
+            used[current] = True
+            row_used = match[current]
+            slack = cost[row_used - 1] - u[row_used] - v[1:]
+
+            free = ~used[1:]
+            improved = free & (slack < min_slack[1:])
+            min_slack[1:][improved] = slack[improved]
+            way[1:][improved] = current
+
+            candidates = np.where(free, min_slack[1:], np.inf)
+            nearest = int(np.argmin(candidates)) + 1
+            delta = candidates[nearest - 1]
+
+            u[match[used]] += delta
+            v[used] -= delta
+            min_slack[~used] -= delta
+
+            current = nearest
+            if match[current] == 0:
+                break
+
+        # Flip the augmenting path
+        while current:
+            previous = way[current]
+            match[current] = match[previous]
+            current = previous
+
+    return [(int(match[col]) - 1, col - 1) for col in range(1, cols + 1) if match[col]]
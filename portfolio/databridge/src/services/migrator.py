@@ -1,11 +1,13 @@
 """Migration orchestration service."""
 
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 import pandas as pd
 
-from ..models.migration import Migration, MigrationStatus, MigrationStep
+from ..connectors.base import BaseConnector
+from ..models.migration import Migration, MigrationStatus, MigrationStep, DataProfile
 from ..models.mapping import FieldMapping
 from ..models.validation import ValidationRule
 from .profiler import DataProfiler
@@ -13,16 +15,57 @@ from .mapper import FieldMapper
 from .validator import DataValidator
 from .transformer import DataTransformer
 
+# Rows pulled from the source per chunk in streaming mode
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Smallest row partition worth shipping to a worker process
+MIN_PARTITION_ROWS = 50_000
+
 
 class MigrationOrchestrator:
-    """Orchestrate the entire migration process."""
+    """
+    Orchestrate the entire migration process.
 
-    def __init__(self):
+    With ``max_workers`` > 1 the validate and transform steps split large
+    frames into row partitions of at least ``min_partition_rows`` rows and
+    run them on a process pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        min_partition_rows: int = MIN_PARTITION_ROWS,
+    ):
         self.profiler = DataProfiler()
         self.mapper = FieldMapper()
         self.validator = DataValidator()
         self.transformer = DataTransformer()
 
+        self.max_workers = max_workers
+        self.min_partition_rows = min_partition_rows
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def shutdown(self):
+        """Stop worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get process pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _partition(self, df: pd.DataFrame) -> List[pd.DataFrame]:
+        """Split DataFrame into contiguous row partitions for the workers."""
+        count = min(self.max_workers, len(df) // max(self.min_partition_rows, 1))
+        if count <= 1:
+            return [df]
+
+        bounds = [len(df) * i // count for i in range(count + 1)]
+        return [df.iloc[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
     def create_migration(
         self,
         name: str,
@@ -132,21 +175,28 @@ class MigrationOrchestrator:
         )
 
         try:
-            result = self.validator.validate_dataframe(df, rules)
+            partitions = self._partition(df)
+            if len(partitions) > 1:
+                result = self.validator.validate_partitions(
+                    partitions, rules, self._get_executor()
+                )
+            else:
+                result = self.validator.validate_dataframe(df, rules)
 
             step.metrics = {
                 "total_records": result.total_records,
                 "valid_records": result.valid_records,
                 "invalid_records": result.invalid_records,
-                "error_count": len(result.errors),
-                "warning_count": len(result.warnings),
+                "error_count": result.error_count,
+                "warning_count": result.warning_count,
+                "partitions": len(partitions),
             }
             step.status = MigrationStatus.COMPLETED
             step.completed_at = datetime.utcnow()
 
             if result.has_errors:
                 migration.warnings.append(
-                    f"Validation found {len(result.errors)} errors"
+                    f"Validation found {result.error_count} errors"
                 )
 
         except Exception as e:
@@ -173,13 +223,20 @@ class MigrationOrchestrator:
         transformed_df = pd.DataFrame()
 
         try:
-            transformed_df = self.transformer.transform_dataframe(df, mapping)
+            partitions = self._partition(df)
+            if len(partitions) > 1:
+                transformed_df = self.transformer.transform_partitions(
+                    partitions, mapping, self._get_executor()
+                )
+            else:
+                transformed_df = self.transformer.transform_dataframe(df, mapping)
 
             step.metrics = {
                 "input_records": len(df),
                 "output_records": len(transformed_df),
                 "input_fields": len(df.columns),
                 "output_fields": len(transformed_df.columns),
+                "partitions": len(partitions),
             }
             step.status = MigrationStatus.COMPLETED
             step.completed_at = datetime.utcnow()
@@ -234,3 +291,160 @@ class MigrationOrchestrator:
         migration.processed_records = len(transformed_df)
 
         return migration, transformed_df
+
+    def execute_migration_streaming(
+        self,
+        migration: Migration,
+        source: BaseConnector,
+        target: BaseConnector,
+        mapping: FieldMapping,
+        validation_rules: Optional[List[ValidationRule]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Migration:
+        """
+        Execute migration pipeline one chunk at a time.
+
+        Each chunk is profiled, validated, transformed and written to the
+        target before the next one is read, so peak memory depends on
+        ``chunk_size`` rather than on the size of the source. Step metrics
+        are accumulated across chunks into one ``MigrationStep`` per stage.
+
+        UNIQUE rules also hold every key seen so far in memory. A key that
+        repeats an earlier chunk is reported in the later chunk only, since
+        the earlier one has already been written.
+
+        Args:
+            migration: Migration job
+            source: Connector to read chunks from
+            target: Connector to write transformed chunks to
+            mapping: Field mapping
+            validation_rules: Optional validation rules
+            chunk_size: Number of source rows per chunk
+
+        Returns:
+            Updated migration
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        migration.status = MigrationStatus.MIGRATING
+        migration.started_at = datetime.utcnow()
+
+        steps = {
+            "profile_data": MigrationStep(
+                name="profile_data", status=MigrationStatus.PROFILING
+            ),
+            "transform_data": MigrationStep(
+                name="transform_data", status=MigrationStatus.TRANSFORMING
+            ),
+            "write_data": MigrationStep(
+                name="write_data", status=MigrationStatus.MIGRATING
+            ),
+        }
+        if validation_rules:
+            steps["validate_data"] = MigrationStep(
+                name="validate_data", status=MigrationStatus.VALIDATING
+            )
+        for step in steps.values():
+            step.started_at = datetime.utcnow()
+            step.metrics = {"chunks": 0}
+
+        seen_keys: Dict[int, set] = {}
+        current = "profile_data"
+        try:
+            for chunk in source.iter_chunks(chunk_size):
+                current = "profile_data"
+                profile = self.profiler.profile_dataframe(chunk)
+                self._merge_profile_metrics(steps[current].metrics, profile)
+                migration.total_records += profile.total_records
+
+                if validation_rules:
+                    current = "validate_data"
+                    result = self.validator.validate_dataframe(chunk, validation_rules)
+                    repeated = self.validator.validate_seen_keys(
+                        chunk, validation_rules, seen_keys
+                    )
+                    if repeated.failures:
+                        result = self.validator.merge_results(
+                            [result, repeated], validation_rules, total_records=len(chunk)
+                        )
+                    self._merge_metrics(steps[current].metrics, {
+                        "total_records": result.total_records,
+                        "valid_records": result.valid_records,
+                        "invalid_records": result.invalid_records,
+                        "error_count": result.error_count,
+                        "warning_count": result.warning_count,
+                    })
+
+                current = "transform_data"
+                transformed_df = self.transformer.transform_dataframe(chunk, mapping)
+                self._merge_metrics(steps[current].metrics, {
+                    "input_records": len(chunk),
+                    "output_records": len(transformed_df),
+                })
+                steps[current].metrics["input_fields"] = len(chunk.columns)
+                steps[current].metrics["output_fields"] = len(transformed_df.columns)
+
+                current = "write_data"
+                if steps[current].metrics["chunks"] == 0:
+                    written = target.write_data(transformed_df)
+                else:
+                    written = target.append_data(transformed_df)
+                if not written:
+                    raise RuntimeError(
+                        f"Target rejected chunk {steps[current].metrics['chunks']}"
+                    )
+                self._merge_metrics(steps[current].metrics, {
+                    "written_records": len(transformed_df),
+                })
+
+                migration.processed_records += len(transformed_df)
+
+        except Exception as e:
+            step = steps[current]
+            step.status = MigrationStatus.FAILED
+            step.error = str(e)
+            migration.errors.append(f"{current.replace('_', ' ').capitalize()} failed: {e}")
+            migration.status = MigrationStatus.FAILED
+
+        for step in steps.values():
+            if step.status != MigrationStatus.FAILED:
+                step.status = MigrationStatus.COMPLETED
+                step.completed_at = datetime.utcnow()
+            migration.steps.append(step)
+
+        if migration.status == MigrationStatus.FAILED:
+            return migration
+
+        validate_step = steps.get("validate_data")
+        if validate_step and validate_step.metrics.get("error_count"):
+            migration.warnings.append(
+                f"Validation found {validate_step.metrics['error_count']} errors"
+            )
+
+        migration.status = MigrationStatus.COMPLETED
+        migration.completed_at = datetime.utcnow()
+
+        return migration
+
+    def _merge_profile_metrics(
+        self, metrics: Dict[str, Any], profile: DataProfile
+    ) -> None:
+        """Fold a chunk profile into accumulated profile step metrics."""
+        self._merge_metrics(metrics, {"total_records": profile.total_records})
+        metrics["total_fields"] = max(
+            metrics.get("total_fields", 0), profile.total_fields
+        )
+
+        # Chunks of the same column can infer different dtypes; fall back to
+        # object when they disagree, as pandas would for the whole column.
+        field_types = metrics.setdefault("field_types", {})
+        for field, dtype in profile.field_types.items():
+            if field_types.setdefault(field, dtype) != dtype:
+                field_types[field] = "object"
+
+    def _merge_metrics(self, metrics: Dict[str, Any], counts: Dict[str, int]) -> None:
+        """Add per-chunk counters to accumulated step metrics."""
+        metrics["chunks"] = metrics.get("chunks", 0) + 1
+        for key, value in counts.items():
+            metrics[key] = metrics.get(key, 0) + value
@@ -1,8 +1,45 @@
 """Data profiling service."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional
 from ..models.migration import DataProfile
+from .sketches import HyperLogLog, KLLSketch, Reservoir, RunningStats, hash_values
+
+
+class _ColumnSketch:
+    """Mergeable per-column state for streaming profiles."""
+
+    def __init__(self, sample_size: int, precision: int, quantile_k: int, seed: Optional[int]):
+        self.dtype: Optional[str] = None
+        self.null_count = 0
+        self.distinct = HyperLogLog(precision)
+        self.samples = Reservoir(sample_size, seed)
+        self.numeric = RunningStats()
+        self.quantiles = KLLSketch(quantile_k, seed)
+        self.lengths = RunningStats()
+
+    def update(self, column: pd.Series):
+        """Fold one chunk of the column into the sketches."""
+        dtype = str(column.dtype)
+        if self.dtype is None:
+            self.dtype = dtype
+        elif self.dtype != dtype:
+            # Mirror pandas, which reads a column with mixed chunks as object
+            self.dtype = "object"
+
+        non_null = column.dropna()
+        self.null_count += len(column) - len(non_null)
+        self.distinct.update(hash_values(non_null))
+        self.samples.update(non_null.to_numpy())
+
+        if pd.api.types.is_numeric_dtype(non_null):
+            values = non_null.to_numpy(dtype=np.float64)
+            self.numeric.update(values)
+            self.quantiles.update(values)
+        else:
+            lengths = non_null.astype(str).str.len().to_numpy(dtype=np.float64)
+            self.lengths.update(lengths)
 
 
 class DataProfiler:
@@ -79,6 +116,95 @@ class DataProfiler:
             field_statistics=field_statistics,
         )
 
+    def profile_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        sample_size: int = 10,
+        precision: int = 14,
+        quantile_k: int = 200,
+        seed: Optional[int] = None,
+    ) -> DataProfile:
+        """
+        Profile a stream of DataFrame chunks in one pass and constant memory.
+
+        Null counts, min/max, mean and std are exact. Unique counts come
+        from HyperLogLog, medians from a KLL quantile sketch, and sample
+        values are a uniform reservoir sample; their error bounds are
+        reported in ``DataProfile.error_bounds``.
+
+        Args:
+            chunks: DataFrames with the same columns, e.g. ``connector.iter_chunks(n)``
+            sample_size: Number of sample values to collect per field
+            precision: HyperLogLog precision (2**precision registers)
+            quantile_k: KLL sketch size; larger is more accurate
+            seed: Random seed for reproducible samples
+
+        Returns:
+            Approximate DataProfile
+        """
+        sketches: Dict[str, _ColumnSketch] = {}
+        total_records = 0
+
+        for chunk in chunks:
+            total_records += len(chunk)
+            for col in chunk.columns:
+                if col not in sketches:
+                    sketches[col] = _ColumnSketch(sample_size, precision, quantile_k, seed)
+                sketches[col].update(chunk[col])
+
+        field_types = {}
+        null_counts = {}
+        unique_counts = {}
+        sample_values = {}
+        field_statistics = {}
+        error_bounds = {}
+
+        for col, sketch in sketches.items():
+            non_null = total_records - sketch.null_count
+
+            field_types[col] = sketch.dtype
+            null_counts[col] = sketch.null_count
+            # An estimate can overshoot, but never beyond the non-null count
+            unique_counts[col] = min(int(round(sketch.distinct.estimate())), non_null)
+            sample_values[col] = sketch.samples.items
+
+            stats: Dict[str, Any] = {
+                "null_percentage": (null_counts[col] / total_records * 100) if total_records > 0 else 0,
+                "unique_percentage": (unique_counts[col] / total_records * 100) if total_records > 0 else 0,
+            }
+            bounds = {"unique_count": sketch.distinct.relative_error}
+
+            if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(sketch.dtype)):
+                stats.update({
+                    "min": sketch.numeric.min,
+                    "max": sketch.numeric.max,
+                    "mean": sketch.numeric.mean if sketch.numeric.count else None,
+                    "median": sketch.quantiles.quantile(0.5),
+                    "std": sketch.numeric.std,
+                })
+                bounds["median_rank"] = sketch.quantiles.rank_error
+            elif sketch.lengths.count:
+                stats.update({
+                    "min_length": int(sketch.lengths.min),
+                    "max_length": int(sketch.lengths.max),
+                    "avg_length": float(sketch.lengths.mean),
+                })
+
+            field_statistics[col] = stats
+            error_bounds[col] = bounds
+
+        return DataProfile(
+            total_records=total_records,
+            total_fields=len(sketches),
+            field_types=field_types,
+            null_counts=null_counts,
+            unique_counts=unique_counts,
+            sample_values=sample_values,
+            field_statistics=field_statistics,
+            approximate=True,
+            error_bounds=error_bounds,
+        )
+
     def suggest_data_types(self, profile: DataProfile) -> Dict[str, str]:
         """
         Suggest optimal data types based on profile.
@@ -116,6 +242,36 @@ class DataProfiler:
 
         return suggestions
 
+    def suggest_read_dtypes(self, profile: DataProfile) -> Dict[str, str]:
+        """
+        Suggest explicit dtypes for re-reading the profiled source.
+
+        Integers become nullable ``Int64`` (later rows may hold nulls the
+        profile did not see) and low-cardinality text becomes ``category``.
+
+        Args:
+            profile: Data profile
+
+        Returns:
+            Dictionary mapping field names to pandas dtypes
+        """
+        suggestions = self.suggest_data_types(profile)
+        dtypes = {}
+
+        for field, dtype in profile.field_types.items():
+            dtype = dtype.lower()
+
+            if "int" in dtype:
+                dtypes[field] = "Int64"
+            elif "float" in dtype:
+                dtypes[field] = "float64"
+            elif dtype == "bool":
+                dtypes[field] = "boolean"
+            elif dtype in ("object", "string", "str") and suggestions.get(field) == "categorical":
+                dtypes[field] = "category"
+
+        return dtypes
+
     def identify_potential_keys(self, profile: DataProfile) -> List[str]:
         """
         Identify potential primary key fields.
@@ -133,8 +289,15 @@ class DataProfiler:
             unique_pct = stats.get("unique_percentage", 0)
             null_pct = stats.get("null_percentage", 0)
 
+            # Streaming profiles estimate unique counts; allow three standard
+            # errors of slack before ruling a field out
+            min_unique_pct = 100
+            if profile.approximate:
+                error = profile.error_bounds.get(field, {}).get("unique_count", 0)
+                min_unique_pct = 100 * (1 - 3 * error)
+
             # Good primary key: high uniqueness, no nulls
-            if unique_pct == 100 and null_pct == 0:
+            if unique_pct >= min_unique_pct and null_pct == 0:
                 potential_keys.append(field)
 
         return potential_keys
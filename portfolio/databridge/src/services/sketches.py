@@ -0,0 +1,227 @@
+"""Mergeable, fixed-memory sketches for one-pass profiling."""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """64-bit hashes of a column's values, independent of their index."""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized ``int.bit_length`` for uint64 values."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+
+    # Values below 2**32 are exact in float64, so floor(log2) is exact too
+    with np.errstate(divide="ignore"):
+        high_bits = np.where(high > 0, np.floor(np.log2(high)) + 33, 0)
+        low_bits = np.where(low > 0, np.floor(np.log2(low)) + 1, 0)
+    return np.where(high > 0, high_bits, low_bits).astype(np.int64)
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count estimator with 2**precision registers."""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate, relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, hashes: np.ndarray):
+        """Add hashed values."""
+        if len(hashes) == 0:
+            return
+
+        value_bits = 64 - self.precision
+        index = (hashes >> np.uint64(value_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << value_bits) - 1)
+        rank = (value_bits - _bit_length(remainder) + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        """Merge another sketch built with the same precision."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """Estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # Linear counting is more accurate while many registers are empty
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return float(raw)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Items live in levels of compactors; an item at level ``h`` stands for
+    ``2**h`` inputs. Full levels are sorted and every other item is
+    promoted, so memory stays around ``3 * k`` items for any input size.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of quantile queries (99% confidence)."""
+        return 2.296 / self.k ** 0.9723
+
+    def update(self, values: np.ndarray):
+        """Add numeric values."""
+        if len(values) == 0:
+            return
+
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64)])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        """Merge another sketch."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for height, items in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile ``q`` in [0, 1]."""
+        if self.count == 0:
+            return None
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2 ** height, dtype=np.float64)
+            for height, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(items[order][min(position, len(items) - 1)])
+
+    def _capacity(self, height: int) -> int:
+        """Capacity of a level; lower levels shrink geometrically."""
+        depth = len(self.levels) - height - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compact full levels until every level is within capacity."""
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) > self._capacity(height):
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                level = np.sort(level)
+                # An odd item out stays behind at this level
+                keep = level[:1] if len(level) % 2 else level[:0]
+                pairs = level[len(keep):]
+                promoted = pairs[int(self._rng.integers(2))::2]
+
+                self.levels[height] = keep
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+
+
+class RunningStats:
+    """Count, mean, variance (Welford/Chan), min and max of a numeric stream."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def update(self, values: np.ndarray):
+        """Add a batch of numeric values."""
+        if len(values) == 0:
+            return
+
+        other = RunningStats()
+        other.count = len(values)
+        other.mean = float(np.mean(values))
+        other.m2 = float(np.sum((values - other.mean) ** 2))
+        other.min = float(np.min(values))
+        other.max = float(np.max(values))
+        self.merge(other)
+
+    def merge(self, other: "RunningStats"):
+        """Merge statistics of another stream."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self) -> Optional[float]:
+        """Sample standard deviation, as ``Series.std`` computes it."""
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class Reservoir:
+    """Uniform random sample of fixed size from a stream (algorithm R)."""
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.items: List = []
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """Offer a batch of values to the reservoir."""
+        if len(values) == 0 or self.size == 0:
+            return
+
+        fill = max(0, min(self.size - len(self.items), len(values)))
+        self.items.extend(values[:fill].tolist())
+
+        rest = values[fill:]
+        if len(rest):
+            # Item t (1-based, over the whole stream) replaces a random slot
+            # with probability size / t
+            positions = np.arange(self.seen + fill + 1, self.seen + len(values) + 1)
+            slots = (self._rng.random(len(rest)) * positions).astype(np.int64)
+            accepted = slots < self.size
+            for slot, value in zip(slots[accepted], rest[accepted].tolist()):
+                self.items[slot] = value
+
+        self.seen += len(values)
@@ -1,20 +1,75 @@
 """Data transformation service."""
 
+import hashlib
 import re
+from concurrent.futures import Executor
+from functools import partial
+from itertools import repeat
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple
 from ..models.mapping import FieldMapping, MappingRule, TransformationType
 
+# Compiled plans kept per DataTransformer
+MAX_CACHED_PLANS = 64
+
+
+def mapping_fingerprint(mapping: FieldMapping) -> str:
+    """
+    Fingerprint the parts of a mapping that affect transformation output.
+
+    The migration ID is left out so that re-running the same mapping for a
+    new batch reuses its compiled plan.
+    """
+    payload = mapping.model_dump_json(include={"mappings", "unmapped_target_fields"})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TransformationPlan:
+    """Precompiled, reusable form of a FieldMapping."""
+
+    def __init__(
+        self,
+        fingerprint: str,
+        steps: List[Tuple[MappingRule, Callable[[pd.DataFrame], pd.Series]]],
+        unmapped_target_fields: List[str],
+    ):
+        self.fingerprint = fingerprint
+        self.steps = steps
+        self.unmapped_target_fields = unmapped_target_fields
+
+    def execute(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run plan against a DataFrame, building all target columns at once."""
+        columns: Dict[str, Any] = {}
+
+        for rule, apply in self.steps:
+            try:
+                columns[rule.target_field] = apply(df)
+            except Exception as e:
+                # Use default value or None if transformation fails
+                columns[rule.target_field] = rule.default_value
+
+                print(f"Warning: Transformation failed for {rule.source_field} -> {rule.target_field}: {e}")
+
+        # Add unmapped target fields with None
+        for field in self.unmapped_target_fields:
+            columns.setdefault(field, None)
+
+        return pd.DataFrame(columns, index=df.index)
+
 
 class DataTransformer:
     """Transform data according to field mappings."""
 
     def __init__(self):
         self.custom_transformations: Dict[str, Callable] = {}
+        self._plans: Dict[str, TransformationPlan] = {}
 
     def register_transformation(self, name: str, func: Callable):
         """Register custom transformation function."""
         self.custom_transformations[name] = func
+        # Compiled plans may reference the previous function
+        self._plans.clear()
 
     def transform_dataframe(
         self,
@@ -31,28 +86,59 @@ class DataTransformer:
         Returns:
             Transformed DataFrame with target schema
         """
-        # Create empty target DataFrame
-        target_df = pd.DataFrame()
+        return self.compile_mapping(mapping).execute(df)
 
-        # Apply each mapping rule
-        for rule in mapping.mappings:
-            try:
-                target_df[rule.target_field] = self._apply_transformation(df, rule)
-            except Exception as e:
-                # Use default value or None if transformation fails
-                if rule.default_value is not None:
-                    target_df[rule.target_field] = rule.default_value
-                else:
-                    target_df[rule.target_field] = None
+    def compile_mapping(self, mapping: FieldMapping) -> TransformationPlan:
+        """
+        Compile field mapping into a reusable transformation plan.
 
-                print(f"Warning: Transformation failed for {rule.source_field} -> {rule.target_field}: {e}")
+        Plans are cached by ``mapping_fingerprint`` so repeated runs of the
+        same mapping skip compilation.
 
-        # Add unmapped target fields with None
-        for field in mapping.unmapped_target_fields:
-            if field not in target_df.columns:
-                target_df[field] = None
+        Args:
+            mapping: Field mapping configuration
 
-        return target_df
+        Returns:
+            Compiled TransformationPlan
+        """
+        fingerprint = mapping_fingerprint(mapping)
+
+        plan = self._plans.get(fingerprint)
+        if plan is None:
+            plan = TransformationPlan(
+                fingerprint=fingerprint,
+                steps=[(rule, self._compile_rule(rule)) for rule in mapping.mappings],
+                unmapped_target_fields=list(mapping.unmapped_target_fields),
+            )
+            if len(self._plans) >= MAX_CACHED_PLANS:
+                self._plans.pop(next(iter(self._plans)))
+            self._plans[fingerprint] = plan
+
+        return plan
+
+    def transform_partitions(
+        self,
+        partitions: Sequence[pd.DataFrame],
+        mapping: FieldMapping,
+        executor: Executor,
+    ) -> pd.DataFrame:
+        """
+        Transform row partitions in parallel and concatenate them in order.
+
+        The transformer is sent to the workers with each task, so registered
+        custom transformations must be picklable (module-level functions)
+        when ``executor`` is a process pool.
+
+        Args:
+            partitions: Row partitions of the source DataFrame
+            mapping: Field mapping configuration
+            executor: Executor to run partition tasks on
+
+        Returns:
+            Transformed DataFrame with target schema
+        """
+        parts = list(executor.map(self.transform_dataframe, partitions, repeat(mapping)))
+        return pd.concat(parts) if parts else pd.DataFrame()
 
     def _apply_transformation(
         self,
@@ -60,94 +146,136 @@ class DataTransformer:
         rule: MappingRule,
     ) -> pd.Series:
         """Apply single transformation rule."""
-        if rule.transformation == TransformationType.DIRECT:
-            return self._transform_direct(df, rule)
-        elif rule.transformation == TransformationType.CONCAT:
-            return self._transform_concat(df, rule)
+        return self._compile_rule(rule)(df)
+
+    def _compile_rule(self, rule: MappingRule) -> Callable[[pd.DataFrame], pd.Series]:
+        """
+        Compile single mapping rule into a column function.
+
+        Compiled functions are module-level partials so plans stay picklable
+        for process pools.
+        """
+        field = rule.source_field
+        params = rule.transformation_params
+
+        if rule.transformation == TransformationType.CONCAT:
+            return partial(
+                _transform_concat,
+                fields=[field] + rule.additional_source_fields,
+                separator=params.get("separator", " "),
+            )
         elif rule.transformation == TransformationType.SPLIT:
-            return self._transform_split(df, rule)
+            return partial(
+                _transform_split,
+                field=field,
+                separator=params.get("separator", " "),
+                index=params.get("index", 0),
+            )
         elif rule.transformation == TransformationType.UPPERCASE:
-            return self._transform_uppercase(df, rule)
+            return partial(_transform_uppercase, field=field)
         elif rule.transformation == TransformationType.LOWERCASE:
-            return self._transform_lowercase(df, rule)
+            return partial(_transform_lowercase, field=field)
         elif rule.transformation == TransformationType.TRIM:
-            return self._transform_trim(df, rule)
+            return partial(_transform_trim, field=field)
         elif rule.transformation == TransformationType.REPLACE:
-            return self._transform_replace(df, rule)
+            return partial(
+                _transform_replace,
+                field=field,
+                old=params.get("old", ""),
+                new=params.get("new", ""),
+            )
         elif rule.transformation == TransformationType.REGEX:
-            return self._transform_regex(df, rule)
+            return partial(
+                _transform_regex,
+                field=field,
+                pattern=re.compile(params.get("pattern", "")),
+                replacement=params.get("replacement", ""),
+            )
         elif rule.transformation == TransformationType.LOOKUP:
-            return self._transform_lookup(df, rule)
+            lookup_table = rule.lookup_table or {}
+            default = rule.default_value
+            # Code len(keys) is reserved for values missing from the table
+            return partial(
+                _transform_lookup,
+                field=field,
+                categories=pd.Index(list(lookup_table.keys()), dtype=object),
+                values=np.array(
+                    [default if v is None else v for v in lookup_table.values()] + [default],
+                    dtype=object,
+                ),
+            )
         elif rule.transformation == TransformationType.CUSTOM:
-            return self._transform_custom(df, rule)
-        else:
-            return df[rule.source_field]
+            func = self.custom_transformations.get(params.get("function"))
+            if func is not None:
+                return partial(_transform_custom, field=field, func=func)
+
+        return partial(_transform_direct, field=field)
+
+
+def _transform_direct(df: pd.DataFrame, field: str) -> pd.Series:
+    """Direct copy."""
+    return df[field]
+
+
+def _transform_concat(df: pd.DataFrame, fields: List[str], separator: str) -> pd.Series:
+    """Concatenate non-null values of multiple fields."""
+    result: Optional[pd.Series] = None
+
+    for field in fields:
+        column = df[field]
+        values = column.astype(str).where(column.notna())
+
+        if result is None:
+            result = values
+            continue
 
-    def _transform_direct(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Direct copy."""
-        return df[rule.source_field]
+        joined = result + separator + values
+        result = joined.where(values.notna() & result.notna(), result.fillna(values))
 
-    def _transform_concat(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Concatenate multiple fields."""
-        fields = [rule.source_field] + rule.additional_source_fields
-        separator = rule.transformation_params.get("separator", " ")
+    return result.fillna("")
 
-        # Concatenate non-null values
-        result = df[fields].apply(
-            lambda row: separator.join(str(v) for v in row if pd.notna(v)),
-            axis=1,
-        )
 
-        return result
+def _transform_split(df: pd.DataFrame, field: str, separator: str, index: int) -> pd.Series:
+    """Split field and take specific part."""
+    return df[field].astype(str).str.split(separator).str[index]
 
-    def _transform_split(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Split field and take specific part."""
-        separator = rule.transformation_params.get("separator", " ")
-        index = rule.transformation_params.get("index", 0)
 
-        return df[rule.source_field].astype(str).str.split(separator).str[index]
+def _transform_uppercase(df: pd.DataFrame, field: str) -> pd.Series:
+    """Convert to uppercase."""
+    return df[field].astype(str).str.upper()
 
-    def _transform_uppercase(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Convert to uppercase."""
-        return df[rule.source_field].astype(str).str.upper()
 
-    def _transform_lowercase(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Convert to lowercase."""
-        return df[rule.source_field].astype(str).str.lower()
+def _transform_lowercase(df: pd.DataFrame, field: str) -> pd.Series:
+    """Convert to lowercase."""
+    return df[field].astype(str).str.lower()
 
-    def _transform_trim(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Trim whitespace."""
-        return df[rule.source_field].astype(str).str.strip()
 
-    def _transform_replace(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Replace substring."""
-        old = rule.transformation_params.get("old", "")
-        new = rule.transformation_params.get("new", "")
+def _transform_trim(df: pd.DataFrame, field: str) -> pd.Series:
+    """Trim whitespace."""
+    return df[field].astype(str).str.strip()
 
-        return df[rule.source_field].astype(str).str.replace(old, new)
 
-    def _transform_regex(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Apply regex transformation."""
-        pattern = rule.transformation_params.get("pattern", "")
-        replacement = rule.transformation_params.get("replacement", "")
+def _transform_replace(df: pd.DataFrame, field: str, old: str, new: str) -> pd.Series:
+    """Replace substring."""
+    return df[field].astype(str).str.replace(old, new, regex=False)
 
-        return df[rule.source_field].astype(str).str.replace(
-            pattern, replacement, regex=True
-        )
 
-    def _transform_lookup(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Lookup/map values."""
-        lookup_table = rule.lookup_table or {}
-        default = rule.default_value
+def _transform_regex(
+    df: pd.DataFrame, field: str, pattern: re.Pattern, replacement: str
+) -> pd.Series:
+    """Apply precompiled regex transformation."""
+    return df[field].astype(str).str.replace(pattern, replacement, regex=True)
 
-        return df[rule.source_field].map(lookup_table).fillna(default)
 
-    def _transform_custom(self, df: pd.DataFrame, rule: MappingRule) -> pd.Series:
-        """Apply custom transformation function."""
-        func_name = rule.transformation_params.get("function")
+def _transform_lookup(
+    df: pd.DataFrame, field: str, categories: pd.Index, values: np.ndarray
+) -> pd.Series:
+    """Lookup/map values through categorical codes."""
+    codes = pd.Categorical(df[field], categories=categories).codes.astype(np.intp)
+    codes[codes == -1] = len(categories)
+    return pd.Series(values[codes], index=df.index)
 
-        if func_name and func_name in self.custom_transformations:
-            func = self.custom_transformations[func_name]
-            return df[rule.source_field].apply(func)
 
-        return df[rule.source_field]
+def _transform_custom(df: pd.DataFrame, field: str, func: Callable) -> pd.Series:
+    """Apply custom transformation function."""
+    return df[field].apply(func)
@@ -1,16 +1,27 @@
 """Data validation service."""
 
-import re
+from collections import defaultdict
+from concurrent.futures import Executor
+import numpy as np
 import pandas as pd
-from typing import List, Any, Set
+from typing import Dict, List, Optional, Sequence, Tuple
 from ..models.validation import (
     ValidationRule,
     ValidationResult,
     ValidationIssue,
     ValidationType,
     ValidationLevel,
+    RuleFailures,
 )
 
+# Python types accepted by TYPE rules, keyed by expected_type
+EXPECTED_TYPES: Dict[str, Tuple[type, ...]] = {
+    "int": (int,),
+    "float": (float, int),
+    "str": (str,),
+    "bool": (bool,),
+}
+
 
 class DataValidator:
     """Validate data against rules before migration."""
@@ -23,6 +34,9 @@ class DataValidator:
         """
         Validate DataFrame against rules.
 
+        Each rule is evaluated as a column-wide boolean mask; failing rows
+        are recorded as compact ``RuleFailures`` on the result.
+
         Args:
             df: DataFrame to validate
             rules: List of validation rules
@@ -30,29 +44,234 @@ class DataValidator:
         Returns:
             ValidationResult with all issues found
         """
+        return self._validate(df, rules)
+
+    def validate_partitions(
+        self,
+        partitions: Sequence[pd.DataFrame],
+        rules: List[ValidationRule],
+        executor: Executor,
+    ) -> ValidationResult:
+        """
+        Validate row partitions of one DataFrame in parallel.
+
+        Row-local rules run on ``executor`` one partition per task. UNIQUE
+        rules need to see every row, so they run afterwards on the
+        concatenated columns before all partial results are merged.
+
+        Args:
+            partitions: Row partitions of the DataFrame to validate
+            rules: List of validation rules
+            executor: Executor to run partition tasks on
+
+        Returns:
+            Merged ValidationResult for all partitions
+        """
+        local_ids = [
+            i for i, rule in enumerate(rules) if rule.rule_type != ValidationType.UNIQUE
+        ]
+        global_ids = [
+            i for i, rule in enumerate(rules) if rule.rule_type == ValidationType.UNIQUE
+        ]
+
+        # Failing rows are recorded by position in the whole frame as well
+        # as by label, so rows are counted correctly when labels repeat
+        offsets = np.cumsum([0] + [len(partition) for partition in partitions[:-1]])
+        futures = [
+            executor.submit(self._validate, partition, rules, local_ids, int(offset))
+            for partition, offset in zip(partitions, offsets)
+        ]
+        results = [future.result() for future in futures]
+
+        unique_fields = list(dict.fromkeys(
+            rules[i].field for i in global_ids if rules[i].field in partitions[0].columns
+        ))
+        if unique_fields:
+            columns = pd.concat([partition[unique_fields] for partition in partitions])
+            results.append(self._validate(columns, rules, global_ids))
+
+        return self.merge_results(
+            results,
+            rules,
+            total_records=sum(len(partition) for partition in partitions),
+        )
+
+    def validate_seen_keys(
+        self,
+        df: pd.DataFrame,
+        rules: List[ValidationRule],
+        seen: Dict[int, set],
+    ) -> ValidationResult:
+        """
+        Check UNIQUE rules against keys from earlier chunks of the same source.
+
+        Rows whose value was already seen fail the rule; duplicates inside
+        ``df`` are left to ``validate_dataframe``. The non-null keys of
+        ``df`` are then added to ``seen`` (keyed by rule position), which
+        the caller keeps for the whole stream.
+
+        Args:
+            df: Chunk to check
+            rules: List of validation rules
+            seen: Keys seen so far per UNIQUE rule; updated in place
+
+        Returns:
+            ValidationResult with the repeated keys of ``df``
+        """
+        result = ValidationResult(
+            total_records=len(df),
+            valid_records=0,
+            invalid_records=0,
+            rules=list(rules),
+        )
+
+        for rule_id, rule in enumerate(rules):
+            if rule.rule_type != ValidationType.UNIQUE or rule.field not in df.columns:
+                continue
+
+            series = df[rule.field]
+            keys = seen.setdefault(rule_id, set())
+            mask = (series.isin(keys) & ~series.duplicated(keep=False)).to_numpy()
+            keys.update(series.dropna())
+            if not mask.any():
+                continue
+
+            result.add_failures(
+                RuleFailures(
+                    rule_id=rule_id,
+                    record_indices=df.index.to_numpy()[mask],
+                    values=series.to_numpy()[mask],
+                    record_positions=np.flatnonzero(mask),
+                )
+            )
+
+        return result
+
+    def merge_results(
+        self,
+        results: List[ValidationResult],
+        rules: List[ValidationRule],
+        total_records: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        Merge partial results produced with the same rules.
+
+        Invalid records are counted by row position when every partial
+        result carries positions, and by index label otherwise.
+
+        Args:
+            results: Partial validation results
+            rules: Rules the partial results were produced with
+            total_records: Record count of the merged result; defaults to
+                the sum of the partial counts
+
+        Returns:
+            Combined ValidationResult
+        """
+        if total_records is None:
+            total_records = sum(result.total_records for result in results)
+
+        merged = ValidationResult(
+            total_records=total_records,
+            valid_records=0,
+            invalid_records=0,
+            rules=list(rules),
+        )
+
+        failures_by_rule: Dict[int, List[RuleFailures]] = defaultdict(list)
+        for result in results:
+            for failures in result.failures:
+                failures_by_rule[failures.rule_id].append(failures)
+
+        has_positions = all(
+            part.record_positions is not None
+            for parts in failures_by_rule.values()
+            for part in parts
+        )
+
+        error_rows = []
+        for rule_id in sorted(failures_by_rule):
+            parts = failures_by_rule[rule_id]
+            record_indices = np.concatenate([part.record_indices for part in parts])
+            values = None
+            if parts[0].values is not None:
+                values = np.concatenate([part.values for part in parts])
+            record_positions = None
+            if has_positions:
+                record_positions = np.concatenate([part.record_positions for part in parts])
+
+            merged.add_failures(
+                RuleFailures(
+                    rule_id=rule_id,
+                    record_indices=record_indices,
+                    values=values,
+                    record_positions=record_positions,
+                )
+            )
+            if rules[rule_id].level == ValidationLevel.ERROR:
+                error_rows.append(record_positions if has_positions else record_indices)
+
+        if error_rows:
+            merged.invalid_records = len(np.unique(np.concatenate(error_rows)))
+        merged.valid_records = merged.total_records - merged.invalid_records
+
+        return merged
+
+    def _validate(
+        self,
+        df: pd.DataFrame,
+        rules: List[ValidationRule],
+        rule_ids: Optional[List[int]] = None,
+        offset: int = 0,
+    ) -> ValidationResult:
+        """
+        Validate DataFrame against the rules at ``rule_ids`` (all by default).
+
+        ``offset`` is the position of the first row in the full frame when
+        ``df`` is one partition of it.
+        """
         result = ValidationResult(
             total_records=len(df),
             valid_records=0,
             invalid_records=0,
+            rules=list(rules),
         )
 
         # Track which records have errors
-        records_with_errors: Set[int] = set()
+        records_with_errors = np.zeros(len(df), dtype=bool)
+
+        if rule_ids is None:
+            rule_ids = list(range(len(rules)))
 
         # Apply each rule
-        for rule in rules:
+        for rule_id in rule_ids:
+            rule = rules[rule_id]
             if rule.field not in df.columns:
                 continue
 
-            issues = self._apply_rule(df, rule)
+            series = df[rule.field]
+            mask = self._rule_mask(series, rule)
+            if mask is None or not mask.any():
+                continue
 
-            for issue in issues:
-                result.add_issue(issue)
-                if issue.rule.level == ValidationLevel.ERROR:
-                    records_with_errors.add(issue.record_index)
+            result.add_failures(
+                RuleFailures(
+                    rule_id=rule_id,
+                    record_indices=df.index.to_numpy()[mask],
+                    values=(
+                        None
+                        if rule.rule_type == ValidationType.REQUIRED
+                        else series.to_numpy()[mask]
+                    ),
+                    record_positions=np.flatnonzero(mask) + offset,
+                )
+            )
+
+            if rule.level == ValidationLevel.ERROR:
+                records_with_errors |= mask
 
         # Calculate valid/invalid counts
-        result.invalid_records = len(records_with_errors)
+        result.invalid_records = int(records_with_errors.sum())
         result.valid_records = result.total_records - result.invalid_records
 
         return result
@@ -61,210 +280,123 @@ class DataValidator:
         self, df: pd.DataFrame, rule: ValidationRule
     ) -> List[ValidationIssue]:
         """Apply single validation rule to DataFrame."""
-        issues = []
+        return self.validate_dataframe(df, [rule]).issues
 
+    def _rule_mask(
+        self, series: pd.Series, rule: ValidationRule
+    ) -> Optional[np.ndarray]:
+        """Evaluate rule against a column, returning a mask of failing rows."""
         if rule.rule_type == ValidationType.REQUIRED:
-            issues.extend(self._validate_required(df, rule))
+            return self._validate_required(series, rule)
         elif rule.rule_type == ValidationType.TYPE:
-            issues.extend(self._validate_type(df, rule))
+            return self._validate_type(series, rule)
         elif rule.rule_type == ValidationType.RANGE:
-            issues.extend(self._validate_range(df, rule))
+            return self._validate_range(series, rule)
         elif rule.rule_type == ValidationType.REGEX:
-            issues.extend(self._validate_regex(df, rule))
+            return self._validate_regex(series, rule)
         elif rule.rule_type == ValidationType.LENGTH:
-            issues.extend(self._validate_length(df, rule))
+            return self._validate_length(series, rule)
         elif rule.rule_type == ValidationType.UNIQUE:
-            issues.extend(self._validate_unique(df, rule))
+            return self._validate_unique(series, rule)
 
-        return issues
+        return None
 
     def _validate_required(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> np.ndarray:
         """Validate required fields."""
-        issues = []
-        null_mask = df[rule.field].isnull()
-
-        for idx in null_mask[null_mask].index:
-            issues.append(
-                ValidationIssue(
-                    record_index=int(idx),
-                    field=rule.field,
-                    rule=rule,
-                    value=None,
-                    message=rule.get_message(),
-                )
-            )
-
-        return issues
+        return series.isnull().to_numpy()
 
     def _validate_type(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> Optional[np.ndarray]:
         """Validate data types."""
-        issues = []
         expected_type = rule.params.get("expected_type")
 
         if not expected_type:
-            return issues
-
-        for idx, value in df[rule.field].items():
-            if pd.isna(value):
-                continue
-
-            valid = False
-            if expected_type == "int":
-                valid = isinstance(value, (int, pd.Int64Dtype))
-            elif expected_type == "float":
-                valid = isinstance(value, (float, int))
-            elif expected_type == "str":
-                valid = isinstance(value, str)
-            elif expected_type == "bool":
-                valid = isinstance(value, bool)
-
-            if not valid:
-                issues.append(
-                    ValidationIssue(
-                        record_index=int(idx),
-                        field=rule.field,
-                        rule=rule,
-                        value=value,
-                        message=f"{rule.get_message()}: expected {expected_type}, got {type(value).__name__}",
-                    )
-                )
-
-        return issues
+            return None
+
+        accepted = EXPECTED_TYPES.get(expected_type, ())
+        not_null = series.notna().to_numpy()
+
+        # Numeric and bool columns hold a single Python scalar type, so the
+        # whole column passes or fails together.
+        scalar_type = None
+        if pd.api.types.is_bool_dtype(series.dtype):
+            scalar_type = bool
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            scalar_type = int
+        elif pd.api.types.is_float_dtype(series.dtype):
+            scalar_type = float
+
+        if scalar_type is not None:
+            if issubclass(scalar_type, accepted):
+                return np.zeros(len(series), dtype=bool)
+            return not_null
+
+        # Mixed columns: check each distinct Python type once
+        value_types = series[not_null].map(type)
+        type_valid = {t: issubclass(t, accepted) for t in value_types.unique()}
+
+        mask = np.zeros(len(series), dtype=bool)
+        mask[not_null] = ~value_types.map(type_valid).to_numpy(dtype=bool)
+        return mask
 
     def _validate_range(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> np.ndarray:
         """Validate numeric ranges."""
-        issues = []
         min_val = rule.params.get("min")
         max_val = rule.params.get("max")
 
-        for idx, value in df[rule.field].items():
-            if pd.isna(value):
-                continue
+        # Values that cannot be read as numbers are skipped, as are nulls
+        numeric = pd.to_numeric(series, errors="coerce").astype("float64").to_numpy()
 
-            try:
-                numeric_value = float(value)
-
-                if min_val is not None and numeric_value < min_val:
-                    issues.append(
-                        ValidationIssue(
-                            record_index=int(idx),
-                            field=rule.field,
-                            rule=rule,
-                            value=value,
-                            message=f"{rule.get_message()}: {value} < {min_val}",
-                        )
-                    )
-
-                if max_val is not None and numeric_value > max_val:
-                    issues.append(
-                        ValidationIssue(
-                            record_index=int(idx),
-                            field=rule.field,
-                            rule=rule,
-                            value=value,
-                            message=f"{rule.get_message()}: {value} > {max_val}",
-                        )
-                    )
-            except (ValueError, TypeError):
-                pass
-
-        return issues
+        mask = np.zeros(len(series), dtype=bool)
+        if min_val is not None:
+            mask |= numeric < min_val
+        if max_val is not None:
+            mask |= numeric > max_val
+        return mask
 
     def _validate_regex(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> Optional[np.ndarray]:
         """Validate against regex pattern."""
-        issues = []
         pattern = rule.params.get("pattern")
 
         if not pattern:
-            return issues
+            return None
 
-        regex = re.compile(pattern)
+        not_null = series.notna().to_numpy()
+        matched = series[not_null].astype(str).str.match(pattern).to_numpy(dtype=bool)
 
-        for idx, value in df[rule.field].items():
-            if pd.isna(value):
-                continue
-
-            if not regex.match(str(value)):
-                issues.append(
-                    ValidationIssue(
-                        record_index=int(idx),
-                        field=rule.field,
-                        rule=rule,
-                        value=value,
-                        message=f"{rule.get_message()}: '{value}' does not match pattern '{pattern}'",
-                    )
-                )
-
-        return issues
+        mask = np.zeros(len(series), dtype=bool)
+        mask[not_null] = ~matched
+        return mask
 
     def _validate_length(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> np.ndarray:
         """Validate string length."""
-        issues = []
         min_len = rule.params.get("min_length")
         max_len = rule.params.get("max_length")
 
-        for idx, value in df[rule.field].items():
-            if pd.isna(value):
-                continue
+        not_null = series.notna().to_numpy()
+        lengths = series[not_null].astype(str).str.len().to_numpy()
 
-            value_str = str(value)
-            length = len(value_str)
-
-            if min_len is not None and length < min_len:
-                issues.append(
-                    ValidationIssue(
-                        record_index=int(idx),
-                        field=rule.field,
-                        rule=rule,
-                        value=value,
-                        message=f"{rule.get_message()}: length {length} < {min_len}",
-                    )
-                )
+        invalid = np.zeros(len(lengths), dtype=bool)
+        if min_len is not None:
+            invalid |= lengths < min_len
+        if max_len is not None:
+            invalid |= lengths > max_len
 
-            if max_len is not None and length > max_len:
-                issues.append(
-                    ValidationIssue(
-                        record_index=int(idx),
-                        field=rule.field,
-                        rule=rule,
-                        value=value,
-                        message=f"{rule.get_message()}: length {length} > {max_len}",
-                        )
-                )
-
-        return issues
+        mask = np.zeros(len(series), dtype=bool)
+        mask[not_null] = invalid
+        return mask
 
     def _validate_unique(
-        self, df: pd.DataFrame, rule: ValidationRule
-    ) -> List[ValidationIssue]:
+        self, series: pd.Series, rule: ValidationRule
+    ) -> np.ndarray:
         """Validate uniqueness."""
-        issues = []
-
-        # Find duplicates
-        duplicates = df[df[rule.field].duplicated(keep=False)]
-
-        for idx, value in duplicates[rule.field].items():
-            if pd.isna(value):
-                continue
-
-            issues.append(
-                ValidationIssue(
-                    record_index=int(idx),
-                    field=rule.field,
-                    rule=rule,
-                    value=value,
-                    message=f"{rule.get_message()}: duplicate value '{value}'",
-                )
-            )
-
-        return issues
+        return (series.duplicated(keep=False) & series.notna()).to_numpy()
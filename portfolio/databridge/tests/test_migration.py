@@ -57,6 +57,267 @@ class TestDataProfiler:
         assert "id" in keys
         assert "email" in keys
 
+    def test_profile_chunks(self, sample_dataframe):
+        """Test one-pass streaming profile matches the exact profile."""
+        profiler = DataProfiler()
+        exact = profiler.profile_dataframe(sample_dataframe)
+
+        chunks = (sample_dataframe.iloc[i:i + 2] for i in range(0, 5, 2))
+        profile = profiler.profile_chunks(chunks, sample_size=3, seed=0)
+
+        assert profile.approximate
+        assert profile.total_records == 5
+        assert profile.field_types == exact.field_types
+        assert profile.unique_counts == exact.unique_counts
+        assert len(profile.sample_values["city"]) == 3
+
+        age_stats = profile.field_statistics["age"]
+        assert age_stats["mean"] == pytest.approx(exact.field_statistics["age"]["mean"])
+        assert age_stats["std"] == pytest.approx(exact.field_statistics["age"]["std"])
+        assert age_stats["median"] == exact.field_statistics["age"]["median"]
+        assert profile.field_statistics["city"]["max_length"] == 11
+        assert "unique_count" in profile.error_bounds["id"]
+        assert "id" in profiler.identify_potential_keys(profile)
+
+    def test_sketches_merge(self):
+        """Test sketches built on separate partitions merge correctly."""
+        import numpy as np
+        from src.services.sketches import HyperLogLog, KLLSketch, RunningStats, hash_values
+
+        values = pd.Series(np.arange(200_000))
+        halves = [values.iloc[:100_000], values.iloc[100_000:]]
+
+        hll, other_hll = HyperLogLog(), HyperLogLog()
+        kll, other_kll = KLLSketch(seed=1), KLLSketch(seed=2)
+        stats, other_stats = RunningStats(), RunningStats()
+        for sketches, part in zip([(hll, kll, stats), (other_hll, other_kll, other_stats)], halves):
+            sketches[0].update(hash_values(part))
+            sketches[1].update(part.to_numpy(dtype=float))
+            sketches[2].update(part.to_numpy(dtype=float))
+
+        hll.merge(other_hll)
+        kll.merge(other_kll)
+        stats.merge(other_stats)
+
+        assert hll.estimate() == pytest.approx(200_000, rel=4 * hll.relative_error)
+        assert kll.quantile(0.5) == pytest.approx(100_000, abs=200_000 * kll.rank_error)
+        assert stats.mean == pytest.approx(values.mean())
+        assert stats.std == pytest.approx(values.std())
+
+
+class TestCSVConnector:
+    """Test CSV connector streaming."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        """Write a CSV with a low-cardinality column and nullable ints."""
+        path = tmp_path / "customers.csv"
+        pd.DataFrame({
+            "id": range(1, 101),
+            "tier": ["gold", "silver", "bronze", "gold"] * 25,
+            "score": [None if i % 10 == 0 else i for i in range(100)],
+        }).to_csv(path, index=False)
+        return path
+
+    def test_get_schema_reads_header_only(self, csv_path):
+        """Test schema discovery does not load the file."""
+        from src.connectors.csv import CSVConnector
+
+        connector = CSVConnector(str(csv_path))
+
+        assert connector.get_schema() == ["id", "tier", "score"]
+        assert connector.df is None
+
+    def test_iter_chunks_with_profile_dtypes(self, csv_path):
+        """Test chunked reads use dtypes suggested from a profile."""
+        from src.connectors.csv import CSVConnector
+
+        profiler = DataProfiler()
+        profile = profiler.profile_dataframe(pd.read_csv(csv_path))
+        dtypes = profiler.suggest_read_dtypes(profile)
+
+        assert dtypes["id"] == "Int64"
+        assert dtypes["tier"] == "category"
+
+        connector = CSVConnector(str(csv_path), dtype=dtypes, memory_map=True)
+        chunks = list(connector.iter_chunks(30))
+
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        assert str(chunks[0]["tier"].dtype) == "category"
+        assert str(chunks[0]["id"].dtype) == "Int64"
+
+    def test_iter_chunks_pyarrow_engine(self, csv_path):
+        """Test pyarrow streaming regroups batches into fixed-size chunks."""
+        pytest.importorskip("pyarrow")
+        from src.connectors.csv import CSVConnector
+
+        connector = CSVConnector(
+            str(csv_path), engine="pyarrow", dtype={"id": "Int64", "tier": "category", "score": "float64"}
+        )
+        chunks = list(connector.iter_chunks(40))
+
+        assert [len(chunk) for chunk in chunks] == [40, 40, 20]
+        assert pd.concat(chunks)["id"].tolist() == list(range(1, 101))
+        assert str(chunks[-1]["tier"].dtype) == "category"
+        assert str(chunks[0]["score"].dtype) == "float64"
+        assert chunks[0]["score"].isna().sum() == 4
+
+    def test_iter_chunks_pyarrow_keeps_leading_zeros(self, tmp_path):
+        """Test string hints and unhinted columns are parsed as text, not inferred as numbers."""
+        pytest.importorskip("pyarrow")
+        from src.connectors.csv import CSVConnector
+
+        path = tmp_path / "addresses.csv"
+        path.write_text("zip,phone,city\n02134,0171234,Boston\n00501,0209876,\n")
+
+        connector = CSVConnector(str(path), engine="pyarrow", dtype={"zip": "string"})
+        (chunk,) = connector.iter_chunks(10)
+
+        assert chunk["zip"].tolist() == ["02134", "00501"]
+        assert str(chunk["zip"].dtype) == "string"
+        assert chunk["phone"].tolist() == ["0171234", "0209876"]
+        assert chunk["city"].isna().tolist() == [False, True]
+
+    def test_iter_chunks_pyarrow_type_drift_in_later_block(self, tmp_path, monkeypatch):
+        """Test a value that only appears in a later block doesn't break the stream."""
+        pytest.importorskip("pyarrow")
+        from src.connectors import csv as csv_connector
+
+        monkeypatch.setattr(csv_connector, "PYARROW_BLOCK_SIZE", 1024)
+        path = tmp_path / "orders.csv"
+        codes = [str(i) for i in range(500)] + ["A-17"]
+        pd.DataFrame({"id": range(501), "code": codes}).to_csv(path, index=False)
+
+        connector = csv_connector.CSVConnector(str(path), engine="pyarrow", dtype={"id": "Int64"})
+        chunks = list(connector.iter_chunks(200))
+
+        assert [len(chunk) for chunk in chunks] == [200, 200, 101]
+        result = pd.concat(chunks)
+        assert result["code"].tolist() == codes
+        assert result["id"].tolist() == list(range(501))
+
+
+@pytest.fixture
+def hubspot_stub():
+    """Serve a minimal HubSpot v3 API on localhost."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    state = {
+        "contacts": [{"email": f"user{i}@example.com"} for i in range(250)],
+        "batches": [],
+        "rate_limited": 0,
+        "server_errors": 0,
+    }
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, headers=None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            start = int(query.get("after", ["0"])[0])
+            limit = int(query["limit"][0])
+            page = state["contacts"][start:start + limit]
+            body = {"results": [{"properties": props} for props in page]}
+            if start + limit < len(state["contacts"]):
+                body["paging"] = {"next": {"after": str(start + limit)}}
+            self._send(200, body)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                # Rate limit the first request to exercise retry/backoff
+                if state["rate_limited"] == 0:
+                    state["rate_limited"] += 1
+                    self._send(429, {"message": "rate limited"}, {"Retry-After": "0"})
+                    return
+                state["batches"].append((self.path, body["inputs"]))
+                # Fail after the write is applied, like a timed-out gateway
+                if state["server_errors"] > 0:
+                    state["server_errors"] -= 1
+                    self._send(503, {"message": "unavailable"})
+                    return
+            self._send(201, {"status": "COMPLETE"})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestHubSpotConnector:
+    """Test HubSpot connector against a local stub server."""
+
+    def test_read_follows_pagination(self, hubspot_stub):
+        """Test reads follow the paging cursor to the last page."""
+        from src.connectors.hubspot import HubSpotConnector
+
+        connector = HubSpotConnector("token", base_url=hubspot_stub["url"])
+
+        df = connector.read_data()
+        chunks = list(connector.iter_chunks(120))
+
+        assert len(df) == 250
+        assert df["email"].iloc[-1] == "user249@example.com"
+        assert [len(chunk) for chunk in chunks] == [120, 120, 10]
+
+    def test_batch_write_retries_rate_limit(self, hubspot_stub):
+        """Test batched concurrent writes retry after a 429."""
+        from src.connectors.hubspot import HubSpotConnector
+
+        connector = HubSpotConnector(
+            "token", base_url=hubspot_stub["url"], max_workers=4, requests_per_second=100
+        )
+        df = pd.DataFrame({"email": [f"new{i}@example.com" for i in range(250)]})
+
+        assert connector.write_data(df, id_property="email")
+
+        batches = hubspot_stub["batches"]
+        assert hubspot_stub["rate_limited"] == 1
+        assert sorted(len(inputs) for _, inputs in batches) == [50, 100, 100]
+        assert all(path.endswith("/batch/upsert") for path, _ in batches)
+        assert batches[0][1][0]["idProperty"] == "email"
+
+    def test_batch_create_not_retried_on_server_error(self, hubspot_stub):
+        """Test creates are not repeated after a 5xx, while upserts are."""
+        from src.connectors.hubspot import HubSpotConnector
+
+        connector = HubSpotConnector(
+            "token", base_url=hubspot_stub["url"], max_workers=1, requests_per_second=100
+        )
+        connector.connect()
+        connector.client.backoff_factor = 0
+        df = pd.DataFrame({"email": [f"new{i}@example.com" for i in range(10)]})
+        hubspot_stub["rate_limited"] = 1
+
+        hubspot_stub["server_errors"] = 1
+        assert not connector.write_data(df)
+        assert len(hubspot_stub["batches"]) == 1
+
+        hubspot_stub["server_errors"] = 1
+        assert connector.write_data(df, id_property="email")
+        assert [path.rsplit("/", 1)[-1] for path, _ in hubspot_stub["batches"]] == [
+            "create", "upsert", "upsert",
+        ]
+
 
 class TestFieldMapper:
     """Test field mapping."""
@@ -103,6 +364,43 @@ class TestFieldMapper:
 
         assert len(mapping.mappings) >= 2
 
+    def test_one_to_one_assignment(self):
+        """Test contested targets go where the total score is highest."""
+        mapper = FieldMapper()
+        source_fields = ["customer_name", "customer_names"]
+        target_fields = ["customer_names_list", "customer_nam"]
+
+        mapping = mapper.auto_map_fields(source_fields, target_fields, fuzzy_threshold=0.6)
+
+        pairs = {m.source_field: m.target_field for m in mapping.mappings}
+        assert len(pairs) == 2
+        assert len(set(pairs.values())) == 2
+
+    def test_exact_match_wins_over_fuzzy(self):
+        """Test exact matches are kept even when contested."""
+        mapper = FieldMapper()
+        source_fields = ["account_number", "account_numbers"]
+        target_fields = ["account_numbers"]
+
+        mapping = mapper.auto_map_fields(source_fields, target_fields, fuzzy_threshold=0.5)
+
+        assert [(m.source_field, m.target_field) for m in mapping.mappings] == [
+            ("account_numbers", "account_numbers")
+        ]
+
+    def test_wide_schema(self):
+        """Test mapping thousands of fields pairs each with its counterpart."""
+        mapper = FieldMapper()
+        source_fields = [f"Custom_Field_{i}__c" for i in range(2000)]
+        target_fields = [f"custom_field_{i}" for i in range(2000)]
+
+        mapping = mapper.auto_map_fields(source_fields, target_fields)
+
+        pairs = {m.source_field: m.target_field for m in mapping.mappings}
+        assert len(pairs) == 2000
+        assert pairs["Custom_Field_1234__c"] == "custom_field_1234"
+        assert mapper.build_index(target_fields) is mapper.build_index(target_fields)
+
 
 class TestDataValidator:
     """Test data validation."""
@@ -179,6 +477,99 @@ class TestDataValidator:
 
         assert len(result.errors) > 0
 
+    def test_type_validation(self):
+        """Test type validation on mixed and numeric columns."""
+        validator = DataValidator()
+
+        df = pd.DataFrame({
+            "mixed": [1, "two", 3.5, None, 4],
+            "floats": [1.0, 2.5, None, 4.0, 5.0],
+        })
+
+        rules = [
+            ValidationRule(
+                field="mixed",
+                rule_type=ValidationType.TYPE,
+                params={"expected_type": "int"},
+            ),
+            ValidationRule(
+                field="floats",
+                rule_type=ValidationType.TYPE,
+                params={"expected_type": "float"},
+            ),
+        ]
+
+        result = validator.validate_dataframe(df, rules)
+
+        assert [issue.record_index for issue in result.errors] == [1, 2]
+        assert result.errors[0].message.endswith("expected int, got str")
+        assert result.invalid_records == 2
+
+    def test_length_validation(self, sample_dataframe):
+        """Test length validation levels and messages."""
+        validator = DataValidator()
+
+        rule = ValidationRule(
+            field="first_name",
+            rule_type=ValidationType.LENGTH,
+            level=ValidationLevel.WARNING,
+            params={"min_length": 4, "max_length": 5},
+        )
+
+        result = validator.validate_dataframe(sample_dataframe, [rule])
+
+        assert result.error_count == 0
+        assert [issue.value for issue in result.warnings] == ["Bob", "Charlie"]
+        assert result.warnings[1].message.endswith("length 7 > 5")
+        assert result.valid_records == 5
+
+    def test_failures_are_columnar(self):
+        """Test issues are stored column-wise until requested."""
+        validator = DataValidator()
+
+        df = pd.DataFrame({"age": [10, 20, "n/a", 99, None]})
+        rule = ValidationRule(
+            field="age",
+            rule_type=ValidationType.RANGE,
+            params={"min": 18, "max": 65},
+        )
+
+        result = validator.validate_dataframe(df, [rule])
+
+        assert len(result.failures) == 1
+        assert result.failures[0].rule_id == 0
+        assert result.failures[0].record_indices.tolist() == [0, 3]
+        assert result.error_count == 2
+        assert result.invalid_records == 2
+        assert [issue.message for issue in result.errors] == [
+            "Field 'age' is out of range: 10 < 18",
+            "Field 'age' is out of range: 99 > 65",
+        ]
+
+    def test_partitions_match_serial_on_duplicate_index(self):
+        """Test partitioned validation counts rows, not index labels."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        validator = DataValidator()
+
+        df = pd.DataFrame(
+            {"email": [None, None, "a@example.com", None], "id": [1, 2, 2, 3]},
+            index=[0, 0, 1, 1],
+        )
+        rules = [
+            ValidationRule(field="email", rule_type=ValidationType.REQUIRED),
+            ValidationRule(field="id", rule_type=ValidationType.UNIQUE),
+        ]
+
+        serial = validator.validate_dataframe(df, rules)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            partitioned = validator.validate_partitions([df.iloc[:2], df.iloc[2:]], rules, executor)
+
+        assert serial.invalid_records == 4
+        assert partitioned.invalid_records == serial.invalid_records
+        assert partitioned.valid_records == serial.valid_records
+        assert partitioned.error_count == serial.error_count
+
 
 class TestDataTransformer:
     """Test data transformation."""
@@ -261,6 +652,94 @@ class TestDataTransformer:
 
         assert result.loc[0, "city_upper"] == "NEW YORK"
 
+    def test_concat_skips_nulls(self):
+        """Test concatenation skips null values without extra separators."""
+        transformer = DataTransformer()
+
+        from src.models.mapping import FieldMapping
+
+        df = pd.DataFrame({
+            "first": ["Ada", None, "Alan", None],
+            "middle": [None, None, "M", None],
+            "last": ["Lovelace", "Hopper", "Turing", None],
+        })
+        mapping = FieldMapping(
+            migration_id="test",
+            source_fields=["first", "middle", "last"],
+            target_fields=["name"],
+            mappings=[
+                MappingRule(
+                    source_field="first",
+                    target_field="name",
+                    transformation=TransformationType.CONCAT,
+                    additional_source_fields=["middle", "last"],
+                    transformation_params={"separator": "|"},
+                ),
+            ],
+        )
+
+        result = transformer.transform_dataframe(df, mapping)
+
+        assert result["name"].tolist() == ["Ada|Lovelace", "Hopper", "Alan|M|Turing", ""]
+
+    def test_lookup_transformation(self):
+        """Test lookup with unknown values falling back to the default."""
+        transformer = DataTransformer()
+
+        from src.models.mapping import FieldMapping
+
+        df = pd.DataFrame({"state": ["CA", "NY", "ZZ", None]})
+        mapping = FieldMapping(
+            migration_id="test",
+            source_fields=["state"],
+            target_fields=["state_name"],
+            mappings=[
+                MappingRule(
+                    source_field="state",
+                    target_field="state_name",
+                    transformation=TransformationType.LOOKUP,
+                    lookup_table={"CA": "California", "NY": "New York"},
+                    default_value="Unknown",
+                ),
+            ],
+        )
+
+        result = transformer.transform_dataframe(df, mapping)
+
+        assert result["state_name"].tolist() == [
+            "California", "New York", "Unknown", "Unknown",
+        ]
+
+    def test_compiled_plan_is_cached(self, sample_dataframe):
+        """Test plans are reused across migrations with the same mapping."""
+        transformer = DataTransformer()
+
+        from src.models.mapping import FieldMapping
+
+        def build_mapping(migration_id):
+            return FieldMapping(
+                migration_id=migration_id,
+                source_fields=["city"],
+                target_fields=["city"],
+                mappings=[
+                    MappingRule(
+                        source_field="city",
+                        target_field="city",
+                        transformation=TransformationType.REGEX,
+                        transformation_params={"pattern": r"\s+", "replacement": "_"},
+                    ),
+                ],
+                unmapped_target_fields=["country"],
+            )
+
+        plan = transformer.compile_mapping(build_mapping("nightly-1"))
+        assert transformer.compile_mapping(build_mapping("nightly-2")) is plan
+
+        result = plan.execute(sample_dataframe)
+        assert list(result.columns) == ["city", "country"]
+        assert result.loc[0, "city"] == "New_York"
+        assert result["country"].isna().all()
+
 
 class TestMigrationOrchestrator:
     """Test migration orchestration."""
@@ -315,3 +794,309 @@ class TestMigrationOrchestrator:
         assert migration.status.value == "completed"
         assert len(transformed_df) == len(sample_dataframe)
         assert migration.processed_records == len(sample_dataframe)
+
+    def test_parallel_validate_and_transform(self):
+        """Test partitioned validation and transformation on a process pool."""
+        from src.models.mapping import FieldMapping
+
+        df = pd.DataFrame({
+            "id": [1, 2, 3, 4, 5, 6, 7, 1],
+            "email": ["a@x.com", "bad", "c@x.com", "d@x.com",
+                      "e@x.com", "bad", "g@x.com", "h@x.com"],
+        })
+        rules = [
+            ValidationRule(
+                field="email",
+                rule_type=ValidationType.REGEX,
+                params={"pattern": r"^[^@]+@[^@]+$"},
+            ),
+            ValidationRule(field="id", rule_type=ValidationType.UNIQUE),
+        ]
+        mapping = FieldMapping(
+            migration_id="test",
+            source_fields=["email"],
+            target_fields=["email"],
+            mappings=[
+                MappingRule(
+                    source_field="email",
+                    target_field="email",
+                    transformation=TransformationType.UPPERCASE,
+                ),
+            ],
+        )
+
+        orchestrator = MigrationOrchestrator(max_workers=2, min_partition_rows=2)
+        try:
+            migration = orchestrator.create_migration(
+                name="Parallel Test",
+                source_type="csv",
+                target_type="csv",
+            )
+            migration = orchestrator.validate_data(migration, df, rules)
+            migration, transformed_df = orchestrator.transform_data(
+                migration, df, mapping
+            )
+        finally:
+            orchestrator.shutdown()
+
+        validate_step, transform_step = migration.steps
+        assert validate_step.metrics["partitions"] == 2
+        assert validate_step.metrics["error_count"] == 4
+        assert validate_step.metrics["invalid_records"] == 4
+
+        serial = DataValidator().validate_dataframe(df, rules)
+        assert validate_step.metrics["invalid_records"] == serial.invalid_records
+
+        assert transform_step.metrics["partitions"] == 2
+        assert transformed_df["email"].tolist() == df["email"].str.upper().tolist()
+
+    def test_streaming_migration_pipeline(self, sample_dataframe, tmp_path):
+        """Test chunked streaming migration between CSV connectors."""
+        from src.connectors.csv import CSVConnector
+        from src.models.mapping import FieldMapping
+
+        source_path = tmp_path / "source.csv"
+        target_path = tmp_path / "target.csv"
+        sample_dataframe.to_csv(source_path, index=False)
+
+        orchestrator = MigrationOrchestrator()
+        migration = orchestrator.create_migration(
+            name="Streaming Test",
+            source_type="csv",
+            target_type="csv",
+        )
+
+        mapping = FieldMapping(
+            migration_id=migration.id,
+            source_fields=["first_name", "last_name", "age"],
+            target_fields=["full_name", "age"],
+            mappings=[
+                MappingRule(
+                    source_field="first_name",
+                    target_field="full_name",
+                    transformation=TransformationType.CONCAT,
+                    additional_source_fields=["last_name"],
+                ),
+                MappingRule(source_field="age", target_field="age"),
+            ],
+        )
+        rules = [
+            ValidationRule(
+                field="age",
+                rule_type=ValidationType.RANGE,
+                params={"min": 18, "max": 30},
+            ),
+        ]
+
+        migration = orchestrator.execute_migration_streaming(
+            migration,
+            CSVConnector(str(source_path)),
+            CSVConnector(str(target_path)),
+            mapping,
+            validation_rules=rules,
+            chunk_size=2,
+        )
+
+        assert migration.status.value == "completed"
+        assert migration.total_records == 5
+        assert migration.processed_records == 5
+
+        steps = {step.name: step for step in migration.steps}
+        assert steps["profile_data"].metrics["chunks"] == 3
+        assert steps["profile_data"].metrics["total_records"] == 5
+        assert steps["validate_data"].metrics["invalid_records"] == 2
+        assert steps["write_data"].metrics["written_records"] == 5
+
+        written = pd.read_csv(target_path)
+        assert list(written.columns) == ["full_name", "age"]
+        assert written["full_name"].tolist()[-1] == "Charlie Brown"
+        assert len(written) == 5
+
+    def test_streaming_migration_unique_across_chunks(self, tmp_path):
+        """Test UNIQUE keys repeated from an earlier chunk are reported."""
+        from src.connectors.csv import CSVConnector
+        from src.models.mapping import FieldMapping
+
+        source_path = tmp_path / "source.csv"
+        pd.DataFrame({
+            # Chunks of two: a@ and b@ repeat earlier chunks, c@ does both
+            "email": ["a@x.com", "c@x.com", "a@x.com", "b@x.com", "c@x.com", "c@x.com", "b@x.com"],
+        }).to_csv(source_path, index=False)
+
+        orchestrator = MigrationOrchestrator()
+        migration = orchestrator.create_migration(
+            name="Unique Test", source_type="csv", target_type="csv"
+        )
+        mapping = FieldMapping(
+            migration_id=migration.id,
+            source_fields=["email"],
+            target_fields=["email"],
+            mappings=[MappingRule(source_field="email", target_field="email")],
+        )
+        rules = [ValidationRule(field="email", rule_type=ValidationType.UNIQUE)]
+
+        migration = orchestrator.execute_migration_streaming(
+            migration,
+            CSVConnector(str(source_path)),
+            CSVConnector(str(tmp_path / "target.csv")),
+            mapping,
+            validation_rules=rules,
+            chunk_size=2,
+        )
+
+        assert migration.status.value == "completed"
+        steps = {step.name: step for step in migration.steps}
+        # Rows 3, 5, 6 and 7; the two c@ rows are reported once each
+        assert steps["validate_data"].metrics["invalid_records"] == 4
+        assert steps["validate_data"].metrics["error_count"] == 4
+        assert migration.warnings == ["Validation found 4 errors"]
+
+    def test_streaming_migration_target_failure(self, sample_dataframe, tmp_path):
+        """Test streaming migration stops when the target rejects a chunk."""
+        from src.connectors.csv import CSVConnector
+        from src.models.mapping import FieldMapping
+
+        source_path = tmp_path / "source.csv"
+        sample_dataframe.to_csv(source_path, index=False)
+
+        orchestrator = MigrationOrchestrator()
+        migration = orchestrator.create_migration(
+            name="Streaming Failure",
+            source_type="csv",
+            target_type="csv",
+        )
+        mapping = FieldMapping(
+            migration_id=migration.id,
+            source_fields=["id"],
+            target_fields=["id"],
+            mappings=[MappingRule(source_field="id", target_field="id")],
+        )
+
+        migration = orchestrator.execute_migration_streaming(
+            migration,
+            CSVConnector(str(source_path)),
+            CSVConnector(str(tmp_path / "missing" / "target.csv")),
+            mapping,
+            chunk_size=2,
+        )
+
+        assert migration.status.value == "failed"
+        steps = {step.name: step for step in migration.steps}
+        assert steps["write_data"].status.value == "failed"
+        assert migration.processed_records == 0
+
+
+class TestRollbackManager:
+    """Test backup and restore."""
+
+    @pytest.mark.parametrize("backup_format", ["csv", "parquet", "arrow"])
+    def test_backup_round_trip(self, sample_dataframe, tmp_path, backup_format):
+        """Test full backups restore the original data."""
+        if backup_format != "csv":
+            pytest.importorskip("pyarrow")
+
+        from src.rollback.manager import RollbackManager
+
+        manager = RollbackManager(str(tmp_path), backup_format=backup_format)
+        backup_id = manager.create_backup("mig", sample_dataframe)
+
+        restored = manager.restore_backup(backup_id)
+
+        pd.testing.assert_frame_equal(restored, sample_dataframe)
+        assert manager.list_backups("mig")[0]["kind"] == "full"
+
+    @pytest.mark.parametrize("backup_format", ["csv", "arrow"])
+    def test_incremental_backup(self, sample_dataframe, tmp_path, backup_format):
+        """Test incremental backups store only changed rows."""
+        if backup_format != "csv":
+            pytest.importorskip("pyarrow")
+
+        from src.rollback.manager import RollbackManager
+
+        manager = RollbackManager(str(tmp_path), backup_format=backup_format)
+        manager.create_backup("mig", sample_dataframe, incremental=True)
+
+        updated = sample_dataframe.copy()
+        updated.loc[1, "city"] = "San Diego"
+        updated = pd.concat([
+            updated.drop(index=4),
+            pd.DataFrame([{
+                "id": 6, "first_name": "Eve", "last_name": "Adams",
+                "email": "eve@example.com", "age": 31, "city": "Denver",
+            }]),
+        ], ignore_index=True)
+
+        backup_id = manager.create_backup("mig", updated, incremental=True)
+        meta = manager.list_backups("mig")[0]
+
+        assert meta["backup_id"] == backup_id
+        assert meta["kind"] == "incremental"
+        assert meta["key_field"] == "id"
+        assert meta["stored_records"] == 2
+        assert meta["deleted_records"] == 1
+        assert meta["record_count"] == 5
+
+        restored = manager.restore_backup(backup_id).sort_values("id")
+        pd.testing.assert_frame_equal(
+            restored.reset_index(drop=True),
+            updated.sort_values("id").reset_index(drop=True),
+        )
+
+    def test_cleanup_keeps_incremental_parents(self, sample_dataframe, tmp_path):
+        """Test cleanup does not delete a snapshot a newer backup needs."""
+        import json
+        from src.rollback.manager import RollbackManager
+
+        manager = RollbackManager(str(tmp_path), backup_format="csv")
+        base_id = manager.create_backup("mig", sample_dataframe, incremental=True)
+        manager.create_backup("mig", sample_dataframe.head(3), incremental=True)
+
+        meta_file = tmp_path / base_id / "metadata.json"
+        meta = json.loads(meta_file.read_text())
+        meta["timestamp"] = "20000101_000000"
+        meta_file.write_text(json.dumps(meta))
+        manager.rebuild_catalog()
+        assert [b["backup_id"] for b in manager.catalog.older_than("20200101_000000")] == [base_id]
+
+        assert manager.cleanup_old_backups(days=30) == 0
+        assert len(manager.list_backups("mig")) == 2
+
+    def test_cleanup_deletes_unreferenced_backups(self, sample_dataframe, tmp_path):
+        """Test cleanup deletes an old full backup nothing depends on."""
+        import json
+        from src.rollback.manager import RollbackManager
+
+        manager = RollbackManager(str(tmp_path), backup_format="csv")
+        old_id = manager.create_backup("mig", sample_dataframe)
+        new_id = manager.create_backup("mig", sample_dataframe.head(3))
+
+        meta_file = tmp_path / old_id / "metadata.json"
+        meta = json.loads(meta_file.read_text())
+        meta["timestamp"] = "20000101_000000"
+        meta_file.write_text(json.dumps(meta))
+        manager.rebuild_catalog()
+
+        assert manager.cleanup_old_backups(days=30) == 1
+        assert [b["backup_id"] for b in manager.list_backups("mig")] == [new_id]
+        assert not (tmp_path / old_id).exists()
+
+    def test_catalog_rebuilt_when_missing(self, sample_dataframe, tmp_path):
+        """Test the backup catalog is rebuilt from backup directories."""
+        from src.rollback.manager import RollbackManager
+
+        manager = RollbackManager(str(tmp_path), backup_format="csv")
+        manager.create_backup("mig_1", sample_dataframe)
+        latest_id = manager.create_backup("mig_1", sample_dataframe.head(2))
+        manager.create_backup("mig_10", sample_dataframe)
+
+        (tmp_path / "catalog.db").unlink()
+
+        reopened = RollbackManager(str(tmp_path), backup_format="csv")
+        backups = reopened.list_backups("mig_1")
+
+        assert [b["backup_id"] for b in backups][0] == latest_id
+        assert len(backups) == 2
+        assert reopened.catalog.latest("mig_1")["record_count"] == 2
+
+        reopened.delete_backup(latest_id)
+        assert len(reopened.list_backups()) == 2
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Reorder Engine Benchmark
+
+Times a full reorder ranking of a synthetic catalog (one grouped query
+plus the numpy pass) and an incremental refresh after a sync touches a
+few hundred SKUs. Runs against a throwaway SQLite database.
+
+Usage:
+    python -m benchmarks.bench_reorder [--skus 100000] [--orders 200000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/orderhub-bench.db"
+os.environ["DEBUG"] = "false"
+
+from datetime import datetime, timedelta  # noqa: E402
+
+from sqlalchemy import insert  # noqa: E402
+
+from src.db.database import SessionLocal, init_db  # noqa: E402
+from src.models.order import Order, OrderItem, OrderStatus  # noqa: E402
+from src.models.product import Product  # noqa: E402
+from src.services.reorder import ReorderEngine  # noqa: E402
+
+
+def build_catalog(db, skus: int, orders: int, seed: int = 42):
+    """Insert products and a month of single-item orders."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    db.execute(insert(Product), [
+        {
+            "sku": f"SKU-{i:06d}",
+            "name": f"Product {i}",
+            "quantity_available": rng.randint(0, 500),
+            "quantity_reserved": 0,
+            "reorder_point": 10,
+            "reorder_quantity": 50,
+            "weight_unit": "lb",
+        }
+        for i in range(skus)
+    ])
+    db.execute(insert(Order), [
+        {
+            "id": i + 1,
+            "platform": "shopify",
+            "platform_order_id": f"ORD-{i}",
+            "status": OrderStatus.DELIVERED,
+            "order_date": now - timedelta(minutes=rng.randint(0, 40 * 24 * 60)),
+            "customer_name": "Customer",
+            "subtotal": 10,
+            "tax": 0,
+            "shipping_cost": 0,
+            "total": 10,
+            "currency": "USD",
+        }
+        for i in range(orders)
+    ])
+    db.execute(insert(OrderItem), [
+        {
+            "order_id": i + 1,
+            # Skewed demand: a few SKUs sell most of the units
+            "sku": f"SKU-{min(int(rng.paretovariate(1.2)) - 1, skus - 1):06d}"
+            if rng.random() < 0.5 else f"SKU-{rng.randrange(skus):06d}",
+            "product_name": "Product",
+            "quantity": rng.randint(1, 3),
+            "unit_price": 10,
+            "total_price": 10,
+        }
+        for i in range(orders)
+    ])
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--skus", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--dirty", type=int, default=300)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    build_catalog(db, args.skus, args.orders)
+
+    engine = ReorderEngine()
+
+    start = time.perf_counter()
+    suggestions = engine.get_reorder_list(db, limit=100)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.get_reorder_list(db, limit=100)
+    cached_time = time.perf_counter() - start
+
+    engine.mark_dirty(f"SKU-{i:06d}" for i in random.sample(range(args.skus), args.dirty))
+    start = time.perf_counter()
+    engine.get_reorder_list(db, limit=100)
+    incremental_time = time.perf_counter() - start
+
+    print(f"SKUs: {args.skus:,}  Orders: {args.orders:,}  Suggestions: {len(suggestions)}")
+    print(f"  full ranking:                {full_time * 1000:9.1f}ms")
+    print(f"  re-rank cached snapshot:     {cached_time * 1000:9.1f}ms")
+    print(f"  refresh {args.dirty} dirty SKUs:      {incremental_time * 1000:9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
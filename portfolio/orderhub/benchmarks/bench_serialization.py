@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Order Serialization Benchmark
+
+Compares the orjson field-plan serializer against the previous path of
+building OrderResponse models per order and letting FastAPI validate and
+encode them.
+
+Usage:
+    python -m benchmarks.bench_serialization [--orders 500] [--items 3]
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from pydantic import TypeAdapter
+
+from src.api.orders import OrderItemResponse, OrderResponse
+from src.api.serializers import ORJSON_AVAILABLE, orders_json
+from src.models.order import Order, OrderItem, OrderStatus
+
+
+def build_orders(count: int, items: int, seed: int = 42) -> List[Order]:
+    """Build unsaved order rows shaped like synced platform orders."""
+    rng = random.Random(seed)
+    statuses = list(OrderStatus)
+    now = datetime(2024, 6, 1, 12, 0, 0)
+    orders = []
+
+    for i in range(count):
+        order_items = [
+            OrderItem(
+                sku=f"SKU-{rng.randint(1, 200):04d}",
+                product_name=f"Product {j}",
+                quantity=rng.randint(1, 3),
+                unit_price=Decimal("19.99"),
+                total_price=Decimal("39.98"),
+                variant_title=rng.choice([None, "Large", "Blue"]),
+            )
+            for j in range(items)
+        ]
+        orders.append(Order(
+            id=i,
+            platform=rng.choice(["shopify", "amazon", "ebay", "etsy"]),
+            platform_order_id=f"ORD{100000 + i}",
+            platform_order_number=f"#{100000 + i}",
+            status=rng.choice(statuses),
+            order_date=now - timedelta(minutes=i),
+            customer_name=f"Customer {i}",
+            customer_email=f"customer{i}@example.com",
+            subtotal=Decimal("119.94"),
+            tax=Decimal("9.60"),
+            shipping_cost=Decimal("5.99"),
+            total=Decimal("135.53"),
+            currency="USD",
+            tracking_number=None,
+            carrier=None,
+            items=order_items,
+        ))
+
+    return orders
+
+
+def serialize_with_models(orders: List[Order]) -> bytes:
+    """Previous path: per-order models, then response_model validation and encoding."""
+    models = [
+        OrderResponse(
+            id=order.platform_order_id,
+            platform=order.platform,
+            order_number=order.platform_order_number,
+            status=order.status.value,
+            order_date=order.order_date.isoformat(),
+            customer_name=order.customer_name,
+            customer_email=order.customer_email,
+            subtotal=float(order.subtotal),
+            tax=float(order.tax),
+            shipping_cost=float(order.shipping_cost),
+            total=float(order.total),
+            currency=order.currency,
+            tracking_number=order.tracking_number,
+            carrier=order.carrier,
+            items=[
+                OrderItemResponse(
+                    sku=item.sku,
+                    name=item.product_name,
+                    quantity=item.quantity,
+                    unit_price=float(item.unit_price),
+                    total_price=float(item.total_price),
+                    variant_title=item.variant_title
+                )
+                for item in order.items
+            ]
+        )
+        for order in orders
+    ]
+    adapter = TypeAdapter(List[OrderResponse])
+    return adapter.dump_json(adapter.validate_python(models, from_attributes=True))
+
+
+def best_of(func, *args, repeat: int = 20) -> float:
+    """Fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--items", type=int, default=3)
+    args = parser.parse_args()
+
+    orders = build_orders(args.orders, args.items)
+    assert json.loads(serialize_with_models(orders)) == json.loads(orders_json(orders))
+
+    models_time = best_of(serialize_with_models, orders)
+    plan_time = best_of(orders_json, orders)
+
+    encoder = "orjson" if ORJSON_AVAILABLE else "json"
+    print(f"Orders: {args.orders:,}  Items per order: {args.items}  Encoder: {encoder}")
+    print(f"  pydantic models: {models_time * 1000:8.2f}ms")
+    print(f"  field plan:      {plan_time * 1000:8.2f}ms  ({models_time / plan_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
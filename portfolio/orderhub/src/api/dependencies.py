@@ -0,0 +1,13 @@
+"""Shared API dependencies."""
+
+from fastapi import Request
+
+from src.services.aggregator import OrderAggregator
+
+
+def get_aggregator(request: Request) -> OrderAggregator:
+    """Get the app's order aggregator, creating one if startup did not."""
+    aggregator = getattr(request.app.state, "aggregator", None)
+    if aggregator is None:
+        aggregator = request.app.state.aggregator = OrderAggregator()
+    return aggregator
@@ -2,14 +2,15 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from src.api.dependencies import get_aggregator
 from src.db.database import get_db
-from src.models.product import Product, InventoryLog
 from src.services.inventory import InventoryService
 from src.services.aggregator import OrderAggregator
+from src.services.reorder import get_reorder_engine
 
 router = APIRouter()
 
@@ -54,6 +55,16 @@ class InventoryLogResponse(BaseModel):
         from_attributes = True
 
 
+class ReorderResponse(BaseModel):
+    """Reorder suggestion response model."""
+    sku: str
+    quantity_available: int
+    reorder_point: int
+    daily_velocity: float
+    days_of_cover: Optional[float]
+    suggested_quantity: int
+
+
 class PlatformSyncResponse(BaseModel):
     """Platform sync response model."""
     sku: str
@@ -63,24 +74,30 @@ class PlatformSyncResponse(BaseModel):
 
 @router.get("/", response_model=List[ProductResponse])
 async def list_inventory(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     limit: int = Query(100, ge=1, le=500),
     low_stock: bool = Query(False, description="Show only low stock items"),
     db: Session = Depends(get_db),
 ):
     """
-    List all products in inventory.
+    List products in inventory by SKU.
 
-    - **skip**: Number of records to skip
+    The next page's cursor is returned in the **X-Next-Cursor** header
+    (absent on the last page).
+
+    - **cursor**: Cursor of the page to fetch
     - **limit**: Max records to return
     - **low_stock**: Filter for items at or below reorder point
     """
-    query = db.query(Product)
-
-    if low_stock:
-        query = query.filter(Product.quantity_available <= Product.reorder_point)
+    try:
+        page = InventoryService(db).list_products(low_stock=low_stock, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    products = query.offset(skip).limit(limit).all()
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    products = page.items
 
     return [
         ProductResponse(
@@ -99,6 +116,26 @@ async def list_inventory(
     ]
 
 
+@router.get("/reorder", response_model=List[ReorderResponse])
+async def get_reorder_list(
+    limit: int = Query(100, ge=1, le=1000, description="Max products to return"),
+    db: Session = Depends(get_db),
+):
+    """
+    List products to reorder, most urgent first.
+
+    Ranked by days of cover at the current sales velocity (blended 7- and
+    30-day order history). Includes products at or below their reorder
+    point and those that would run out before new stock arrives.
+
+    - **limit**: Max products to return
+    """
+    return [
+        ReorderResponse(**vars(suggestion))
+        for suggestion in get_reorder_engine().get_reorder_list(db, limit=limit)
+    ]
+
+
 @router.get("/{sku}", response_model=ProductResponse)
 async def get_product(
     sku: str,
@@ -140,7 +177,7 @@ async def update_inventory(
 
     - **sku**: Product SKU
     - **quantity**: New quantity (absolute, not delta)
-    - **sync_platforms**: Whether to sync to all platforms
+    - **sync_platforms**: Whether to queue a push to all platforms
     """
     service = InventoryService(db)
     product = service.get_product(sku)
@@ -151,19 +188,15 @@ async def update_inventory(
     # Calculate change
     quantity_change = update.quantity - product.quantity_available
 
-    # Update inventory
+    # Update inventory; the inventory outbox pushes it to the platforms
     updated_product = service.update_quantity(
         sku=sku,
         quantity_change=quantity_change,
         change_type="adjustment",
-        reason="Manual update via API"
+        reason="Manual update via API",
+        sync_platforms=update.sync_platforms,
     )
 
-    # Sync to platforms if requested
-    if update.sync_platforms:
-        aggregator = OrderAggregator()
-        aggregator.sync_inventory_across_platforms(sku, update.quantity)
-
     return ProductResponse(
         sku=updated_product.sku,
         name=updated_product.name,
@@ -183,6 +216,7 @@ async def sync_inventory(
     sku: str = Query(..., description="Product SKU"),
     quantity: int = Query(..., description="Quantity to sync"),
     db: Session = Depends(get_db),
+    aggregator: OrderAggregator = Depends(get_aggregator),
 ):
     """
     Sync inventory across all platforms.
@@ -197,8 +231,7 @@ async def sync_inventory(
         raise HTTPException(status_code=404, detail="Product not found")
 
     # Sync to all platforms
-    aggregator = OrderAggregator()
-    results = aggregator.sync_inventory_across_platforms(sku, quantity)
+    results = await aggregator.sync_inventory_across_platforms_async(sku, quantity)
 
     return PlatformSyncResponse(
         sku=sku,
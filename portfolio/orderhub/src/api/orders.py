@@ -1,15 +1,20 @@
 """Orders API endpoints."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from src.api.dependencies import get_aggregator
+from src.api.serializers import order_json_response
 from src.db.database import get_db
 from src.models.order import Order, OrderStatus
 from src.services.aggregator import OrderAggregator
+from src.services.queries import OrderFilters, OrderQueryService
+from src.services.scheduler import SyncJob, SyncScheduler
+from src.services.sync import OrderSyncService
 
 router = APIRouter()
 
@@ -50,77 +55,200 @@ class OrderUpdateRequest(BaseModel):
     carrier: Optional[str] = None
 
 
-class SyncResponse(BaseModel):
-    """Sync response model."""
-    success: bool
+class RevenueSummaryResponse(BaseModel):
+    """Revenue per platform per day response model."""
+    platform: str
+    day: str
+    orders: int
+    revenue: float
+
+
+class SkuSummaryResponse(BaseModel):
+    """Units sold per SKU response model."""
+    sku: str
+    units: int
+    orders: int
+    revenue: float
+
+
+class SyncJobResponse(BaseModel):
+    """Sync job response model."""
+    job_id: str
+    status: str
+    platforms: List[str]
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
     orders_synced: int
     platforms_synced: List[str]
-    timestamp: datetime
+    errors: Dict[str, str] = {}
+
+
+class PlatformSyncResponse(BaseModel):
+    """Per-platform sync metrics response model."""
+    platform: str
+    runs: int
+    failures: int
+    consecutive_failures: int
+    orders_synced: int
+    last_run_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    next_run_at: Optional[datetime] = None
+    lag_seconds: Optional[float] = None
+    throughput: Optional[float] = None
+
+
+class SyncStatusResponse(BaseModel):
+    """Background sync status response model."""
+    scheduler_running: bool
+    platforms: List[PlatformSyncResponse]
+
+
+def get_sync_scheduler(request: Request) -> SyncScheduler:
+    """Get the app's sync scheduler, creating an idle one if startup did not."""
+    scheduler = getattr(request.app.state, "sync_scheduler", None)
+    if scheduler is None:
+        scheduler = request.app.state.sync_scheduler = SyncScheduler()
+    return scheduler
+
+
+def get_order_filters(
+    platform: Optional[List[str]] = Query(None, description="Filter by platform (repeatable)"),
+    status: Optional[List[OrderStatus]] = Query(None, description="Filter by status (repeatable)"),
+    date_from: Optional[datetime] = Query(None, description="Orders placed at or after"),
+    date_to: Optional[datetime] = Query(None, description="Orders placed before"),
+    sku: Optional[str] = Query(None, description="Orders containing this SKU"),
+) -> OrderFilters:
+    """Order filters shared by the list and summary endpoints."""
+    return OrderFilters(
+        platforms=platform,
+        statuses=status,
+        date_from=date_from,
+        date_to=date_to,
+        sku=sku,
+    )
+
+
+def _job_response(job: SyncJob) -> SyncJobResponse:
+    """Convert a sync job to its response model."""
+    return SyncJobResponse(
+        job_id=job.id,
+        status=job.status.value,
+        platforms=job.platforms,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        orders_synced=job.orders_synced,
+        platforms_synced=job.platforms_synced,
+        errors=job.errors,
+    )
 
 
 @router.get("/", response_model=List[OrderResponse])
 async def list_orders(
-    platform: Optional[str] = Query(None, description="Filter by platform"),
-    status: Optional[OrderStatus] = Query(None, description="Filter by status"),
+    filters: OrderFilters = Depends(get_order_filters),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     limit: int = Query(100, ge=1, le=500, description="Max orders to return"),
     db: Session = Depends(get_db),
 ):
     """
-    List all orders from all platforms.
+    List synced orders from all platforms, newest first.
 
-    - **platform**: Filter by specific platform (shopify, amazon, ebay, etsy)
+    Served from the local order store; use **POST /sync** to pull new orders.
+    The next page's cursor is returned in the **X-Next-Cursor** header
+    (absent on the last page). Filters combine with AND.
+
+    - **platform**: Filter by platform (shopify, amazon, ebay, etsy)
     - **status**: Filter by order status
-    - **limit**: Maximum orders to return per platform
+    - **date_from** / **date_to**: Filter by order date
+    - **sku**: Filter to orders containing a SKU
+    - **cursor**: Cursor of the page to fetch
+    - **limit**: Maximum orders to return
     """
-    aggregator = OrderAggregator()
+    try:
+        page = OrderQueryService(db).list_orders(filters, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Determine which platforms to fetch from
-    platforms = [platform] if platform else None
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return order_json_response(page.items, headers=headers)
+
+
+@router.get("/summary/revenue", response_model=List[RevenueSummaryResponse])
+async def get_revenue_summary(
+    filters: OrderFilters = Depends(get_order_filters),
+    db: Session = Depends(get_db),
+):
+    """
+    Get order count and revenue per platform per day (UTC), newest first.
+
+    Accepts the same filters as the order list.
+    """
+    return OrderQueryService(db).revenue_by_platform_day(filters)
 
-    # Get orders from aggregator
-    orders = aggregator.get_all_orders(
-        limit_per_platform=limit,
-        platforms=platforms
-    )
 
-    # Filter by status if specified
-    if status:
-        orders = [o for o in orders if o.get("status") == status.value]
-
-    # Convert to response format
-    response_orders = []
-    for order in orders:
-        items = [
-            OrderItemResponse(
-                sku=item["sku"],
-                name=item["name"],
-                quantity=item["quantity"],
-                unit_price=float(item["unit_price"]),
-                total_price=float(item["total_price"]),
-                variant_title=item.get("variant_title")
+@router.get("/summary/skus", response_model=List[SkuSummaryResponse])
+async def get_sku_summary(
+    filters: OrderFilters = Depends(get_order_filters),
+    limit: int = Query(50, ge=1, le=500, description="Max SKUs to return"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get units sold and item revenue per SKU, best sellers first.
+
+    Accepts the same filters as the order list; **sku** limits the summary
+    to that SKU.
+    """
+    return OrderQueryService(db).units_by_sku(filters, limit=limit)
+
+
+@router.get("/sync", response_model=SyncStatusResponse)
+async def get_sync_status(
+    scheduler: SyncScheduler = Depends(get_sync_scheduler),
+):
+    """
+    Get background sync health per platform.
+
+    Includes lag (seconds since the last successful sync), throughput of
+    the last run (orders/second) and when the next run is due.
+    """
+    return SyncStatusResponse(
+        scheduler_running=scheduler.running,
+        platforms=[
+            PlatformSyncResponse(
+                platform=m.platform,
+                runs=m.runs,
+                failures=m.failures,
+                consecutive_failures=m.consecutive_failures,
+                orders_synced=m.orders_synced,
+                last_run_at=m.last_run_at,
+                last_success_at=m.last_success_at,
+                last_error=m.last_error,
+                next_run_at=m.next_run_at,
+                lag_seconds=m.lag_seconds,
+                throughput=m.throughput,
             )
-            for item in order.get("items", [])
+            for m in scheduler.metrics.values()
         ]
+    )
 
-        response_orders.append(OrderResponse(
-            id=order["id"],
-            platform=order["platform"],
-            order_number=order.get("order_number"),
-            status=order["status"],
-            order_date=order["order_date"],
-            customer_name=order["customer"]["name"],
-            customer_email=order["customer"].get("email"),
-            subtotal=float(order["subtotal"]),
-            tax=float(order["tax"]),
-            shipping_cost=float(order["shipping_cost"]),
-            total=float(order["total"]),
-            currency=order["currency"],
-            tracking_number=order.get("tracking_number"),
-            carrier=order.get("carrier"),
-            items=items
-        ))
-
-    return response_orders
+
+@router.get("/sync/{job_id}", response_model=SyncJobResponse)
+async def get_sync_job(
+    job_id: str,
+    scheduler: SyncScheduler = Depends(get_sync_scheduler),
+):
+    """
+    Get the status of a sync job started with **POST /sync**.
+
+    - **job_id**: ID returned when the sync was triggered
+    """
+    job = scheduler.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+
+    return _job_response(job)
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -133,43 +261,11 @@ async def get_order(
 
     - **order_id**: Platform-specific order ID
     """
-    # In demo mode, return from aggregator
-    aggregator = OrderAggregator()
-    orders = aggregator.get_all_orders(limit_per_platform=100)
-
-    order = next((o for o in orders if o["id"] == order_id), None)
+    order = OrderSyncService(db).get_order(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    items = [
-        OrderItemResponse(
-            sku=item["sku"],
-            name=item["name"],
-            quantity=item["quantity"],
-            unit_price=float(item["unit_price"]),
-            total_price=float(item["total_price"]),
-            variant_title=item.get("variant_title")
-        )
-        for item in order.get("items", [])
-    ]
-
-    return OrderResponse(
-        id=order["id"],
-        platform=order["platform"],
-        order_number=order.get("order_number"),
-        status=order["status"],
-        order_date=order["order_date"],
-        customer_name=order["customer"]["name"],
-        customer_email=order["customer"].get("email"),
-        subtotal=float(order["subtotal"]),
-        tax=float(order["tax"]),
-        shipping_cost=float(order["shipping_cost"]),
-        total=float(order["total"]),
-        currency=order["currency"],
-        tracking_number=order.get("tracking_number"),
-        carrier=order.get("carrier"),
-        items=items
-    )
+    return order_json_response(order)
 
 
 @router.patch("/{order_id}", response_model=OrderResponse)
@@ -177,6 +273,7 @@ async def update_order(
     order_id: str,
     update: OrderUpdateRequest,
     db: Session = Depends(get_db),
+    aggregator: OrderAggregator = Depends(get_aggregator),
 ):
     """
     Update an order's status and tracking information.
@@ -186,18 +283,14 @@ async def update_order(
     - **tracking_number**: Tracking number for shipments
     - **carrier**: Shipping carrier
     """
-    # Get the order first
-    aggregator = OrderAggregator()
-    orders = aggregator.get_all_orders(limit_per_platform=100)
-
-    order = next((o for o in orders if o["id"] == order_id), None)
+    order = OrderSyncService(db).get_order(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
     # Update on the platform
     if update.status:
         success = aggregator.sync_order_status(
-            platform=order["platform"],
+            platform=order.platform,
             order_id=order_id,
             status=update.status.value,
             tracking_number=update.tracking_number
@@ -207,70 +300,31 @@ async def update_order(
             raise HTTPException(status_code=500, detail="Failed to update order on platform")
 
         # Update local data
-        order["status"] = update.status.value
+        order.status = update.status
 
     if update.tracking_number:
-        order["tracking_number"] = update.tracking_number
+        order.tracking_number = update.tracking_number
 
     if update.carrier:
-        order["carrier"] = update.carrier
-
-    # Return updated order
-    items = [
-        OrderItemResponse(
-            sku=item["sku"],
-            name=item["name"],
-            quantity=item["quantity"],
-            unit_price=float(item["unit_price"]),
-            total_price=float(item["total_price"]),
-            variant_title=item.get("variant_title")
-        )
-        for item in order.get("items", [])
-    ]
-
-    return OrderResponse(
-        id=order["id"],
-        platform=order["platform"],
-        order_number=order.get("order_number"),
-        status=order["status"],
-        order_date=order["order_date"],
-        customer_name=order["customer"]["name"],
-        customer_email=order["customer"].get("email"),
-        subtotal=float(order["subtotal"]),
-        tax=float(order["tax"]),
-        shipping_cost=float(order["shipping_cost"]),
-        total=float(order["total"]),
-        currency=order["currency"],
-        tracking_number=order.get("tracking_number"),
-        carrier=order.get("carrier"),
-        items=items
-    )
+        order.carrier = update.carrier
+
+    db.commit()
+
+    return order_json_response(order)
 
 
-@router.post("/sync", response_model=SyncResponse)
+@router.post("/sync", response_model=SyncJobResponse, status_code=202)
 async def sync_orders(
     platforms: Optional[List[str]] = Query(None, description="Platforms to sync"),
-    db: Session = Depends(get_db),
+    scheduler: SyncScheduler = Depends(get_sync_scheduler),
 ):
     """
-    Force synchronization of orders from all platforms.
+    Start pulling new and updated orders into the local store.
+
+    Returns immediately with a job to poll at **GET /sync/{job_id}**.
+    Platforms already syncing are not synced twice; the job follows the
+    run in progress.
 
     - **platforms**: Optional list of specific platforms to sync
     """
-    aggregator = OrderAggregator()
-
-    # Get orders to trigger sync
-    orders = aggregator.get_all_orders(
-        limit_per_platform=100,
-        platforms=platforms
-    )
-
-    # Determine which platforms were synced
-    synced_platforms = list(set(order["platform"] for order in orders))
-
-    return SyncResponse(
-        success=True,
-        orders_synced=len(orders),
-        platforms_synced=synced_platforms,
-        timestamp=datetime.utcnow()
-    )
+    return _job_response(scheduler.trigger(platforms))
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from src.api.dependencies import get_aggregator
 from src.db.database import get_db
 from src.services.aggregator import OrderAggregator
 
@@ -29,13 +30,13 @@ class PlatformStatsResponse(BaseModel):
 @router.get("/", response_model=PlatformStatsResponse)
 async def list_platforms(
     db: Session = Depends(get_db),
+    aggregator: OrderAggregator = Depends(get_aggregator),
 ):
     """
     List all platforms and their connection status.
 
     Returns connection status, health check, and order counts for each platform.
     """
-    aggregator = OrderAggregator()
     stats = aggregator.get_platform_stats()
 
     platforms = []
@@ -67,22 +68,14 @@ async def list_platforms(
 async def check_platform_health(
     platform: str,
     db: Session = Depends(get_db),
+    aggregator: OrderAggregator = Depends(get_aggregator),
 ):
     """
     Check if a specific platform connection is healthy.
 
     - **platform**: Platform name (shopify, amazon, ebay, etsy)
     """
-    aggregator = OrderAggregator()
-
-    client_map = {
-        "shopify": aggregator.shopify,
-        "amazon": aggregator.amazon,
-        "ebay": aggregator.ebay,
-        "etsy": aggregator.etsy,
-    }
-
-    client = client_map.get(platform)
+    client = aggregator.clients.get(platform)
     if not client:
         return {"platform": platform, "healthy": False, "error": "Unknown platform"}
 
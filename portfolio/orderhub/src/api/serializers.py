@@ -0,0 +1,170 @@
+"""JSON serialization for order responses."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from fastapi import Response
+
+from src.models.order import Order
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# (response field, getter) pairs for platform order dicts
+FieldPlan = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+
+def _money(value: Union[Decimal, float, int, None]) -> float:
+    """Amount as a JSON number."""
+    return float(value) if value is not None else 0.0
+
+
+def _iso(value: Union[datetime, str]) -> str:
+    """Timestamp as an ISO 8601 string."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class RowPlan:
+    """
+    Precomputed mapping of ORM row attributes to response fields.
+
+    Rows are turned into plain dicts and encoded in one call, skipping
+    per-row pydantic model construction and validation. Loaded column
+    values are read straight from the instance ``__dict__`` with one
+    ``itemgetter`` call, which avoids a descriptor lookup per attribute;
+    rows with expired or unloaded attributes go through ``getattr``.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, str, Optional[Callable[[Any], Any]]]]):
+        """
+        Args:
+            fields: (response field, row attribute, converter or None) triples
+        """
+        self.names = tuple(name for name, _, _ in fields)
+        attributes = tuple(attribute for _, attribute, _ in fields)
+        self._from_state = itemgetter(*attributes)
+        self._from_attributes = attrgetter(*attributes)
+        self._converters = tuple(
+            (index, name, convert)
+            for index, (name, _, convert) in enumerate(fields)
+            if convert is not None
+        )
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        """Convert one row."""
+        try:
+            values = self._from_state(row.__dict__)
+        except KeyError:
+            values = self._from_attributes(row)
+
+        data = dict(zip(self.names, values))
+        for index, name, convert in self._converters:
+            data[name] = convert(values[index])
+        return data
+
+
+ORDER_ITEM_ROW_PLAN = RowPlan((
+    ("sku", "sku", None),
+    ("name", "product_name", None),
+    ("quantity", "quantity", None),
+    ("unit_price", "unit_price", _money),
+    ("total_price", "total_price", _money),
+    ("variant_title", "variant_title", None),
+))
+
+ORDER_ROW_PLAN = RowPlan((
+    ("id", "platform_order_id", None),
+    ("platform", "platform", None),
+    ("order_number", "platform_order_number", None),
+    ("status", "status", attrgetter("value")),
+    ("order_date", "order_date", _iso),
+    ("customer_name", "customer_name", None),
+    ("customer_email", "customer_email", None),
+    ("subtotal", "subtotal", _money),
+    ("tax", "tax", _money),
+    ("shipping_cost", "shipping_cost", _money),
+    ("total", "total", _money),
+    ("currency", "currency", None),
+    ("tracking_number", "tracking_number", None),
+    ("carrier", "carrier", None),
+    ("items", "items", lambda items: [ORDER_ITEM_ROW_PLAN.to_dict(item) for item in items]),
+))
+
+ORDER_ITEM_DICT_PLAN: FieldPlan = (
+    ("sku", lambda item: item["sku"]),
+    ("name", lambda item: item["name"]),
+    ("quantity", lambda item: item["quantity"]),
+    ("unit_price", lambda item: _money(item["unit_price"])),
+    ("total_price", lambda item: _money(item["total_price"])),
+    ("variant_title", lambda item: item.get("variant_title")),
+)
+
+ORDER_DICT_PLAN: FieldPlan = (
+    ("id", lambda order: order["id"]),
+    ("platform", lambda order: order["platform"]),
+    ("order_number", lambda order: order.get("order_number")),
+    ("status", lambda order: order["status"]),
+    ("order_date", lambda order: _iso(order["order_date"])),
+    ("customer_name", lambda order: (order.get("customer") or {}).get("name") or ""),
+    ("customer_email", lambda order: (order.get("customer") or {}).get("email")),
+    ("subtotal", lambda order: _money(order["subtotal"])),
+    ("tax", lambda order: _money(order.get("tax"))),
+    ("shipping_cost", lambda order: _money(order.get("shipping_cost"))),
+    ("total", lambda order: _money(order["total"])),
+    ("currency", lambda order: order.get("currency") or "USD"),
+    ("tracking_number", lambda order: order.get("tracking_number")),
+    ("carrier", lambda order: order.get("carrier")),
+)
+
+
+def order_to_dict(order: Union[Order, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a stored order or a platform order dict to the OrderResponse shape.
+
+    Args:
+        order: Order row (items loaded) or order in the platform client format
+
+    Returns:
+        JSON-ready dict
+    """
+    if isinstance(order, dict):
+        data = {name: get(order) for name, get in ORDER_DICT_PLAN}
+        data["items"] = [
+            {name: get(item) for name, get in ORDER_ITEM_DICT_PLAN}
+            for item in order.get("items", [])
+        ]
+        return data
+
+    return ORDER_ROW_PLAN.to_dict(order)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode JSON with orjson, or the standard library without it."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def orders_json(orders: Iterable[Union[Order, Dict[str, Any]]]) -> bytes:
+    """Encode a list of orders as a JSON array."""
+    return dumps([order_to_dict(order) for order in orders])
+
+
+def order_json_response(
+    order: Union[Order, Dict[str, Any], List[Union[Order, Dict[str, Any]]]],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Raw JSON response for one order or a list of orders.
+
+    FastAPI skips ``response_model`` validation for returned Responses, so
+    routes keep their models for the OpenAPI schema only.
+    """
+    content = orders_json(order) if isinstance(order, list) else dumps(order_to_dict(order))
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
+    # Cache
+    cache_max_entries: int = 1024
+    cache_health_ttl_seconds: int = 30
+    cache_orders_ttl_seconds: int = 60
+
     # CORS
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8000"]
 
@@ -49,8 +54,29 @@ class Settings(BaseSettings):
     etsy_access_token: str = ""
 
     # Sync settings
+    sync_enabled: bool = True
     sync_interval_minutes: int = 5
+    sync_jitter: float = 0.1
+    sync_max_backoff_minutes: int = 60
     max_orders_per_sync: int = 100
+    max_sync_pages: int = 50  # Per platform per sync, when catching up a backlog
+    platform_timeout_seconds: float = 10.0
+
+    # Platform HTTP sessions
+    platform_max_connections: int = 20
+    platform_keepalive_seconds: float = 30.0
+    platform_max_concurrency: int = 4
+
+    # Inventory push settings
+    inventory_push_enabled: bool = True
+    inventory_push_window_seconds: float = 5.0
+    inventory_push_max_backoff_seconds: float = 300.0
+
+    # Reorder settings
+    reorder_lead_time_days: float = 14.0
+    reorder_safety_days: float = 7.0
+    reorder_cover_days: float = 30.0
+    reorder_cache_seconds: int = 3600
 
     # Logging
     log_level: str = "INFO"
@@ -6,6 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from src.api import api_router
 from src.config import get_settings
 from src.db.database import init_db
+from src.services.aggregator import OrderAggregator
+from src.services.outbox import InventoryOutbox
+from src.services.registry import close_registry, get_registry
+from src.services.scheduler import SyncScheduler
 
 settings = get_settings()
 
@@ -32,11 +36,32 @@ app.include_router(api_router, prefix="/api")
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database, platform clients, background order sync and inventory push."""
     init_db()
+
+    # Platform clients, their connection pool and tokens live as long as the app
+    app.state.platform_registry = get_registry()
+    app.state.aggregator = OrderAggregator(registry=app.state.platform_registry)
+
+    app.state.sync_scheduler = SyncScheduler(aggregator=app.state.aggregator)
+    if settings.sync_enabled:
+        app.state.sync_scheduler.start()
+
+    app.state.inventory_outbox = InventoryOutbox(aggregator=app.state.aggregator)
+    if settings.inventory_push_enabled:
+        app.state.inventory_outbox.start()
+
     print(f"OrderHub started in {'DEMO' if settings.demo_mode else 'PRODUCTION'} mode")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background order sync and inventory push, then close platform connections."""
+    await app.state.sync_scheduler.stop()
+    await app.state.inventory_outbox.stop()
+    close_registry()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
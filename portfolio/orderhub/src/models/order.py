@@ -10,10 +10,12 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -36,17 +38,25 @@ class Order(Base):
     """Unified order from any platform."""
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # Sync upserts look orders up by their platform identity
+        UniqueConstraint("platform", "platform_order_id", name="uq_orders_platform_order"),
+        # Keyset pagination on (order_date, id), alone or after a platform/status filter
+        Index("ix_orders_order_date_id", "order_date", "id"),
+        Index("ix_orders_platform_order_date_id", "platform", "order_date", "id"),
+        Index("ix_orders_status_order_date_id", "status", "order_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Platform reference
-    platform = Column(String(20), nullable=False, index=True)
+    platform = Column(String(20), nullable=False)
     platform_order_id = Column(String(255), nullable=False, index=True)
     platform_order_number = Column(String(100), nullable=True)
 
     # Order details
-    status = Column(SQLEnum(OrderStatus), default=OrderStatus.PENDING, nullable=False, index=True)
-    order_date = Column(DateTime(timezone=True), nullable=False, index=True)
+    status = Column(SQLEnum(OrderStatus), default=OrderStatus.PENDING, nullable=False)
+    order_date = Column(DateTime(timezone=True), nullable=False)
 
     # Customer information
     customer_name = Column(String(255), nullable=False)
@@ -81,6 +91,7 @@ class Order(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     synced_at = Column(DateTime(timezone=True), nullable=True)
+    platform_updated_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
@@ -90,12 +101,16 @@ class OrderItem(Base):
     """Individual items in an order."""
 
     __tablename__ = "order_items"
+    __table_args__ = (
+        # SKU filters and per-SKU summaries
+        Index("ix_order_items_sku_order_id", "sku", "order_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Product reference
-    sku = Column(String(100), nullable=False, index=True)
+    sku = Column(String(100), nullable=False)
     product_name = Column(String(255), nullable=False)
 
     # Quantity and pricing
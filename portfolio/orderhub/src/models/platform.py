@@ -36,6 +36,8 @@ class PlatformConnection(Base):
     last_sync_status = Column(String(50), nullable=True)
     last_error = Column(Text, nullable=True)
     orders_synced = Column(Integer, default=0)
+    # High-water mark: newest platform-side order update seen so far
+    sync_cursor = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
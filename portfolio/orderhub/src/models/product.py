@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Column, DateTime, Integer, Numeric, String, Text
+from sqlalchemy import Column, DateTime, Integer, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.sql import func
 
 from src.db.database import Base
@@ -76,3 +76,27 @@ class InventoryLog(Base):
 
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class InventoryOutboxEntry(Base):
+    """A SKU whose available quantity still has to be pushed to a platform."""
+
+    __tablename__ = "inventory_outbox"
+    __table_args__ = (
+        # One pending push per SKU and platform; repeated changes coalesce
+        UniqueConstraint("sku", "platform", name="uq_inventory_outbox_sku_platform"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    sku = Column(String(100), nullable=False)
+    platform = Column(String(20), nullable=False)
+
+    # First and latest unpushed change
+    queued_at = Column(DateTime, nullable=False, index=True)
+    changed_at = Column(DateTime, nullable=False)
+
+    # Retry state
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
@@ -4,8 +4,10 @@ from src.services.aggregator import OrderAggregator
 from src.services.amazon import AmazonClient
 from src.services.ebay import EbayClient
 from src.services.etsy import EtsyClient
-from src.services.inventory import InventoryService
+from src.services.inventory import InventoryService, ReservationResult
+from src.services.registry import PlatformRegistry, get_registry
 from src.services.shopify import ShopifyClient
+from src.services.sync import OrderSyncService
 
 __all__ = [
     "OrderAggregator",
@@ -13,5 +15,9 @@ __all__ = [
     "EbayClient",
     "EtsyClient",
     "InventoryService",
+    "ReservationResult",
+    "PlatformRegistry",
+    "get_registry",
     "ShopifyClient",
+    "OrderSyncService",
 ]
@@ -1,113 +1,156 @@
 """Order aggregation service."""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from src.services.shopify import ShopifyClient
-from src.services.amazon import AmazonClient
-from src.services.ebay import EbayClient
-from src.services.etsy import EtsyClient
+from src.config import get_settings
+from src.services.cache import Cache, get_cache
+from src.services.registry import PlatformRegistry, get_registry
+
+settings = get_settings()
+
+PLATFORMS = ["shopify", "amazon", "ebay", "etsy"]
+
+# Platform clients are blocking, so calls run on a shared thread pool. A
+# call that times out keeps its thread until the client returns, hence the
+# headroom over one thread per platform.
+_executor = ThreadPoolExecutor(
+    max_workers=len(PLATFORMS) * 4,
+    thread_name_prefix="orderhub-platform",
+)
+
+
+@dataclass
+class AggregatedOrders:
+    """Orders gathered from several platforms, with per-platform failures."""
+
+    orders: List[Dict[str, Any]] = field(default_factory=list)
+    platforms: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def partial(self) -> bool:
+        """True if any requested platform failed or timed out."""
+        return bool(self.errors)
 
 
 class OrderAggregator:
     """Aggregate orders from multiple platforms."""
 
-    def __init__(self):
-        """Initialize aggregator with all platform clients."""
-        self.shopify = ShopifyClient()
-        self.amazon = AmazonClient()
-        self.ebay = EbayClient()
-        self.etsy = EtsyClient()
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, float]] = None,
+        cache: Optional[Cache] = None,
+        registry: Optional[PlatformRegistry] = None,
+    ):
+        """
+        Initialize aggregator with all platform clients.
+
+        Args:
+            timeouts: Per-platform call timeouts in seconds; platforms not
+                listed use ``platform_timeout_seconds``
+            cache: Cache for platform health and order pages (defaults to
+                the shared cache)
+            registry: Source of the platform clients and their concurrency
+                limits (defaults to the shared registry)
+        """
+        self.registry = registry or get_registry()
+        self.shopify = self.registry.clients["shopify"]
+        self.amazon = self.registry.clients["amazon"]
+        self.ebay = self.registry.clients["ebay"]
+        self.etsy = self.registry.clients["etsy"]
+        self.timeouts = timeouts or {}
+        self.cache = cache or get_cache()
+
+    @property
+    def clients(self) -> Dict[str, Any]:
+        """Platform clients by platform name."""
+        return {
+            "shopify": self.shopify,
+            "amazon": self.amazon,
+            "ebay": self.ebay,
+            "etsy": self.etsy,
+        }
 
     def get_all_orders(
         self,
         limit_per_platform: int = 50,
-        platforms: Optional[List[str]] = None
+        platforms: Optional[List[str]] = None,
+        since: Optional[Dict[str, datetime]] = None,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Fetch and aggregate orders from all platforms.
 
+        Platforms are queried concurrently; ones that fail or time out are
+        left out of the result.
+
         Args:
             limit_per_platform: Max orders to fetch per platform
             platforms: List of platforms to fetch from (None = all)
+            since: Per-platform time to fetch orders updated since
+            use_cache: Serve full (non-incremental) pages from the cache
 
         Returns:
             Aggregated list of orders sorted by date (newest first)
         """
-        all_orders = []
+        calls = self._order_calls(limit_per_platform, platforms, since, use_cache)
+        return self._merge_orders(*self._fan_out(calls)).orders
 
-        # Determine which platforms to query
-        active_platforms = platforms or ["shopify", "amazon", "ebay", "etsy"]
+    async def get_all_orders_async(
+        self,
+        limit_per_platform: int = 50,
+        platforms: Optional[List[str]] = None,
+        since: Optional[Dict[str, datetime]] = None,
+        use_cache: bool = True,
+    ) -> AggregatedOrders:
+        """
+        Fetch orders from all platforms concurrently without blocking the event loop.
 
-        # Fetch from each platform
-        if "shopify" in active_platforms:
-            try:
-                shopify_orders = self.shopify.get_orders(limit=limit_per_platform)
-                all_orders.extend(shopify_orders)
-            except Exception as e:
-                print(f"Error fetching Shopify orders: {e}")
+        The call takes as long as the slowest platform, capped by its timeout.
 
-        if "amazon" in active_platforms:
-            try:
-                amazon_orders = self.amazon.get_orders(limit=limit_per_platform)
-                all_orders.extend(amazon_orders)
-            except Exception as e:
-                print(f"Error fetching Amazon orders: {e}")
+        Args:
+            limit_per_platform: Max orders to fetch per platform
+            platforms: List of platforms to fetch from (None = all)
+            since: Per-platform time to fetch orders updated since
+            use_cache: Serve full (non-incremental) pages from the cache
 
-        if "ebay" in active_platforms:
-            try:
-                ebay_orders = self.ebay.get_orders(limit=limit_per_platform)
-                all_orders.extend(ebay_orders)
-            except Exception as e:
-                print(f"Error fetching eBay orders: {e}")
+        Returns:
+            AggregatedOrders sorted by date (newest first), with an error
+            message for each platform that failed or timed out
+        """
+        calls = self._order_calls(limit_per_platform, platforms, since, use_cache)
+        return self._merge_orders(*await self._fan_out_async(calls))
 
-        if "etsy" in active_platforms:
-            try:
-                etsy_orders = self.etsy.get_orders(limit=limit_per_platform)
-                all_orders.extend(etsy_orders)
-            except Exception as e:
-                print(f"Error fetching Etsy orders: {e}")
+    def get_platform_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for each platform.
 
-        # Sort by order date (newest first)
-        all_orders.sort(
-            key=lambda x: datetime.fromisoformat(x["order_date"]),
-            reverse=True
-        )
+        Health and order counts are cached per platform
+        (``cache_health_ttl_seconds`` / ``cache_orders_ttl_seconds``), so
+        repeated polling does not reach the marketplaces.
+        """
+        calls = {
+            platform: (lambda platform=platform, client=client: self._platform_stats(platform, client))
+            for platform, client in self.clients.items()
+        }
+        results, errors = self._fan_out(calls)
 
-        return all_orders
+        for platform, error in errors.items():
+            print(f"Error getting {platform} stats: {error}")
 
-    def get_platform_stats(self) -> Dict[str, Any]:
-        """Get statistics for each platform."""
-        stats = {
-            "shopify": {
-                "connected": self.shopify.health_check(),
-                "orders_count": 0,
-            },
-            "amazon": {
-                "connected": self.amazon.health_check(),
-                "orders_count": 0,
-            },
-            "ebay": {
-                "connected": self.ebay.health_check(),
-                "orders_count": 0,
-            },
-            "etsy": {
-                "connected": self.etsy.health_check(),
-                "orders_count": 0,
-            },
+        return {
+            platform: results.get(platform, {"connected": False, "orders_count": 0})
+            for platform in self.clients
         }
 
-        # Count orders per platform
-        try:
-            all_orders = self.get_all_orders()
-            for order in all_orders:
-                platform = order.get("platform")
-                if platform in stats:
-                    stats[platform]["orders_count"] += 1
-        except Exception as e:
-            print(f"Error getting platform stats: {e}")
-
-        return stats
+    def invalidate_platform(self, platform: str):
+        """Drop cached health, counts and order pages of a platform."""
+        self.cache.invalidate(f"platform:{platform}:")
 
     def sync_order_status(
         self,
@@ -128,18 +171,16 @@ class OrderAggregator:
         Returns:
             True if update successful
         """
-        client_map = {
-            "shopify": self.shopify,
-            "amazon": self.amazon,
-            "ebay": self.ebay,
-            "etsy": self.etsy,
-        }
-
-        client = client_map.get(platform)
+        client = self.clients.get(platform)
         if not client:
             raise ValueError(f"Unknown platform: {platform}")
 
-        return client.update_order_status(order_id, status, tracking_number)
+        success = self.registry.limited(platform, client.update_order_status)(
+            order_id, status, tracking_number
+        )
+        if success:
+            self.invalidate_platform(platform)
+        return success
 
     def sync_inventory_across_platforms(self, sku: str, quantity: int) -> Dict[str, bool]:
         """
@@ -152,20 +193,215 @@ class OrderAggregator:
         Returns:
             Dict of platform: success status
         """
-        results = {}
+        results, errors = self._fan_out(self._inventory_calls(sku, quantity))
+        return self._inventory_status(results, errors)
 
-        clients = {
-            "shopify": self.shopify,
-            "amazon": self.amazon,
-            "ebay": self.ebay,
-            "etsy": self.etsy,
+    async def sync_inventory_across_platforms_async(
+        self, sku: str, quantity: int
+    ) -> Dict[str, bool]:
+        """
+        Sync inventory quantity to all platforms concurrently.
+
+        Args:
+            sku: Product SKU
+            quantity: New quantity
+
+        Returns:
+            Dict of platform: success status
+        """
+        results, errors = await self._fan_out_async(self._inventory_calls(sku, quantity))
+        return self._inventory_status(results, errors)
+
+    async def push_inventory_async(
+        self, platform: str, quantities: Dict[str, int]
+    ) -> Dict[str, bool]:
+        """
+        Push many SKU quantities to one platform in a single bulk call.
+
+        Args:
+            platform: Platform name
+            quantities: Quantity per SKU, at most the client's
+                ``max_inventory_batch`` entries
+
+        Returns:
+            Dict of SKU: success status
+
+        Raises:
+            TimeoutError: If the platform does not answer within its timeout
+        """
+        client = self.clients[platform]
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(
+                    _executor,
+                    self.registry.limited(platform, client.sync_inventory_bulk),
+                    quantities,
+                ),
+                timeout=self._timeout(platform),
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out after {self._timeout(platform):g}s")
+
+    def _timeout(self, platform: str) -> float:
+        """Call timeout for a platform, in seconds."""
+        return self.timeouts.get(platform, settings.platform_timeout_seconds)
+
+    def _order_calls(
+        self,
+        limit_per_platform: int,
+        platforms: Optional[List[str]],
+        since: Optional[Dict[str, datetime]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Callable[[], Any]]:
+        """Order fetches for the requested platforms."""
+        active_platforms = platforms or PLATFORMS
+        since = since or {}
+        return {
+            platform: (
+                lambda platform=platform, client=client: self._fetch_orders(
+                    platform, client, limit_per_platform, since.get(platform), use_cache
+                )
+            )
+            for platform, client in self.clients.items()
+            if platform in active_platforms
         }
 
-        for platform, client in clients.items():
+    def _fetch_orders(
+        self,
+        platform: str,
+        client: Any,
+        limit: int,
+        updated_since: Optional[datetime] = None,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of orders; full pages go through the cache."""
+        if updated_since or not use_cache:
+            return client.get_orders(limit=limit, updated_since=updated_since)
+
+        return self.cache.get_or_set(
+            f"platform:{platform}:orders:{limit}",
+            lambda: client.get_orders(limit=limit),
+            ttl=settings.cache_orders_ttl_seconds,
+        )
+
+    def _platform_stats(self, platform: str, client: Any) -> Dict[str, Any]:
+        """Cached health and order count of one platform."""
+        connected = self.cache.get_or_set(
+            f"platform:{platform}:health",
+            client.health_check,
+            ttl=settings.cache_health_ttl_seconds,
+        )
+
+        # Count orders per platform
+        try:
+            orders_count = self.cache.get_or_set(
+                f"platform:{platform}:orders_count",
+                lambda: len(self._fetch_orders(platform, client, limit=50)),
+                ttl=settings.cache_orders_ttl_seconds,
+            )
+        except Exception as e:
+            print(f"Error counting {platform} orders: {e}")
+            orders_count = 0
+
+        return {"connected": connected, "orders_count": orders_count}
+
+    def _inventory_calls(self, sku: str, quantity: int) -> Dict[str, Callable[[], Any]]:
+        """Inventory pushes to every platform."""
+        return {
+            platform: (lambda client=client: client.sync_inventory(sku, quantity))
+            for platform, client in self.clients.items()
+        }
+
+    def _fan_out(
+        self, calls: Dict[str, Callable[[], Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Run platform calls concurrently, blocking until each finishes or times out."""
+        started = time.monotonic()
+        futures = {
+            platform: _executor.submit(self.registry.limited(platform, call))
+            for platform, call in calls.items()
+        }
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for platform, future in futures.items():
+            timeout = self._timeout(platform)
+            remaining = max(0.0, started + timeout - time.monotonic())
             try:
-                results[platform] = client.sync_inventory(sku, quantity)
+                results[platform] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                errors[platform] = f"Timed out after {timeout:g}s"
             except Exception as e:
-                print(f"Error syncing inventory to {platform}: {e}")
-                results[platform] = False
+                errors[platform] = str(e) or type(e).__name__
+
+        return results, errors
+
+    async def _fan_out_async(
+        self, calls: Dict[str, Callable[[], Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Run platform calls concurrently on the thread pool and await them."""
+        loop = asyncio.get_running_loop()
+        platforms = list(calls)
+
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    loop.run_in_executor(
+                        _executor, self.registry.limited(platform, calls[platform])
+                    ),
+                    timeout=self._timeout(platform),
+                )
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for platform, outcome in zip(platforms, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                errors[platform] = f"Timed out after {self._timeout(platform):g}s"
+            elif isinstance(outcome, Exception):
+                errors[platform] = str(outcome) or type(outcome).__name__
+            else:
+                results[platform] = outcome
+
+        return results, errors
+
+    def _merge_orders(
+        self, results: Dict[str, Any], errors: Dict[str, str]
+    ) -> AggregatedOrders:
+        """Combine per-platform order lists, newest first."""
+        for platform, error in errors.items():
+            print(f"Error fetching {platform} orders: {error}")
 
-        return results
+        all_orders = [order for orders in results.values() for order in orders]
+
+        # Sort by order date (newest first)
+        all_orders.sort(
+            key=lambda x: datetime.fromisoformat(x["order_date"]),
+            reverse=True
+        )
+
+        return AggregatedOrders(orders=all_orders, platforms=list(results), errors=errors)
+
+    def _inventory_status(
+        self, results: Dict[str, Any], errors: Dict[str, str]
+    ) -> Dict[str, bool]:
+        """
+        Success flag per platform; failures and timeouts count as unsuccessful.
+
+        Cached platform data is dropped, since a push may have landed even
+        where the call failed.
+        """
+        for platform, error in errors.items():
+            print(f"Error syncing inventory to {platform}: {error}")
+
+        for platform in self.clients:
+            self.invalidate_platform(platform)
+
+        return {
+            platform: bool(results.get(platform, False))
+            for platform in self.clients
+        }
@@ -2,23 +2,34 @@
 
 import random
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
 
 from src.config import get_settings
 from src.models.order import OrderStatus
+from src.services.sessions import TokenCache, default_session
 
 settings = get_settings()
 
+# Login with Amazon token endpoint (refresh token -> SP-API access token)
+LWA_TOKEN_URL = "https://api.amazon.com/auth/o2/token"
+
 
 class AmazonClient:
     """Client for Amazon SP-API."""
 
+    # Most SKUs one bulk inventory request may carry
+    max_inventory_batch = 1
+
     def __init__(
         self,
         refresh_token: str = "",
         client_id: str = "",
         client_secret: str = "",
         region: str = "us-east-1",
+        session: Optional[httpx.Client] = None,
+        tokens: Optional[TokenCache] = None,
     ):
         """Initialize Amazon SP-API client."""
         self.refresh_token = refresh_token or settings.amazon_refresh_token
@@ -29,22 +40,44 @@ class AmazonClient:
         self.demo_mode = settings.demo_mode or not all([
             self.refresh_token, self.client_id, self.client_secret
         ])
+        # Shared keep-alive session and access tokens; demo mode makes no requests
+        self.session = session or (None if self.demo_mode else default_session())
+        self.tokens = tokens or TokenCache()
 
-    def get_orders(self, limit: int = 50, created_after: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Fetch orders from Amazon."""
+    def get_orders(
+        self,
+        limit: int = 50,
+        created_after: Optional[datetime] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch orders from Amazon, optionally only those updated since a time.
+
+        Orders updated since a time come back oldest update first, so a
+        caller can page through them by moving ``updated_since`` forward.
+        """
         if self.demo_mode:
-            return self._get_demo_orders(limit)
+            orders = self._get_demo_orders(limit)
+            if updated_since:
+                orders = sorted(
+                    (o for o in orders if datetime.fromisoformat(o["order_date"]) >= updated_since),
+                    key=lambda o: o["order_date"],
+                )
+            return orders
 
         # Real implementation would use Amazon SP-API
-        # from sp_api.api import Orders
-        # from sp_api.base import Marketplaces
-        #
-        # orders_api = Orders(
-        #     refresh_token=self.refresh_token,
-        #     marketplace=Marketplaces[self.region.upper().replace('-', '_')]
+        # response = self.session.get(
+        #     f"{self._endpoint()}/orders/v0/orders",
+        #     headers={"x-amz-access-token": self._access_token()},
+        #     params={
+        #         "MarketplaceIds": self.marketplace_id,
+        #         "CreatedAfter": created_after,
+        #         "LastUpdatedAfter": updated_since,
+        #         "SortOrder": "ASC",  # by LastUpdateDate
+        #         "MaxResultsPerPage": limit,
+        #     },
         # )
-        # response = orders_api.get_orders(CreatedAfter=created_after, MaxResultsPerPage=limit)
-        # return [self._format_order(order) for order in response.payload.get('Orders', [])]
+        # return [self._format_order(order) for order in response.json()["payload"].get("Orders", [])]
 
         return []
 
@@ -75,6 +108,42 @@ class AmazonClient:
         # Real implementation would use FBAInventory API
         return False
 
+    def sync_inventory_bulk(self, quantities: Dict[str, int]) -> Dict[str, bool]:
+        """Sync many inventory quantities to Amazon; success per SKU."""
+        if self.demo_mode:
+            return {sku: True for sku in quantities}
+
+        # Real implementation would patch each listing's fulfillment
+        # availability through the Listings Items API
+        return {sku: False for sku in quantities}
+
+    def _access_token(self) -> str:
+        """SP-API access token, exchanged once per hour rather than per call."""
+        return self.tokens.get(f"amazon:{self.client_id}", self._exchange_refresh_token)
+
+    def _exchange_refresh_token(self) -> Tuple[str, float]:
+        """Exchange the refresh token for an access token and its lifetime."""
+        response = self.session.post(
+            LWA_TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            },
+        )
+        response.raise_for_status()
+        payload = response.json()
+        return payload["access_token"], float(payload.get("expires_in", 3600))
+
+    def _endpoint(self) -> str:
+        """SP-API base URL for the configured region."""
+        if self.region.startswith("eu"):
+            return "https://sellingpartnerapi-eu.amazon.com"
+        if self.region.startswith("us-west"):
+            return "https://sellingpartnerapi-fe.amazon.com"
+        return "https://sellingpartnerapi-na.amazon.com"
+
     def _get_demo_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Generate demo orders for testing."""
         demo_orders = []
@@ -96,7 +165,7 @@ class AmazonClient:
             order_date = datetime.now() - timedelta(days=random.randint(0, 30))
 
             order = {
-                "id": f"AMZ{2000 + i}-{random.randint(1000000, 9999999)}",
+                "id": f"AMZ{2000 + i}-{1000000 + (2000 + i) * 7919 % 9000000}",
                 "order_number": f"AMZ-{2000 + i}",
                 "platform": "amazon",
                 "status": status.value,
@@ -140,4 +209,7 @@ class AmazonClient:
         if self.demo_mode:
             return True
 
-        return bool(self.refresh_token and self.client_id and self.client_secret)
+        try:
+            return bool(self._access_token())
+        except httpx.HTTPError:
+            return False
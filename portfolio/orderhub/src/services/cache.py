@@ -0,0 +1,239 @@
+"""Response cache backed by Redis, with an in-process fallback."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.config import get_settings
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+settings = get_settings()
+
+# How long a loader may hold the cross-process lock on a key, and how often
+# waiters check whether it has filled the key
+LOCK_TIMEOUT_SECONDS = 10.0
+LOCK_POLL_SECONDS = 0.05
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU store with per-key expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a live value, refreshing its recency."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float):
+        """Store a value, evicting the least recently used beyond capacity."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Store a value only if the key is absent; True if stored."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._entries[key] = (time.monotonic() + ttl, value)
+            return True
+
+    def delete(self, key: str):
+        """Remove a key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        """Remove every key starting with ``prefix``."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisBackend:
+    """Redis store; keys are namespaced so invalidation never touches other data."""
+
+    def __init__(self, client: Any, namespace: str = "orderhub:cache:"):
+        self.client = client
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.namespace + key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: float):
+        self.client.set(self.namespace + key, value, px=int(ttl * 1000))
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        return bool(self.client.set(self.namespace + key, value, px=int(ttl * 1000), nx=True))
+
+    def delete(self, key: str):
+        self.client.delete(self.namespace + key)
+
+    def delete_prefix(self, prefix: str):
+        keys = list(self.client.scan_iter(match=f"{self.namespace}{prefix}*", count=500))
+        if keys:
+            self.client.delete(*keys)
+
+
+class Cache:
+    """
+    JSON value cache with per-key TTLs and single-flight loading.
+
+    When a key is missing, only one caller runs its loader: threads in this
+    process wait on a local lock, and other processes wait on a short-lived
+    lock key in the backend, then read the value the winner stored. If the
+    backend fails mid-request the loader runs uncached rather than erroring.
+    """
+
+    def __init__(self, backend: Any):
+        self.backend = backend
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Get a cached value, or None."""
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            print(f"Cache read failed for {key}: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Cache a JSON-serializable value for ``ttl`` seconds."""
+        try:
+            self.backend.set(key, json.dumps(value, default=str), ttl)
+        except Exception as e:
+            print(f"Cache write failed for {key}: {e}")
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        Get a cached value, loading and caching it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Computes the value; called at most once per miss
+            ttl: Seconds to keep the loaded value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._key_lock(key):
+            # Another thread may have filled the key while we waited
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            acquired = self._acquire(key)
+            if not acquired:
+                value = self._wait_for(key)
+                if value is not None:
+                    return value
+
+            try:
+                value = loader()
+                self.set(key, value, ttl)
+                return value
+            finally:
+                if acquired:
+                    self._release(key)
+
+    def invalidate(self, prefix: str):
+        """Drop every cached key starting with ``prefix``."""
+        try:
+            self.backend.delete_prefix(prefix)
+        except Exception as e:
+            print(f"Cache invalidation failed for {prefix}: {e}")
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Process-local lock serializing loads of one key."""
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _acquire(self, key: str) -> bool:
+        """Take the cross-process load lock of a key."""
+        try:
+            return self.backend.add(f"lock:{key}", "1", LOCK_TIMEOUT_SECONDS)
+        except Exception:
+            return False
+
+    def _release(self, key: str):
+        """Release the cross-process load lock of a key."""
+        try:
+            self.backend.delete(f"lock:{key}")
+        except Exception:
+            pass
+
+    def _wait_for(self, key: str) -> Any:
+        """Wait for another process to fill a key; None if its lock expires first."""
+        deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_SECONDS)
+            value = self.get(key)
+            if value is not None:
+                return value
+            try:
+                if self.backend.get(f"lock:{key}") is None:
+                    return None
+            except Exception:
+                return None
+        return None
+
+
+def create_cache(redis_url: Optional[str] = None) -> Cache:
+    """
+    Create a cache on Redis, falling back to an in-process LRU.
+
+    Args:
+        redis_url: Redis connection URL (defaults to ``redis_url`` setting)
+
+    Returns:
+        Cache instance
+    """
+    if REDIS_AVAILABLE:
+        try:
+            client = redis.Redis.from_url(
+                redis_url or settings.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+            client.ping()
+            return Cache(RedisBackend(client))
+        except Exception as e:
+            print(f"Redis unavailable, using in-process cache: {e}")
+
+    return Cache(MemoryBackend(settings.cache_max_entries))
+
+
+@lru_cache()
+def get_cache() -> Cache:
+    """Get shared cache instance."""
+    return create_cache()
@@ -2,23 +2,37 @@
 
 import random
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
 
 from src.config import get_settings
 from src.models.order import OrderStatus
+from src.services.sessions import TokenCache, default_session
 
 settings = get_settings()
 
+# OAuth token endpoints (refresh token -> user access token)
+TOKEN_URLS = {
+    "production": "https://api.ebay.com/identity/v1/oauth2/token",
+    "sandbox": "https://api.sandbox.ebay.com/identity/v1/oauth2/token",
+}
+
 
 class EbayClient:
     """Client for eBay Trading API."""
 
+    # Most SKUs one bulk inventory request may carry
+    max_inventory_batch = 25
+
     def __init__(
         self,
         app_id: str = "",
         cert_id: str = "",
         dev_id: str = "",
         user_token: str = "",
+        session: Optional[httpx.Client] = None,
+        tokens: Optional[TokenCache] = None,
     ):
         """Initialize eBay client."""
         self.app_id = app_id or settings.ebay_app_id
@@ -29,11 +43,30 @@ class EbayClient:
         self.demo_mode = settings.demo_mode or not all([
             self.app_id, self.cert_id, self.dev_id, self.user_token
         ])
+        # Shared keep-alive session and access tokens; demo mode makes no requests
+        self.session = session or (None if self.demo_mode else default_session())
+        self.tokens = tokens or TokenCache()
 
-    def get_orders(self, limit: int = 50, days: int = 30) -> List[Dict[str, Any]]:
-        """Fetch orders from eBay."""
+    def get_orders(
+        self,
+        limit: int = 50,
+        days: int = 30,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch orders from eBay, optionally only those updated since a time.
+
+        Orders updated since a time come back oldest update first, so a
+        caller can page through them by moving ``updated_since`` forward.
+        """
         if self.demo_mode:
-            return self._get_demo_orders(limit)
+            orders = self._get_demo_orders(limit)
+            if updated_since:
+                orders = sorted(
+                    (o for o in orders if datetime.fromisoformat(o["order_date"]) >= updated_since),
+                    key=lambda o: o["order_date"],
+                )
+            return orders
 
         # Real implementation would use eBay Trading API
         # from ebaysdk.trading import Connection as Trading
@@ -42,14 +75,21 @@ class EbayClient:
         #     appid=self.app_id,
         #     certid=self.cert_id,
         #     devid=self.dev_id,
-        #     token=self.user_token,
+        #     iaf_token=self._access_token(),
         #     config_file=None
         # )
+        # # Incremental syncs ask for orders modified since the last one
+        # window = (
+        #     {'ModTimeFrom': updated_since.isoformat(), 'ModTimeTo': datetime.now().isoformat()}
+        #     if updated_since else
+        #     {'CreateTimeFrom': (datetime.now() - timedelta(days=days)).isoformat(),
+        #      'CreateTimeTo': datetime.now().isoformat()}
+        # )
         # response = api.execute('GetOrders', {
-        #     'CreateTimeFrom': (datetime.now() - timedelta(days=days)).isoformat(),
-        #     'CreateTimeTo': datetime.now().isoformat(),
+        #     **window,
         #     'OrderRole': 'Seller',
         #     'OrderStatus': 'All',
+        #     'SortingOrder': 'Ascending',
         # })
         # return [self._format_order(order) for order in response.dict().get('OrderArray', {}).get('Order', [])]
 
@@ -82,6 +122,30 @@ class EbayClient:
         # Real implementation would use ReviseInventoryStatus
         return False
 
+    def sync_inventory_bulk(self, quantities: Dict[str, int]) -> Dict[str, bool]:
+        """Sync many inventory quantities to eBay; success per SKU."""
+        if self.demo_mode:
+            return {sku: True for sku in quantities}
+
+        # Real implementation would use the Inventory API
+        # bulkUpdatePriceQuantity call (up to 25 SKUs per request)
+        return {sku: False for sku in quantities}
+
+    def _access_token(self) -> str:
+        """User access token, refreshed every two hours rather than per call."""
+        return self.tokens.get(f"ebay:{self.app_id}", self._exchange_refresh_token)
+
+    def _exchange_refresh_token(self) -> Tuple[str, float]:
+        """Exchange the user refresh token for an access token and its lifetime."""
+        response = self.session.post(
+            TOKEN_URLS.get(self.environment, TOKEN_URLS["production"]),
+            auth=(self.app_id, self.cert_id),
+            data={"grant_type": "refresh_token", "refresh_token": self.user_token},
+        )
+        response.raise_for_status()
+        payload = response.json()
+        return payload["access_token"], float(payload.get("expires_in", 7200))
+
     def _get_demo_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Generate demo orders for testing."""
         demo_orders = []
@@ -103,7 +167,7 @@ class EbayClient:
             order_date = datetime.now() - timedelta(days=random.randint(0, 30))
 
             order = {
-                "id": f"EBAY{3000 + i}-{random.randint(10000, 99999)}",
+                "id": f"EBAY{3000 + i}-{10000 + (3000 + i) * 7919 % 90000}",
                 "order_number": f"EBAY-{3000 + i}",
                 "platform": "ebay",
                 "status": status.value,
@@ -147,4 +211,7 @@ class EbayClient:
         if self.demo_mode:
             return True
 
-        return bool(self.app_id and self.cert_id and self.dev_id and self.user_token)
+        try:
+            return bool(self._access_token())
+        except httpx.HTTPError:
+            return False
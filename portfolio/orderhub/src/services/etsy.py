@@ -4,8 +4,11 @@ import random
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+import httpx
+
 from src.config import get_settings
 from src.models.order import OrderStatus
+from src.services.sessions import default_session
 
 settings = get_settings()
 
@@ -13,11 +16,15 @@ settings = get_settings()
 class EtsyClient:
     """Client for Etsy Open API."""
 
+    # Most SKUs one bulk inventory request may carry
+    max_inventory_batch = 1
+
     def __init__(
         self,
         api_key: str = "",
         shop_id: str = "",
         access_token: str = "",
+        session: Optional[httpx.Client] = None,
     ):
         """Initialize Etsy client."""
         self.api_key = api_key or settings.etsy_api_key
@@ -26,23 +33,45 @@ class EtsyClient:
         self.demo_mode = settings.demo_mode or not all([
             self.api_key, self.shop_id, self.access_token
         ])
+        # Shared keep-alive session; demo mode makes no requests
+        self.session = session or (None if self.demo_mode else default_session())
 
-    def get_orders(self, limit: int = 50, days: int = 30) -> List[Dict[str, Any]]:
-        """Fetch orders from Etsy."""
+    def get_orders(
+        self,
+        limit: int = 50,
+        days: int = 30,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch orders from Etsy, optionally only those updated since a time.
+
+        Orders updated since a time come back oldest update first, so a
+        caller can page through them by moving ``updated_since`` forward.
+        """
         if self.demo_mode:
-            return self._get_demo_orders(limit)
+            orders = self._get_demo_orders(limit)
+            if updated_since:
+                orders = sorted(
+                    (o for o in orders if datetime.fromisoformat(o["order_date"]) >= updated_since),
+                    key=lambda o: o["order_date"],
+                )
+            return orders
 
         # Real implementation would use Etsy Open API v3
-        # import requests
-        #
         # headers = {
         #     'x-api-key': self.api_key,
         #     'Authorization': f'Bearer {self.access_token}',
         # }
-        # response = requests.get(
+        # response = self.session.get(
         #     f'https://openapi.etsy.com/v3/application/shops/{self.shop_id}/receipts',
         #     headers=headers,
-        #     params={'limit': limit, 'was_paid': True}
+        #     params={
+        #         'limit': limit,
+        #         'was_paid': True,
+        #         'min_last_modified': int(updated_since.timestamp()) if updated_since else None,
+        #         'sort_on': 'updated',
+        #         'sort_order': 'asc',
+        #     }
         # )
         # return [self._format_order(order) for order in response.json().get('results', [])]
 
@@ -75,6 +104,14 @@ class EtsyClient:
         # Real implementation would use updateListingInventory
         return False
 
+    def sync_inventory_bulk(self, quantities: Dict[str, int]) -> Dict[str, bool]:
+        """Sync many inventory quantities to Etsy; success per SKU."""
+        if self.demo_mode:
+            return {sku: True for sku in quantities}
+
+        # Real implementation would use updateListingInventory per listing
+        return {sku: False for sku in quantities}
+
     def _get_demo_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Generate demo orders for testing."""
         demo_orders = []
@@ -1,11 +1,30 @@
 """Inventory management service."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+from sqlalchemy import case, insert, update
 from sqlalchemy.orm import Session
 
 from src.models.product import Product, InventoryLog
+from src.services.outbox import enqueue_inventory_push
+from src.services.queries import Page, decode_cursor, encode_cursor
+from src.services.reorder import get_reorder_engine
+
+# (sku, quantity) pairs, or a mapping of SKU to quantity
+InventoryLines = Union[Dict[str, int], Iterable[Tuple[str, int]]]
+
+
+@dataclass
+class ReservationResult:
+    """Outcome of a bulk reserve or release."""
+
+    success: bool
+    # Available quantity per SKU after the change (empty on failure)
+    quantities: Dict[str, int] = field(default_factory=dict)
+    # SKUs that are unknown or lacked enough stock
+    insufficient: List[str] = field(default_factory=list)
 
 
 class InventoryService:
@@ -19,6 +38,41 @@ class InventoryService:
         """Get product by SKU."""
         return self.db.query(Product).filter(Product.sku == sku).first()
 
+    def list_products(
+        self,
+        low_stock: bool = False,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """
+        List products by SKU, one keyset page at a time.
+
+        Args:
+            low_stock: Only products at or below their reorder point
+            limit: Max products per page
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Page of products
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self.db.query(Product)
+
+        if low_stock:
+            query = query.filter(Product.quantity_available <= Product.reorder_point)
+
+        if cursor:
+            (after_sku,) = decode_cursor(cursor, 1)
+            query = query.filter(Product.sku > after_sku)
+
+        products = query.order_by(Product.sku).limit(limit + 1).all()
+
+        if len(products) <= limit:
+            return Page(items=products)
+        return Page(items=products[:limit], next_cursor=encode_cursor(products[limit - 1].sku))
+
     def update_quantity(
         self,
         sku: str,
@@ -28,6 +82,7 @@ class InventoryService:
         order_id: Optional[int] = None,
         reason: Optional[str] = None,
         notes: Optional[str] = None,
+        sync_platforms: bool = True,
     ) -> Optional[Product]:
         """
         Update product quantity and log the change.
@@ -40,6 +95,7 @@ class InventoryService:
             order_id: Related order ID if applicable
             reason: Reason for change
             notes: Additional notes
+            sync_platforms: Queue the new quantity for pushing to all platforms
 
         Returns:
             Updated product or None if not found
@@ -75,8 +131,11 @@ class InventoryService:
         )
 
         self.db.add(log)
+        if sync_platforms:
+            enqueue_inventory_push(self.db, [sku])
         self.db.commit()
         self.db.refresh(product)
+        get_reorder_engine().mark_dirty([sku])
 
         return product
 
@@ -92,39 +151,15 @@ class InventoryService:
         Returns:
             True if reservation successful
         """
-        product = self.get_product(sku)
-        if not product:
-            return False
-
-        # Check if enough available
-        if product.quantity_available < quantity:
-            return False
-
-        # Move from available to reserved
-        product.quantity_available -= quantity
-        product.quantity_reserved += quantity
-        product.updated_at = datetime.utcnow()
-
-        # Log the reservation
-        log = InventoryLog(
-            sku=sku,
-            change_type="reservation",
-            quantity_before=product.quantity_available + quantity,
-            quantity_after=product.quantity_available,
-            quantity_change=-quantity,
-            order_id=order_id,
-            reason="Order placed",
-        )
-
-        self.db.add(log)
-        self.db.commit()
-
-        return True
+        return self.reserve_many({sku: quantity}, order_id).success
 
     def release_reservation(self, sku: str, quantity: int, order_id: int, reason: str = "Order cancelled") -> bool:
         """
         Release reserved inventory back to available.
 
+        Unlike ``release_many``, releasing more than is reserved succeeds:
+        the full quantity returns to available and reserved stops at 0.
+
         Args:
             sku: Product SKU
             quantity: Quantity to release
@@ -134,34 +169,55 @@ class InventoryService:
         Returns:
             True if release successful
         """
-        product = self.get_product(sku)
-        if not product:
-            return False
+        return self._move_stock(
+            {sku: quantity}, 1, "release", order_id, reason, clamp_reserved=True
+        ).success
 
-        # Move from reserved back to available
-        product.quantity_reserved -= quantity
-        product.quantity_available += quantity
-        product.updated_at = datetime.utcnow()
+    def reserve_many(
+        self,
+        lines: InventoryLines,
+        order_id: Optional[int] = None,
+        reason: str = "Order placed",
+    ) -> ReservationResult:
+        """
+        Reserve stock for every line of an order, all or nothing.
 
-        # Prevent negative reserved
-        if product.quantity_reserved < 0:
-            product.quantity_reserved = 0
+        All lines are moved from available to reserved by one conditional
+        UPDATE that only matches rows with enough stock, so concurrent
+        checkouts cannot oversell and only the order's own SKUs are locked.
+        The new quantities are queued for pushing to the platforms.
 
-        # Log the release
-        log = InventoryLog(
-            sku=sku,
-            change_type="release",
-            quantity_before=product.quantity_available - quantity,
-            quantity_after=product.quantity_available,
-            quantity_change=quantity,
-            order_id=order_id,
-            reason=reason,
-        )
+        Args:
+            lines: Quantity to reserve per SKU (repeated SKUs are summed)
+            order_id: Order ID
+            reason: Reason recorded in the audit log
 
-        self.db.add(log)
-        self.db.commit()
+        Returns:
+            ReservationResult; on failure nothing is reserved
+        """
+        quantities = self._merge_lines(lines)
+        return self._move_stock(quantities, -1, "reservation", order_id, reason)
 
-        return True
+    def release_many(
+        self,
+        lines: InventoryLines,
+        order_id: Optional[int] = None,
+        reason: str = "Order cancelled",
+    ) -> ReservationResult:
+        """
+        Return reserved stock to available for every line, all or nothing.
+
+        Args:
+            lines: Quantity to release per SKU (repeated SKUs are summed)
+            order_id: Order ID
+            reason: Reason recorded in the audit log
+
+        Returns:
+            ReservationResult; fails without changes if any SKU has less
+            reserved than requested
+        """
+        quantities = self._merge_lines(lines)
+        return self._move_stock(quantities, 1, "release", order_id, reason)
 
     def check_reorder_needed(self, sku: str) -> bool:
         """
@@ -197,3 +253,91 @@ class InventoryService:
             .limit(limit)
             .all()
         )
+
+    def _merge_lines(self, lines: InventoryLines) -> Dict[str, int]:
+        """Sum quantities per SKU, rejecting non-positive quantities."""
+        items = lines.items() if isinstance(lines, dict) else lines
+        quantities: Dict[str, int] = {}
+        for sku, quantity in items:
+            if quantity <= 0:
+                raise ValueError(f"Quantity for {sku} must be positive, got {quantity}")
+            quantities[sku] = quantities.get(sku, 0) + quantity
+        return quantities
+
+    def _move_stock(
+        self,
+        quantities: Dict[str, int],
+        direction: int,
+        change_type: str,
+        order_id: Optional[int],
+        reason: str,
+        clamp_reserved: bool = False,
+    ) -> ReservationResult:
+        """
+        Move stock between available and reserved in one transaction.
+
+        Args:
+            quantities: Quantity per SKU
+            direction: -1 to reserve (available -> reserved), 1 to release
+            change_type: Audit log change type
+            order_id: Order ID
+            reason: Audit log reason
+            clamp_reserved: Release even when less is reserved, leaving
+                reserved at 0 instead of failing
+
+        Returns:
+            ReservationResult
+        """
+        if not quantities:
+            return ReservationResult(success=True)
+
+        qty = case(quantities, value=Product.sku)
+        # Reserving draws on available stock, releasing on reserved stock
+        source = Product.quantity_available if direction < 0 else Product.quantity_reserved
+        conditions = [Product.sku.in_(list(quantities))]
+        reserved = Product.quantity_reserved - direction * qty
+        if clamp_reserved:
+            reserved = case((reserved > 0, reserved), else_=0)
+        else:
+            conditions.append(source >= qty)
+
+        rows = self.db.execute(
+            update(Product)
+            .where(*conditions)
+            .values(
+                quantity_available=Product.quantity_available + direction * qty,
+                quantity_reserved=reserved,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(Product.sku, Product.quantity_available)
+            .execution_options(synchronize_session="fetch")
+        ).all()
+
+        updated = {sku: available for sku, available in rows}
+        if len(updated) < len(quantities):
+            self.db.rollback()
+            return ReservationResult(
+                success=False,
+                insufficient=sorted(sku for sku in quantities if sku not in updated),
+            )
+
+        self.db.execute(
+            insert(InventoryLog),
+            [
+                {
+                    "sku": sku,
+                    "change_type": change_type,
+                    "quantity_before": available - direction * quantities[sku],
+                    "quantity_after": available,
+                    "quantity_change": direction * quantities[sku],
+                    "order_id": order_id,
+                    "reason": reason,
+                }
+                for sku, available in updated.items()
+            ],
+        )
+        enqueue_inventory_push(self.db, updated)
+        self.db.commit()
+        get_reorder_engine().mark_dirty(updated)
+
+        return ReservationResult(success=True, quantities=updated)
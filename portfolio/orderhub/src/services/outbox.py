@@ -0,0 +1,292 @@
+"""Inventory push outbox."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.db.database import SessionLocal
+from src.models.product import InventoryOutboxEntry, Product
+from src.services.aggregator import PLATFORMS, OrderAggregator
+
+settings = get_settings()
+
+# Inventory calls per second each platform allows
+PLATFORM_RATE_LIMITS = {
+    "shopify": 2.0,
+    "amazon": 5.0,
+    "ebay": 5.0,
+    "etsy": 5.0,
+}
+
+# Most outbox entries handled by one flush
+MAX_FLUSH_ENTRIES = 5000
+
+
+def enqueue_inventory_push(
+    db: Session,
+    skus: Iterable[str],
+    platforms: Optional[List[str]] = None,
+):
+    """
+    Queue SKUs for pushing to platforms, without committing.
+
+    Call inside the transaction that changes the stock, so the queue and the
+    quantities commit together. A SKU already queued for a platform only has
+    its change time bumped, which coalesces bursts into one push.
+
+    Args:
+        db: Database session
+        skus: SKUs whose available quantity changed
+        platforms: Platforms to push to (None = all)
+    """
+    now = datetime.utcnow()
+    rows = [
+        {"sku": sku, "platform": platform, "queued_at": now, "changed_at": now, "attempts": 0}
+        for sku in sorted(set(skus))
+        for platform in (platforms or PLATFORMS)
+    ]
+    if not rows:
+        return
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(InventoryOutboxEntry).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["sku", "platform"],
+            set_={"changed_at": stmt.excluded.changed_at},
+        )
+    )
+
+
+class RateLimiter:
+    """Token bucket spacing calls to ``rate`` per second, with bursts up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a call is allowed."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class InventoryOutbox:
+    """
+    Push queued inventory changes to the platforms in the background.
+
+    Every ``inventory_push_window_seconds`` the outbox takes entries queued
+    at least one window ago, reads each SKU's current available quantity
+    from the database (the source of truth), and pushes it with each
+    platform's bulk endpoint under the platform's rate limit. However many
+    sales hit a SKU within the window, each platform receives one push.
+    Failed pushes are retried with exponential backoff up to
+    ``inventory_push_max_backoff_seconds``.
+
+    Like the sync scheduler, run the outbox in a single app worker.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        aggregator: Optional[OrderAggregator] = None,
+        window_seconds: Optional[float] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        max_backoff_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize outbox.
+
+        Args:
+            session_factory: Creates a database session per flush
+            aggregator: Platform aggregator used for pushes
+            window_seconds: How long changes are coalesced before a push
+            rate_limits: Per-platform calls per second; platforms not
+                listed use ``PLATFORM_RATE_LIMITS``
+            max_backoff_seconds: Longest retry delay after repeated failures
+        """
+        self.session_factory = session_factory
+        self.aggregator = aggregator or OrderAggregator()
+        self.window_seconds = (
+            settings.inventory_push_window_seconds if window_seconds is None else window_seconds
+        )
+        self.max_backoff_seconds = (
+            settings.inventory_push_max_backoff_seconds
+            if max_backoff_seconds is None else max_backoff_seconds
+        )
+
+        rates = {**PLATFORM_RATE_LIMITS, **(rate_limits or {})}
+        self.limiters = {platform: RateLimiter(rates[platform]) for platform in PLATFORMS}
+
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """True while the background flush loop is active."""
+        return self._task is not None
+
+    def start(self):
+        """Start flushing periodically on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the flush loop."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def flush(self) -> Dict[str, int]:
+        """
+        Push every due outbox entry once.
+
+        Returns:
+            Number of SKUs pushed per platform
+        """
+        async with self._flush_lock:
+            db = self.session_factory()
+            try:
+                return await self._flush(db)
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+    async def _run(self):
+        """Flush forever, one window apart."""
+        while True:
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Error pushing inventory: {e}")
+            await asyncio.sleep(self.window_seconds)
+
+    async def _flush(self, db: Session) -> Dict[str, int]:
+        """Push due entries and record which succeeded."""
+        now = datetime.utcnow()
+        due = (
+            db.query(InventoryOutboxEntry)
+            .filter(
+                InventoryOutboxEntry.queued_at <= now - timedelta(seconds=self.window_seconds),
+                (InventoryOutboxEntry.next_attempt_at.is_(None))
+                | (InventoryOutboxEntry.next_attempt_at <= now),
+            )
+            .order_by(InventoryOutboxEntry.queued_at)
+            .limit(MAX_FLUSH_ENTRIES)
+            .all()
+        )
+        if not due:
+            return {}
+
+        # Changes made after this point are pushed by a later flush
+        read_at = datetime.utcnow()
+        quantities = dict(
+            db.query(Product.sku, Product.quantity_available).filter(
+                Product.sku.in_({entry.sku for entry in due})
+            )
+        )
+
+        by_platform: Dict[str, List[InventoryOutboxEntry]] = {}
+        for entry in due:
+            if entry.sku not in quantities:
+                # Product deleted; nothing left to push
+                db.delete(entry)
+            else:
+                by_platform.setdefault(entry.platform, []).append(entry)
+
+        outcomes = await asyncio.gather(
+            *(
+                self._push_platform(
+                    platform, {entry.sku: quantities[entry.sku] for entry in entries}
+                )
+                for platform, entries in by_platform.items()
+            )
+        )
+
+        pushed: Dict[str, int] = {}
+        done_ids: List[int] = []
+        for (platform, entries), (succeeded, error) in zip(by_platform.items(), outcomes):
+            pushed[platform] = len(succeeded)
+            for entry in entries:
+                if entry.sku in succeeded:
+                    done_ids.append(entry.id)
+                else:
+                    self._schedule_retry(entry, error or "Rejected by platform", now)
+            if succeeded:
+                self.aggregator.invalidate_platform(platform)
+
+        if done_ids:
+            # Entries changed again since the quantities were read stay queued
+            db.execute(
+                delete(InventoryOutboxEntry).where(
+                    InventoryOutboxEntry.id.in_(done_ids),
+                    InventoryOutboxEntry.changed_at <= read_at,
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            db.execute(
+                update(InventoryOutboxEntry)
+                .where(
+                    InventoryOutboxEntry.id.in_(done_ids),
+                    InventoryOutboxEntry.changed_at > read_at,
+                )
+                .values(queued_at=InventoryOutboxEntry.changed_at, attempts=0, next_attempt_at=None)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.commit()
+        return pushed
+
+    async def _push_platform(
+        self, platform: str, quantities: Dict[str, int]
+    ) -> Tuple[Set[str], Optional[str]]:
+        """
+        Push quantities to one platform in rate-limited bulk batches.
+
+        Returns:
+            SKUs pushed, and the error that stopped the platform (if any)
+        """
+        batch_size = self.aggregator.clients[platform].max_inventory_batch
+        items = sorted(quantities.items())
+        succeeded: Set[str] = set()
+
+        for start in range(0, len(items), batch_size):
+            await self.limiters[platform].acquire()
+            try:
+                results = await self.aggregator.push_inventory_async(
+                    platform, dict(items[start:start + batch_size])
+                )
+            except Exception as e:
+                # Leave the rest for the retry rather than hammering a failing platform
+                error = str(e) or type(e).__name__
+                print(f"Error pushing inventory to {platform}: {error}")
+                return succeeded, error
+            succeeded.update(sku for sku, ok in results.items() if ok)
+
+        return succeeded, None
+
+    def _schedule_retry(self, entry: InventoryOutboxEntry, error: str, now: datetime):
+        """Back off an entry exponentially after a failed push."""
+        entry.attempts += 1
+        entry.last_error = error
+        delay = min(max(self.window_seconds, 1.0) * 2 ** entry.attempts, self.max_backoff_seconds)
+        entry.next_attempt_at = now + timedelta(seconds=delay)
@@ -0,0 +1,179 @@
+"""Order queries and summaries over the local order store."""
+
+import base64
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query, Session, selectinload
+
+from src.models.order import Order, OrderItem, OrderStatus
+from src.services.sync import to_utc
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = "|".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, parts: int) -> List[str]:
+    """
+    Decode a cursor from ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if len(values) != parts:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+@dataclass
+class Page:
+    """One page of results and the cursor of the next (None on the last page)."""
+
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class OrderFilters:
+    """Order filters; unset ones match everything and set ones combine with AND."""
+
+    platforms: Optional[List[str]] = None
+    statuses: Optional[List[OrderStatus]] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    sku: Optional[str] = None
+
+    def apply(self, query: Query) -> Query:
+        """Add the filters to a query selecting from orders."""
+        if self.platforms:
+            query = query.filter(Order.platform.in_(self.platforms))
+        if self.statuses:
+            query = query.filter(Order.status.in_(self.statuses))
+        if self.date_from:
+            query = query.filter(Order.order_date >= to_utc(self.date_from))
+        if self.date_to:
+            query = query.filter(Order.order_date < to_utc(self.date_to))
+        if self.sku:
+            query = query.filter(Order.items.any(OrderItem.sku == self.sku))
+        return query
+
+
+class OrderQueryService:
+    """
+    Filtered, paginated order reads and SQL-side summaries.
+
+    Pages are keyed on ``(order_date, id)`` rather than offsets, so every
+    page is an index range scan no matter how deep the client has paged.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize query service."""
+        self.db = db
+
+    def list_orders(
+        self,
+        filters: Optional[OrderFilters] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """
+        List orders newest first.
+
+        Args:
+            filters: Order filters
+            limit: Max orders per page
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Page of orders (with items loaded)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (filters or OrderFilters()).apply(
+            self.db.query(Order).options(selectinload(Order.items))
+        )
+
+        if cursor:
+            order_date, order_id = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(order_date), int(order_id))
+            except ValueError:
+                raise ValueError("Invalid cursor")
+            query = query.filter(tuple_(Order.order_date, Order.id) < after)
+
+        # One extra row tells whether another page follows
+        orders = query.order_by(Order.order_date.desc(), Order.id.desc()).limit(limit + 1).all()
+
+        if len(orders) <= limit:
+            return Page(items=orders)
+        last = orders[limit - 1]
+        return Page(items=orders[:limit], next_cursor=encode_cursor(last.order_date, last.id))
+
+    def revenue_by_platform_day(self, filters: Optional[OrderFilters] = None) -> List[Dict[str, Any]]:
+        """
+        Order count and revenue per platform per (UTC) day, newest day first.
+
+        Args:
+            filters: Order filters
+
+        Returns:
+            List of dicts with platform, day, orders and revenue
+        """
+        day = func.date(Order.order_date)
+        query = (filters or OrderFilters()).apply(
+            self.db.query(
+                Order.platform,
+                day.label("day"),
+                func.count(Order.id),
+                func.coalesce(func.sum(Order.total), 0),
+            )
+        )
+        rows = query.group_by(Order.platform, day).order_by(day.desc(), Order.platform)
+
+        return [
+            {"platform": platform, "day": str(day), "orders": orders, "revenue": float(revenue)}
+            for platform, day, orders, revenue in rows
+        ]
+
+    def units_by_sku(
+        self, filters: Optional[OrderFilters] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Units sold and item revenue per SKU, best sellers first.
+
+        Args:
+            filters: Order filters; ``sku`` restricts the SKUs summarized
+            limit: Max SKUs to return
+
+        Returns:
+            List of dicts with sku, units, orders and revenue
+        """
+        filters = filters or OrderFilters()
+        units = func.sum(OrderItem.quantity)
+        query = replace(filters, sku=None).apply(
+            self.db.query(
+                OrderItem.sku,
+                units,
+                func.count(func.distinct(OrderItem.order_id)),
+                func.coalesce(func.sum(OrderItem.total_price), 0),
+            ).join(Order, Order.id == OrderItem.order_id)
+        )
+        if filters.sku:
+            query = query.filter(OrderItem.sku == filters.sku)
+
+        rows = query.group_by(OrderItem.sku).order_by(units.desc(), OrderItem.sku).limit(limit)
+
+        return [
+            {"sku": sku, "units": int(units), "orders": orders, "revenue": float(revenue)}
+            for sku, units, orders, revenue in rows
+        ]
@@ -0,0 +1,104 @@
+"""App-lifetime registry of platform clients."""
+
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from src.config import get_settings
+from src.services.amazon import AmazonClient
+from src.services.ebay import EbayClient
+from src.services.etsy import EtsyClient
+from src.services.sessions import TokenCache, create_session
+from src.services.shopify import ShopifyClient
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class PlatformRegistry:
+    """
+    Platform clients shared by every request and background job.
+
+    All clients send their requests through one pooled keep-alive session
+    and share one OAuth token cache, so connections and access tokens are
+    reused instead of being set up per request. Calls to each platform go
+    through a semaphore that caps how many run at once. Demo-mode clients
+    are registered the same way; they just never touch the session.
+    """
+
+    def __init__(
+        self,
+        session: Optional[httpx.Client] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            session: HTTP session for all clients (a pooled one is created if omitted)
+            max_concurrency: Max concurrent calls per platform (defaults to
+                ``platform_max_concurrency``)
+        """
+        self.session = session or create_session()
+        self.tokens = TokenCache()
+        self.clients: Dict[str, Any] = {
+            "shopify": ShopifyClient(session=self.session),
+            "amazon": AmazonClient(session=self.session, tokens=self.tokens),
+            "ebay": EbayClient(session=self.session, tokens=self.tokens),
+            "etsy": EtsyClient(session=self.session),
+        }
+
+        max_concurrency = max_concurrency or settings.platform_max_concurrency
+        self._limits = {
+            platform: threading.BoundedSemaphore(max_concurrency)
+            for platform in self.clients
+        }
+
+    def limited(self, platform: str, call: Callable[..., T]) -> Callable[..., T]:
+        """
+        Wrap a blocking call so it counts against the platform's concurrency limit.
+
+        Args:
+            platform: Platform name
+            call: Callable that talks to the platform
+
+        Returns:
+            Callable that waits for a free slot, then makes the call
+        """
+        limit = self._limits[platform]
+
+        @wraps(call)
+        def run(*args: Any, **kwargs: Any) -> T:
+            with limit:
+                return call(*args, **kwargs)
+
+        return run
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+
+_registry: Optional[PlatformRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> PlatformRegistry:
+    """Get the shared platform registry, creating it on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PlatformRegistry()
+        return _registry
+
+
+def close_registry():
+    """Close the shared registry; the next ``get_registry`` builds a new one."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.close()
+            _registry = None
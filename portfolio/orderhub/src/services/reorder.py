@@ -0,0 +1,296 @@
+"""Demand-velocity reorder engine."""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Set
+
+import numpy as np
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.db.database import SessionLocal
+from src.models.order import Order, OrderItem, OrderStatus
+from src.models.product import Product
+
+settings = get_settings()
+
+# Sales windows; velocity blends the recent and the longer trend
+SHORT_WINDOW_DAYS = 7
+LONG_WINDOW_DAYS = 30
+SHORT_WINDOW_WEIGHT = 0.5
+
+# Orders that did not turn into demand
+EXCLUDED_STATUSES = [OrderStatus.CANCELLED, OrderStatus.REFUNDED]
+
+# Dirty SKUs refreshed per query; beyond this a full recompute is cheaper
+REFRESH_BATCH_SIZE = 500
+MAX_INCREMENTAL_SKUS = 5000
+
+
+@dataclass
+class ReorderSuggestion:
+    """A product that should be reordered."""
+
+    sku: str
+    quantity_available: int
+    reorder_point: int
+    daily_velocity: float
+    # None when the product has no recent sales
+    days_of_cover: Optional[float]
+    suggested_quantity: int
+
+
+class ReorderSnapshot:
+    """Per-SKU demand figures for the whole catalog, as parallel arrays."""
+
+    def __init__(
+        self,
+        skus: np.ndarray,
+        available: np.ndarray,
+        reorder_point: np.ndarray,
+        reorder_quantity: np.ndarray,
+        units_short: np.ndarray,
+        units_long: np.ndarray,
+        computed_at: float,
+    ):
+        self.skus = skus
+        self.available = available
+        self.reorder_point = reorder_point
+        self.reorder_quantity = reorder_quantity
+        self.units_short = units_short
+        self.units_long = units_long
+        self.computed_at = computed_at
+        self.index = {sku: i for i, sku in enumerate(skus.tolist())}
+
+
+class ReorderEngine:
+    """
+    Rank the catalog by how soon each product runs out.
+
+    Sales per SKU over the last ``SHORT_WINDOW_DAYS`` and
+    ``LONG_WINDOW_DAYS`` come from one grouped query over order items
+    joined to products. Velocity, days of cover and order quantities are
+    then computed for every SKU at once with numpy.
+
+    Results are kept in memory. SKUs touched by a sync or a stock change
+    are marked dirty and re-queried on the next read. The whole snapshot
+    is rebuilt once it is ``reorder_cache_seconds`` old, as the windows
+    slide.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        lead_time_days: Optional[float] = None,
+        safety_days: Optional[float] = None,
+        cover_days: Optional[float] = None,
+        max_age_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            session_factory: Creates a database session when none is passed
+            lead_time_days: Days from placing a purchase order to stock arriving
+            safety_days: Extra days of cover kept as a buffer
+            cover_days: Days of demand a reorder should cover once it arrives
+            max_age_seconds: Age at which the snapshot is fully recomputed
+        """
+        self.session_factory = session_factory
+        self.lead_time_days = settings.reorder_lead_time_days if lead_time_days is None else lead_time_days
+        self.safety_days = settings.reorder_safety_days if safety_days is None else safety_days
+        self.cover_days = settings.reorder_cover_days if cover_days is None else cover_days
+        self.max_age_seconds = (
+            settings.reorder_cache_seconds if max_age_seconds is None else max_age_seconds
+        )
+
+        self._snapshot: Optional[ReorderSnapshot] = None
+        self._dirty: Set[str] = set()
+        self._full_refresh = False
+        # Refreshes and reads of the snapshot; marking SKUs dirty never waits on them
+        self._lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+
+    def mark_dirty(self, skus: Iterable[str]):
+        """Queue SKUs whose sales or stock changed for refresh on the next read."""
+        with self._dirty_lock:
+            self._dirty.update(skus)
+
+    def invalidate(self):
+        """Recompute everything on the next read."""
+        with self._dirty_lock:
+            self._full_refresh = True
+
+    def get_reorder_list(self, db: Optional[Session] = None, limit: int = 100) -> List[ReorderSuggestion]:
+        """
+        Products needing a reorder, most urgent first.
+
+        A product needs a reorder when it is at or below its reorder point,
+        or its days of cover do not outlast the lead time plus safety days.
+
+        Args:
+            db: Database session (a new one is opened if omitted)
+            limit: Max suggestions to return
+
+        Returns:
+            Suggestions ranked by days of cover, then by velocity
+        """
+        with self._lock:
+            return self._rank(self._current_snapshot(db), limit)
+
+    def _current_snapshot(self, db: Optional[Session]) -> ReorderSnapshot:
+        """Fresh snapshot, rebuilding or patching it as needed (caller holds the lock)."""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+            full_refresh, self._full_refresh = self._full_refresh, False
+
+        snapshot = self._snapshot
+        stale = (
+            full_refresh
+            or snapshot is None
+            or time.monotonic() - snapshot.computed_at > self.max_age_seconds
+            or len(dirty) > MAX_INCREMENTAL_SKUS
+        )
+        if not stale and not dirty:
+            return snapshot
+
+        own_session = db is None
+        db = db or self.session_factory()
+        try:
+            if stale:
+                snapshot = self._load(db)
+            elif not self._patch(db, snapshot, dirty):
+                # Products were added or removed; rebuild the index
+                snapshot = self._load(db)
+        except Exception:
+            # Hand the pending work back so the next read retries it
+            with self._dirty_lock:
+                self._dirty |= dirty
+                self._full_refresh = self._full_refresh or full_refresh
+            raise
+        finally:
+            if own_session:
+                db.close()
+
+        self._snapshot = snapshot
+        return snapshot
+
+    def _query(self, skus: Optional[List[str]] = None):
+        """Stock and windowed sales per product, optionally for some SKUs only."""
+        now = datetime.utcnow()
+        since_short = now - timedelta(days=SHORT_WINDOW_DAYS)
+        since_long = now - timedelta(days=LONG_WINDOW_DAYS)
+
+        sales = (
+            select(
+                OrderItem.sku.label("sku"),
+                func.sum(
+                    case((Order.order_date >= since_short, OrderItem.quantity), else_=0)
+                ).label("units_short"),
+                func.sum(OrderItem.quantity).label("units_long"),
+            )
+            .join(Order, Order.id == OrderItem.order_id)
+            .where(Order.order_date >= since_long, Order.status.notin_(EXCLUDED_STATUSES))
+        )
+        if skus is not None:
+            sales = sales.where(OrderItem.sku.in_(skus))
+        sales = sales.group_by(OrderItem.sku).subquery()
+
+        query = select(
+            Product.sku,
+            Product.quantity_available,
+            Product.reorder_point,
+            Product.reorder_quantity,
+            func.coalesce(sales.c.units_short, 0),
+            func.coalesce(sales.c.units_long, 0),
+        ).outerjoin(sales, sales.c.sku == Product.sku)
+        if skus is not None:
+            query = query.where(Product.sku.in_(skus))
+        return query
+
+    def _load(self, db: Session) -> ReorderSnapshot:
+        """Compute the whole catalog with one query."""
+        rows = db.execute(self._query()).all()
+        columns = list(zip(*rows)) if rows else [()] * 6
+
+        return ReorderSnapshot(
+            skus=np.array(columns[0], dtype=object),
+            available=np.array(columns[1], dtype=np.int64),
+            reorder_point=np.array(columns[2], dtype=np.int64),
+            reorder_quantity=np.array(columns[3], dtype=np.int64),
+            units_short=np.array(columns[4], dtype=np.float64),
+            units_long=np.array(columns[5], dtype=np.float64),
+            computed_at=time.monotonic(),
+        )
+
+    def _patch(self, db: Session, snapshot: ReorderSnapshot, skus: Set[str]) -> bool:
+        """
+        Re-query dirty SKUs in place.
+
+        Returns:
+            False if the set of products changed and a rebuild is needed
+        """
+        if any(sku not in snapshot.index for sku in skus):
+            return False
+
+        ordered = sorted(skus)
+        found = 0
+        for start in range(0, len(ordered), REFRESH_BATCH_SIZE):
+            batch = ordered[start:start + REFRESH_BATCH_SIZE]
+            for sku, available, point, quantity, short, long in db.execute(self._query(batch)):
+                i = snapshot.index[sku]
+                snapshot.available[i] = available
+                snapshot.reorder_point[i] = point
+                snapshot.reorder_quantity[i] = quantity
+                snapshot.units_short[i] = short
+                snapshot.units_long[i] = long
+                found += 1
+
+        # A dirty SKU that no longer has a product row was deleted
+        return found == len(ordered)
+
+    def _rank(self, snapshot: ReorderSnapshot, limit: int) -> List[ReorderSuggestion]:
+        """Vectorized velocity, cover and order quantities, ranked."""
+        velocity = (
+            SHORT_WINDOW_WEIGHT * snapshot.units_short / SHORT_WINDOW_DAYS
+            + (1 - SHORT_WINDOW_WEIGHT) * snapshot.units_long / LONG_WINDOW_DAYS
+        )
+        available = snapshot.available.astype(np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cover = np.where(velocity > 0, available / velocity, np.inf)
+
+        needs = (snapshot.available <= snapshot.reorder_point) | (
+            cover <= self.lead_time_days + self.safety_days
+        )
+        candidates = np.flatnonzero(needs)
+
+        # Most urgent first: least cover, then fastest selling
+        ranked = candidates[np.lexsort((-velocity[candidates], cover[candidates]))][:limit]
+
+        # Enough to cover the lead time, buffer and target cover from today,
+        # and never less than the product's usual reorder quantity
+        target = velocity[ranked] * (self.lead_time_days + self.safety_days + self.cover_days)
+        suggested = np.maximum(np.ceil(target - available[ranked]), snapshot.reorder_quantity[ranked])
+
+        return [
+            ReorderSuggestion(
+                sku=snapshot.skus[i],
+                quantity_available=int(snapshot.available[i]),
+                reorder_point=int(snapshot.reorder_point[i]),
+                daily_velocity=round(float(velocity[i]), 3),
+                days_of_cover=None if np.isinf(cover[i]) else round(float(cover[i]), 1),
+                suggested_quantity=int(quantity),
+            )
+            for i, quantity in zip(ranked.tolist(), suggested.tolist())
+        ]
+
+
+@lru_cache()
+def get_reorder_engine() -> ReorderEngine:
+    """Get shared reorder engine instance."""
+    return ReorderEngine()
@@ -0,0 +1,273 @@
+"""Background order sync scheduler."""
+
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.db.database import SessionLocal
+from src.services.aggregator import PLATFORMS, OrderAggregator
+from src.services.sync import OrderSyncResult, OrderSyncService
+
+settings = get_settings()
+
+# Finished jobs kept for the status endpoint
+MAX_TRACKED_JOBS = 100
+
+
+class JobStatus(str, Enum):
+    """Sync job state."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    PARTIAL = "partial"
+    FAILED = "failed"
+
+
+@dataclass
+class SyncJob:
+    """An on-demand sync of one or more platforms."""
+
+    id: str
+    platforms: List[str]
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    orders_synced: int = 0
+    platforms_synced: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        """True once the job has finished, successfully or not."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.PARTIAL, JobStatus.FAILED)
+
+
+@dataclass
+class PlatformSyncMetrics:
+    """Sync health of one platform."""
+
+    platform: str
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    orders_synced: int = 0
+    last_orders: int = 0
+    last_duration_seconds: Optional[float] = None
+    last_run_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    next_run_at: Optional[datetime] = None
+
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        """Seconds since the last successful sync started."""
+        if not self.last_success_at:
+            return None
+        return (datetime.utcnow() - self.last_success_at).total_seconds()
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Orders per second stored by the last run."""
+        if not self.last_duration_seconds:
+            return None
+        return self.last_orders / self.last_duration_seconds
+
+
+class SyncScheduler:
+    """
+    Pull orders from each platform in the background.
+
+    Every platform runs on its own loop: ``sync_interval_minutes`` apart
+    with random jitter, backing off exponentially (up to
+    ``sync_max_backoff_minutes``) while it keeps failing. Scheduled and
+    on-demand syncs of a platform are coalesced, so at most one sync per
+    platform runs at a time and callers arriving meanwhile share its result.
+
+    The scheduler lives in one process; run a single app worker with it
+    enabled, or disable it (``sync_enabled``) on the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        aggregator: Optional[OrderAggregator] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        jitter: Optional[float] = None,
+        max_backoff_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            session_factory: Creates a database session per sync run
+            aggregator: Platform aggregator shared by all runs
+            intervals: Per-platform sync interval in seconds; platforms not
+                listed use ``sync_interval_minutes``
+            jitter: Random spread applied to each delay, as a fraction of it
+            max_backoff_seconds: Longest delay after repeated failures
+        """
+        self.session_factory = session_factory
+        self.aggregator = aggregator or OrderAggregator()
+        self.intervals = intervals or {}
+        self.jitter = settings.sync_jitter if jitter is None else jitter
+        self.max_backoff_seconds = (
+            settings.sync_max_backoff_minutes * 60
+            if max_backoff_seconds is None else max_backoff_seconds
+        )
+
+        self.metrics: Dict[str, PlatformSyncMetrics] = {
+            platform: PlatformSyncMetrics(platform=platform) for platform in PLATFORMS
+        }
+        self.jobs: Dict[str, SyncJob] = {}
+
+        self._loops: List[asyncio.Task] = []
+        self._runs: Dict[str, asyncio.Task] = {}
+        self._watchers: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """True while the periodic platform loops are active."""
+        return bool(self._loops)
+
+    def start(self):
+        """Start one periodic sync loop per platform on the running event loop."""
+        if self.running:
+            return
+        self._loops = [
+            asyncio.create_task(self._platform_loop(platform)) for platform in PLATFORMS
+        ]
+
+    async def stop(self):
+        """Cancel the loops and any sync still in flight."""
+        tasks = [*self._loops, *self._runs.values(), *self._watchers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops = []
+
+    def trigger(self, platforms: Optional[List[str]] = None) -> SyncJob:
+        """
+        Start syncing platforms without waiting for the result.
+
+        Platforms already syncing are not synced twice; the job follows
+        the run in progress.
+
+        Args:
+            platforms: Platforms to sync (None = all)
+
+        Returns:
+            SyncJob to poll with ``get_job``
+        """
+        active_platforms = [p for p in (platforms or PLATFORMS) if p in PLATFORMS]
+        job = SyncJob(id=uuid.uuid4().hex, platforms=active_platforms)
+
+        if len(self.jobs) >= MAX_TRACKED_JOBS:
+            finished = next((job_id for job_id, j in self.jobs.items() if j.done), None)
+            self.jobs.pop(finished or next(iter(self.jobs)))
+        self.jobs[job.id] = job
+
+        runs = {platform: self._ensure_run(platform) for platform in active_platforms}
+        watcher = asyncio.create_task(self._watch(job, runs))
+        self._watchers.add(watcher)
+        watcher.add_done_callback(self._watchers.discard)
+
+        return job
+
+    def get_job(self, job_id: str) -> Optional[SyncJob]:
+        """Get a tracked sync job."""
+        return self.jobs.get(job_id)
+
+    def next_delay(self, platform: str) -> float:
+        """Seconds until the next scheduled sync of a platform."""
+        interval = self.intervals.get(platform, settings.sync_interval_minutes * 60)
+        failures = self.metrics[platform].consecutive_failures
+        if failures:
+            interval = min(interval * 2 ** failures, self.max_backoff_seconds)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _platform_loop(self, platform: str):
+        """Sync a platform forever on its own cadence."""
+        # Stagger the first runs so platforms do not all start together
+        delay = random.uniform(0, self.jitter * self.next_delay(platform))
+        while True:
+            self.metrics[platform].next_run_at = datetime.utcnow() + timedelta(seconds=delay)
+            await asyncio.sleep(delay)
+            await asyncio.shield(self._ensure_run(platform))
+            delay = self.next_delay(platform)
+
+    def _ensure_run(self, platform: str) -> asyncio.Task:
+        """Get the sync run in progress for a platform, starting one if idle."""
+        run = self._runs.get(platform)
+        if run is None or run.done():
+            run = asyncio.create_task(self._sync_platform(platform))
+            self._runs[platform] = run
+        return run
+
+    async def _sync_platform(self, platform: str) -> OrderSyncResult:
+        """Run one incremental sync of a platform and record its metrics."""
+        metrics = self.metrics[platform]
+        metrics.last_run_at = datetime.utcnow()
+        started = time.monotonic()
+
+        db = self.session_factory()
+        try:
+            result = await OrderSyncService(db, self.aggregator).sync_orders(
+                platforms=[platform],
+                limit_per_platform=settings.max_orders_per_sync,
+            )
+        except Exception as e:
+            db.rollback()
+            result = OrderSyncResult(errors={platform: str(e) or type(e).__name__})
+        finally:
+            db.close()
+
+        metrics.runs += 1
+        metrics.last_duration_seconds = time.monotonic() - started
+        metrics.last_orders = result.orders_synced
+
+        if platform in result.errors:
+            metrics.failures += 1
+            metrics.consecutive_failures += 1
+            metrics.last_error = result.errors[platform]
+            print(f"Error syncing {platform} orders: {metrics.last_error}")
+        else:
+            metrics.consecutive_failures = 0
+            metrics.last_error = None
+            metrics.last_success_at = metrics.last_run_at
+            metrics.orders_synced += result.orders_synced
+
+        return result
+
+    async def _watch(self, job: SyncJob, runs: Dict[str, asyncio.Task]):
+        """Wait for a job's platform runs and record the outcome."""
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+
+        results = await asyncio.gather(*runs.values(), return_exceptions=True)
+
+        for platform, result in zip(runs, results):
+            if isinstance(result, BaseException):
+                job.errors[platform] = str(result) or type(result).__name__
+            elif platform in result.errors:
+                job.errors[platform] = result.errors[platform]
+            else:
+                job.orders_synced += result.orders_synced
+                job.platforms_synced.append(platform)
+
+        if not job.errors:
+            job.status = JobStatus.SUCCEEDED
+        elif job.platforms_synced:
+            job.status = JobStatus.PARTIAL
+        else:
+            job.status = JobStatus.FAILED
+        job.finished_at = datetime.utcnow()
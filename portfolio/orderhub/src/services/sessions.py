@@ -0,0 +1,106 @@
+"""Shared HTTP sessions and OAuth token caching for platform clients."""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from src.config import get_settings
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+settings = get_settings()
+
+# Refresh access tokens this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 60.0
+
+
+def create_session() -> httpx.Client:
+    """
+    Create a pooled keep-alive HTTP session for platform APIs.
+
+    Connections (and their TLS handshakes) are reused across requests, and
+    HTTP/2 multiplexes concurrent calls to one host over a single connection
+    when the ``h2`` package is installed.
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=settings.platform_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.platform_max_connections,
+            max_keepalive_connections=settings.platform_max_connections,
+            keepalive_expiry=settings.platform_keepalive_seconds,
+        ),
+        headers={"User-Agent": f"{settings.app_name}/1.0"},
+    )
+
+
+@lru_cache()
+def default_session() -> httpx.Client:
+    """Get the process-wide session for clients created without one."""
+    return create_session()
+
+
+class TokenCache:
+    """
+    Thread-safe cache of OAuth access tokens.
+
+    A token is exchanged once and reused until shortly before it expires.
+    Concurrent callers needing the same token wait for a single exchange
+    rather than each hitting the token endpoint.
+    """
+
+    def __init__(self, margin_seconds: float = TOKEN_REFRESH_MARGIN_SECONDS):
+        self.margin_seconds = margin_seconds
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, key: str, exchange: Callable[[], Tuple[str, float]]) -> str:
+        """
+        Get a cached token, exchanging a new one when missing or expiring.
+
+        Args:
+            key: Token identity (platform and account)
+            exchange: Fetches a token; returns (access token, seconds valid)
+
+        Returns:
+            Access token
+        """
+        token = self._live(key)
+        if token:
+            return token
+
+        with self._key_lock(key):
+            token = self._live(key)
+            if token:
+                return token
+
+            token, expires_in = exchange()
+            self._tokens[key] = (token, time.monotonic() + expires_in)
+            return token
+
+    def clear(self, key: Optional[str] = None):
+        """Forget one token (e.g. after a 401) or all of them."""
+        if key is None:
+            self._tokens.clear()
+        else:
+            self._tokens.pop(key, None)
+
+    def _live(self, key: str) -> Optional[str]:
+        """Cached token with more than the margin left, or None."""
+        entry = self._tokens.get(key)
+        if entry and entry[1] - self.margin_seconds > time.monotonic():
+            return entry[0]
+        return None
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Lock serializing exchanges of one token."""
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
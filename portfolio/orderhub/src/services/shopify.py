@@ -4,8 +4,11 @@ import random
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+import httpx
+
 from src.config import get_settings
 from src.models.order import OrderStatus
+from src.services.sessions import default_session
 
 settings = get_settings()
 
@@ -13,24 +16,51 @@ settings = get_settings()
 class ShopifyClient:
     """Client for Shopify Admin API."""
 
-    def __init__(self, shop_url: str = "", access_token: str = ""):
+    # Most SKUs one bulk inventory request may carry
+    max_inventory_batch = 250
+
+    def __init__(
+        self,
+        shop_url: str = "",
+        access_token: str = "",
+        session: Optional[httpx.Client] = None,
+    ):
         """Initialize Shopify client."""
         self.shop_url = shop_url or settings.shopify_shop_url
         self.access_token = access_token or settings.shopify_access_token
         self.api_version = settings.shopify_api_version
         self.demo_mode = settings.demo_mode or not (self.shop_url and self.access_token)
-
-    def get_orders(self, limit: int = 50, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Fetch orders from Shopify."""
+        # Shared keep-alive session; demo mode makes no requests
+        self.session = session or (None if self.demo_mode else default_session())
+
+    def get_orders(
+        self,
+        limit: int = 50,
+        status: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch orders from Shopify, optionally only those updated since a time.
+
+        Orders updated since a time come back oldest update first, so a
+        caller can page through them by moving ``updated_since`` forward.
+        """
         if self.demo_mode:
-            return self._get_demo_orders(limit)
+            orders = self._get_demo_orders(limit)
+            if updated_since:
+                orders = sorted(
+                    (o for o in orders if datetime.fromisoformat(o["order_date"]) >= updated_since),
+                    key=lambda o: o["order_date"],
+                )
+            return orders
 
         # Real implementation would use Shopify API
-        # import shopify
-        # shopify.ShopifyResource.set_site(f"https://{self.shop_url}/admin/api/{self.api_version}")
-        # shopify.Session.setup(api_key=settings.shopify_api_key, secret=settings.shopify_api_secret)
-        # orders = shopify.Order.find(limit=limit, status=status)
-        # return [self._format_order(order) for order in orders]
+        # response = self.session.get(
+        #     f"https://{self.shop_url}/admin/api/{self.api_version}/orders.json",
+        #     headers={"X-Shopify-Access-Token": self.access_token},
+        #     params={"limit": limit, "status": status, "updated_at_min": updated_since, "order": "updated_at asc"},
+        # )
+        # return [self._format_order(order) for order in response.json()["orders"]]
 
         return []
 
@@ -62,6 +92,15 @@ class ShopifyClient:
         # Real implementation would update inventory levels
         return False
 
+    def sync_inventory_bulk(self, quantities: Dict[str, int]) -> Dict[str, bool]:
+        """Sync many inventory quantities to Shopify; success per SKU."""
+        if self.demo_mode:
+            return {sku: True for sku in quantities}
+
+        # Real implementation would call the inventorySetQuantities GraphQL
+        # mutation, which sets up to 250 inventory levels per request
+        return {sku: False for sku in quantities}
+
     def _get_demo_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Generate demo orders for testing."""
         demo_orders = []
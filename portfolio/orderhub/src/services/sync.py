@@ -0,0 +1,294 @@
+"""Order sync service."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, selectinload
+
+from src.config import get_settings
+from src.models.order import Order, OrderItem, OrderStatus
+from src.models.platform import PlatformConnection, PlatformType
+from src.services.aggregator import PLATFORMS, OrderAggregator
+from src.services.reorder import get_reorder_engine
+
+settings = get_settings()
+
+
+@dataclass
+class OrderSyncResult:
+    """Outcome of one sync run."""
+
+    orders_synced: int = 0
+    platforms: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+def to_utc(value: datetime) -> datetime:
+    """Naive UTC datetime, the form timestamps are stored in."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class OrderSyncService:
+    """
+    Copy platform orders into the local order store.
+
+    Each platform keeps a high-water mark (``PlatformConnection.sync_cursor``)
+    of the newest order update stored, so a sync only asks the platform for
+    orders created or updated since the previous one.
+    """
+
+    def __init__(self, db: Session, aggregator: Optional[OrderAggregator] = None):
+        """Initialize sync service."""
+        self.db = db
+        self.aggregator = aggregator or OrderAggregator()
+
+    async def sync_orders(
+        self,
+        platforms: Optional[List[str]] = None,
+        limit_per_platform: Optional[int] = None,
+    ) -> OrderSyncResult:
+        """
+        Fetch new and updated orders from each platform and upsert them.
+
+        Args:
+            platforms: Platforms to sync (None = all)
+            limit_per_platform: Max orders to fetch per platform
+                (defaults to ``max_orders_per_sync``)
+
+        Returns:
+            OrderSyncResult with counts and per-platform errors
+        """
+        active_platforms = [p for p in (platforms or PLATFORMS) if p in PLATFORMS]
+        limit = limit_per_platform or settings.max_orders_per_sync
+        connections = self._get_connections(active_platforms)
+        since = {
+            platform: to_utc(connection.sync_cursor)
+            for platform, connection in connections.items()
+            if connection.sync_cursor
+        }
+
+        orders, errors, fetched_platforms = await self._fetch_pages(
+            active_platforms, limit, since
+        )
+
+        now = datetime.utcnow()
+        synced = self.upsert_orders(orders, synced_at=now)
+
+        for platform, connection in connections.items():
+            connection.last_sync_at = now
+            if platform in errors:
+                connection.last_sync_status = "error"
+                connection.last_error = errors[platform]
+                continue
+
+            connection.last_sync_status = "success"
+            connection.last_error = None
+            connection.orders_synced = (connection.orders_synced or 0) + synced.get(platform, 0)
+
+            newest = max(
+                (self._updated_at(o) for o in orders if o["platform"] == platform),
+                default=None,
+            )
+            if newest and (not connection.sync_cursor or newest > to_utc(connection.sync_cursor)):
+                connection.sync_cursor = newest
+
+        self.db.commit()
+
+        # New sales change the demand velocity of the SKUs sold
+        get_reorder_engine().mark_dirty(
+            item["sku"] for order in orders for item in order.get("items", [])
+        )
+
+        return OrderSyncResult(
+            orders_synced=sum(synced.values()),
+            platforms=fetched_platforms,
+            errors=errors,
+            timestamp=now,
+        )
+
+    async def _fetch_pages(
+        self,
+        platforms: List[str],
+        limit: int,
+        since: Dict[str, datetime],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str], List[str]]:
+        """
+        Fetch every order updated since each platform's cursor.
+
+        Platforms return incremental pages oldest update first, so a full
+        page means there is more: the platform is asked again from the
+        newest update on that page until a short page comes back. Orders
+        on a page boundary are fetched twice and upserted once.
+
+        Returns:
+            Orders, per-platform errors, and the platforms that answered
+        """
+        since = dict(since)
+        orders: List[Dict[str, Any]] = []
+        errors: Dict[str, str] = {}
+        answered: List[str] = []
+        pending = list(platforms)
+
+        for _ in range(settings.max_sync_pages):
+            fetched = await self.aggregator.get_all_orders_async(
+                limit_per_platform=limit,
+                platforms=pending,
+                since=since,
+                use_cache=False,
+            )
+            orders.extend(fetched.orders)
+            errors.update(fetched.errors)
+            answered.extend(p for p in fetched.platforms if p not in answered)
+
+            full_pages = []
+            for platform in pending:
+                page = [o for o in fetched.orders if o["platform"] == platform]
+                if platform in fetched.errors or len(page) < limit:
+                    continue
+                newest = max(self._updated_at(o) for o in page)
+                if platform in since and newest <= since[platform]:
+                    print(
+                        f"{platform}: more than {limit} orders updated at {newest}, "
+                        "raise max_orders_per_sync to sync past them"
+                    )
+                    continue
+                since[platform] = newest
+                full_pages.append(platform)
+
+            pending = full_pages
+            if not pending:
+                break
+        else:
+            print(
+                f"Stopped paging {', '.join(pending)} after {settings.max_sync_pages} pages; "
+                "the next sync continues from there"
+            )
+
+        return orders, errors, [p for p in answered if p not in errors]
+
+    def upsert_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        synced_at: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Insert or update orders (and replace their items) without committing.
+
+        Existing rows are loaded with one query per platform rather than one
+        per order.
+
+        Args:
+            orders: Orders in the platform client format
+            synced_at: Sync time to stamp on each order
+
+        Returns:
+            Number of orders upserted per platform
+        """
+        synced_at = synced_at or datetime.utcnow()
+        counts: Dict[str, int] = {}
+
+        by_platform: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for order in orders:
+            by_platform.setdefault(order["platform"], {})[order["id"]] = order
+
+        for platform, platform_orders in by_platform.items():
+            existing = {
+                row.platform_order_id: row
+                for row in self.db.query(Order)
+                .options(selectinload(Order.items))
+                .filter(
+                    Order.platform == platform,
+                    Order.platform_order_id.in_(list(platform_orders)),
+                )
+            }
+
+            for platform_order_id, data in platform_orders.items():
+                row = existing.get(platform_order_id)
+                if row is None:
+                    row = Order(platform=platform, platform_order_id=platform_order_id)
+                    self.db.add(row)
+                self._apply(row, data, synced_at)
+
+            counts[platform] = len(platform_orders)
+
+        self.db.flush()
+        return counts
+
+    def get_order(self, order_id: str, platform: Optional[str] = None) -> Optional[Order]:
+        """Get a stored order by its platform order ID."""
+        query = self.db.query(Order).options(selectinload(Order.items))
+        if platform:
+            query = query.filter(Order.platform == platform)
+        return query.filter(Order.platform_order_id == order_id).first()
+
+    def _get_connections(self, platforms: List[str]) -> Dict[str, PlatformConnection]:
+        """Get the connection row of each platform, creating missing ones."""
+        connections = {
+            connection.platform_type.value: connection
+            for connection in self.db.query(PlatformConnection).filter(
+                PlatformConnection.platform_type.in_([PlatformType(p) for p in platforms])
+            )
+        }
+
+        for platform in platforms:
+            if platform not in connections:
+                # Credentials come from settings; the row only tracks sync state
+                connection = PlatformConnection(
+                    platform_type=PlatformType(platform), credentials="{}"
+                )
+                self.db.add(connection)
+                connections[platform] = connection
+
+        return connections
+
+    def _updated_at(self, order: Dict[str, Any]) -> datetime:
+        """Platform-side last update time of an order."""
+        return to_utc(datetime.fromisoformat(order.get("updated_at") or order["order_date"]))
+
+    def _apply(self, row: Order, data: Dict[str, Any], synced_at: datetime):
+        """Copy platform order fields onto a row."""
+        customer = data.get("customer") or {}
+        address = data.get("shipping_address") or {}
+
+        row.platform_order_number = data.get("order_number")
+        row.status = OrderStatus(data["status"])
+        row.order_date = to_utc(datetime.fromisoformat(data["order_date"]))
+        row.customer_name = customer.get("name") or ""
+        row.customer_email = customer.get("email")
+
+        row.shipping_address_line1 = address.get("line1")
+        row.shipping_address_line2 = address.get("line2")
+        row.shipping_city = address.get("city")
+        row.shipping_state = address.get("state")
+        row.shipping_postal_code = address.get("postal_code")
+        row.shipping_country = address.get("country")
+
+        row.subtotal = Decimal(str(data["subtotal"]))
+        row.tax = Decimal(str(data.get("tax") or 0))
+        row.shipping_cost = Decimal(str(data.get("shipping_cost") or 0))
+        row.total = Decimal(str(data["total"]))
+        row.currency = data.get("currency") or "USD"
+
+        row.tracking_number = data.get("tracking_number")
+        row.carrier = data.get("carrier")
+
+        row.platform_updated_at = self._updated_at(data)
+        row.synced_at = synced_at
+
+        row.items = [
+            OrderItem(
+                sku=item["sku"],
+                product_name=item["name"],
+                quantity=item["quantity"],
+                unit_price=Decimal(str(item["unit_price"])),
+                total_price=Decimal(str(item["total_price"])),
+                variant_title=item.get("variant_title"),
+                product_image_url=item.get("image_url"),
+            )
+            for item in data.get("items", [])
+        ]
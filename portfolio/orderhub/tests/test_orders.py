@@ -1,18 +1,91 @@
 """Tests for order aggregation."""
 
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Run against a throwaway SQLite database, with the background loops off
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/orderhub-test.db"
+os.environ["SYNC_ENABLED"] = "false"
+os.environ["INVENTORY_PUSH_ENABLED"] = "false"
+
+import fakeredis
+import httpx
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
+from src.api.orders import OrderResponse
+from src.api.serializers import order_to_dict
+from src.db.database import SessionLocal, engine
 from src.main import app
+from src.models.order import Order, OrderItem, OrderStatus
+from src.models.platform import PlatformConnection, PlatformType
+from src.models.product import InventoryLog, InventoryOutboxEntry, Product
 from src.services.aggregator import OrderAggregator
+from src.services.cache import Cache, MemoryBackend, RedisBackend, create_cache, get_cache
 from src.services.shopify import ShopifyClient
 from src.services.amazon import AmazonClient
 from src.services.ebay import EbayClient
 from src.services.etsy import EtsyClient
+from src.services.inventory import InventoryService
+from src.services.outbox import InventoryOutbox
+from src.services.registry import PlatformRegistry, close_registry, get_registry
+from src.services.reorder import ReorderEngine, get_reorder_engine
+from src.services.scheduler import JobStatus, SyncScheduler
+from src.services.sessions import TokenCache
+from src.services.sync import OrderSyncService
 
 client = TestClient(app)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def app_lifespan():
+    """Run app startup (tables, scheduler) and keep one event loop for background jobs."""
+    with client:
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty shared cache."""
+    get_cache().invalidate("")
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Give every test its own shared platform clients, so patched methods do not leak."""
+    yield
+    close_registry()
+
+
+def wait_for_job(job_id: str, timeout: float = 5.0) -> dict:
+    """Poll a sync job until it finishes."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/api/orders/sync/{job_id}").json()
+        if job["finished_at"] or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def db():
+    """Empty database session."""
+    session = SessionLocal()
+    session.query(Order).delete()
+    session.query(PlatformConnection).delete()
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 class TestPlatformClients:
     """Test individual platform clients."""
 
@@ -98,10 +171,681 @@ class TestOrderAggregator:
 
         assert all(stats[p]["connected"] for p in stats)
 
+    def test_async_fan_out_partial_results(self):
+        """Test slow and failing platforms are reported without blocking the rest."""
+        aggregator = OrderAggregator(timeouts={"amazon": 0.1})
+
+        def slow_orders(limit=50, updated_since=None):
+            time.sleep(1)
+            return []
+
+        def broken_orders(limit=50, updated_since=None):
+            raise ConnectionError("eBay unavailable")
+
+        aggregator.amazon.get_orders = slow_orders
+        aggregator.ebay.get_orders = broken_orders
+
+        started = time.monotonic()
+        result = asyncio.run(aggregator.get_all_orders_async(limit_per_platform=10))
+
+        assert time.monotonic() - started < 0.9
+        assert result.partial
+        assert set(result.errors) == {"amazon", "ebay"}
+        assert "Timed out" in result.errors["amazon"]
+        assert result.errors["ebay"] == "eBay unavailable"
+        assert sorted(result.platforms) == ["etsy", "shopify"]
+        assert {order["platform"] for order in result.orders} == {"etsy", "shopify"}
+
+    def test_inventory_sync_fan_out(self):
+        """Test inventory sync reports failing platforms as unsuccessful."""
+        aggregator = OrderAggregator()
+
+        def broken_sync(sku, quantity):
+            raise ConnectionError("Etsy unavailable")
+
+        aggregator.etsy.sync_inventory = broken_sync
+
+        expected = {"shopify": True, "amazon": True, "ebay": True, "etsy": False}
+        assert aggregator.sync_inventory_across_platforms("WIDGET-001", 5) == expected
+        assert asyncio.run(
+            aggregator.sync_inventory_across_platforms_async("WIDGET-001", 5)
+        ) == expected
+
+
+class TestCache:
+    """Test the platform response cache."""
+
+    def test_redis_get_or_set(self):
+        """Test values are loaded once, then served until invalidated."""
+        cache = Cache(RedisBackend(fakeredis.FakeRedis()))
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {"connected": True}
+
+        assert cache.get_or_set("platform:shopify:health", load, ttl=30) == {"connected": True}
+        assert cache.get_or_set("platform:shopify:health", load, ttl=30) == {"connected": True}
+        assert len(calls) == 1
+
+        cache.invalidate("platform:shopify:")
+        cache.get_or_set("platform:shopify:health", load, ttl=30)
+        assert len(calls) == 2
+
+    def test_single_flight(self):
+        """Test concurrent misses on one key run the loader once."""
+        cache = Cache(RedisBackend(fakeredis.FakeRedis()))
+        calls = []
+
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.2)
+            return 42
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set("k", slow_load, ttl=30)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 8
+        assert len(calls) == 1
+
+    def test_single_flight_across_processes(self):
+        """Test a second cache on the same Redis waits for the first loader."""
+        server = fakeredis.FakeServer()
+        first = Cache(RedisBackend(fakeredis.FakeRedis(server=server)))
+        second = Cache(RedisBackend(fakeredis.FakeRedis(server=server)))
+
+        def slow_load():
+            time.sleep(0.2)
+            return "first"
+
+        thread = threading.Thread(target=first.get_or_set, args=("k", slow_load, 30))
+        thread.start()
+        time.sleep(0.05)
+
+        assert second.get_or_set("k", lambda: "second", ttl=30) == "first"
+        thread.join()
+
+    def test_memory_expiry_and_eviction(self):
+        """Test the in-process fallback expires and evicts least recently used keys."""
+        cache = Cache(MemoryBackend(max_entries=2))
+
+        cache.set("a", 1, ttl=30)
+        cache.set("b", 2, ttl=30)
+        cache.get("a")
+        cache.set("c", 3, ttl=30)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+        cache.set("short", 1, ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("short") is None
+
+    def test_falls_back_without_redis(self):
+        """Test an unreachable Redis falls back to the in-process cache."""
+        cache = create_cache("redis://127.0.0.1:1/0")
+        assert isinstance(cache.backend, MemoryBackend)
+
+    def test_platform_stats_cached(self):
+        """Test repeated stats calls do not hit platform health checks."""
+        aggregator = OrderAggregator(cache=Cache(MemoryBackend()))
+        checks = []
+
+        def health_check():
+            checks.append(1)
+            return True
+
+        aggregator.shopify.health_check = health_check
+
+        aggregator.get_platform_stats()
+        aggregator.get_platform_stats()
+        assert len(checks) == 1
+
+        aggregator.sync_order_status("shopify", "SHOP1000", "shipped")
+        aggregator.get_platform_stats()
+        assert len(checks) == 2
+
+
+class TestPlatformRegistry:
+    """Test shared platform clients, sessions and tokens."""
+
+    def test_clients_shared(self):
+        """Test aggregators reuse one set of clients and one session."""
+        first, second = OrderAggregator(), OrderAggregator()
+        assert first.shopify is second.shopify
+        assert first.registry is get_registry()
+
+        session = get_registry().session
+        assert all(c.session is session for c in first.clients.values())
+
+        close_registry()
+        assert OrderAggregator().shopify is not first.shopify
+        assert session.is_closed
+
+    def test_token_cached_until_expiry(self):
+        """Test a token is exchanged once and refreshed inside the margin."""
+        tokens = TokenCache(margin_seconds=60)
+        exchanges = []
+
+        def exchange():
+            exchanges.append(1)
+            return f"token-{len(exchanges)}", 3600
+
+        assert tokens.get("amazon:app", exchange) == "token-1"
+        assert tokens.get("amazon:app", exchange) == "token-1"
+        assert len(exchanges) == 1
+
+        tokens.clear("amazon:app")
+        assert tokens.get("amazon:app", lambda: ("short", 30)) == "short"
+        # 30s left is inside the 60s margin, so the next read refreshes
+        assert tokens.get("amazon:app", exchange) == "token-2"
+
+    def test_refresh_token_exchanged_once(self):
+        """Test the Amazon client reuses its LWA access token across calls."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "Atza|abc", "expires_in": 3600})
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        amazon = AmazonClient(
+            refresh_token="Atzr|x", client_id="id", client_secret="secret",
+            session=session, tokens=TokenCache(),
+        )
+        amazon.demo_mode = False
+
+        assert amazon.health_check()
+        assert amazon.health_check()
+        assert len(requests) == 1
+        assert b"grant_type=refresh_token" in requests[0].content
+
+    def test_concurrency_limited_per_platform(self):
+        """Test calls to one platform wait for a free slot."""
+        registry = PlatformRegistry(max_concurrency=2)
+        running, peak = [], []
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        threads = [threading.Thread(target=registry.limited("shopify", call)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        registry.close()
+
+        assert max(peak) == 2
+
+
+class TestInventoryService:
+    """Test bulk inventory reservations."""
+
+    @pytest.fixture
+    def products(self, db):
+        """Twenty products with 5 units each."""
+        db.query(InventoryLog).delete()
+        db.query(InventoryOutboxEntry).delete()
+        db.query(Product).delete()
+        db.add_all(
+            Product(sku=f"SKU-{i:02d}", name=f"Product {i}", quantity_available=5)
+            for i in range(20)
+        )
+        db.commit()
+        return [f"SKU-{i:02d}" for i in range(20)]
+
+    def test_reserve_many_single_update(self, db, products):
+        """Test a 20-line order is reserved by one UPDATE plus batched inserts."""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.split()[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = InventoryService(db).reserve_many([(sku, 2) for sku in products], order_id=1)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result.success
+        assert result.quantities == {sku: 3 for sku in products}
+        assert statements.count("UPDATE") == 1
+        # One for the audit log, one for the platform push outbox
+        assert statements.count("INSERT") == 2
+
+        product = db.query(Product).filter(Product.sku == "SKU-00").one()
+        assert (product.quantity_available, product.quantity_reserved) == (3, 2)
+        assert db.query(InventoryLog).filter(InventoryLog.change_type == "reservation").count() == 20
+
+    def test_reserve_many_all_or_nothing(self, db, products):
+        """Test one short line leaves every SKU untouched."""
+        service = InventoryService(db)
+        result = service.reserve_many({"SKU-00": 1, "SKU-01": 6, "MISSING": 1}, order_id=1)
+
+        assert not result.success
+        assert result.insufficient == ["MISSING", "SKU-01"]
+        assert service.get_product("SKU-00").quantity_available == 5
+        assert db.query(InventoryLog).count() == 0
+
+    def test_release_many(self, db, products):
+        """Test releasing returns stock and refuses to release more than reserved."""
+        service = InventoryService(db)
+        service.reserve_many([("SKU-00", 2), ("SKU-00", 1)], order_id=1)
+
+        assert not service.release_many({"SKU-00": 4}, order_id=1).success
+        assert service.release_many({"SKU-00": 3}, order_id=1).quantities == {"SKU-00": 5}
+        assert service.get_product("SKU-00").quantity_reserved == 0
+
+    def test_release_reservation_clamps_reserved(self, db, products):
+        """Test the single-SKU release keeps clamping reserved at 0 instead of failing."""
+        service = InventoryService(db)
+        service.reserve_inventory("SKU-00", 2, order_id=1)
+
+        assert service.release_reservation("SKU-00", 3, order_id=1)
+        product = service.get_product("SKU-00")
+        assert (product.quantity_available, product.quantity_reserved) == (6, 0)
+        assert not service.release_reservation("MISSING", 1, order_id=1)
+
+    def test_concurrent_reservations_do_not_oversell(self, products):
+        """Test competing sessions never reserve more than is available."""
+        results = []
+
+        def reserve():
+            session = SessionLocal()
+            try:
+                results.append(InventoryService(session).reserve_inventory("SKU-00", 1, order_id=1))
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=reserve) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 5
+
+
+class TestInventoryOutbox:
+    """Test coalesced inventory pushes."""
+
+    @pytest.fixture
+    def product(self, db):
+        """One product with 100 units and an empty outbox."""
+        db.query(InventoryOutboxEntry).delete()
+        db.query(InventoryLog).delete()
+        db.query(Product).delete()
+        db.add(Product(sku="HOT-001", name="Hot Item", quantity_available=100))
+        db.commit()
+        return "HOT-001"
+
+    def make_outbox(self):
+        """Outbox with no coalescing delay or rate limit, recording bulk calls."""
+        outbox = InventoryOutbox(
+            window_seconds=0, rate_limits={p: 1000.0 for p in ["shopify", "amazon", "ebay", "etsy"]}
+        )
+        calls = []
+        for platform, platform_client in outbox.aggregator.clients.items():
+            def push(quantities, platform=platform):
+                calls.append((platform, dict(quantities)))
+                return {sku: True for sku in quantities}
+            platform_client.sync_inventory_bulk = push
+        return outbox, calls
+
+    def test_burst_coalesces_to_one_push_per_platform(self, db, product):
+        """Test 30 sales on one SKU push its final quantity once per platform."""
+        service = InventoryService(db)
+        for order_id in range(30):
+            assert service.reserve_inventory(product, 1, order_id=order_id)
+
+        assert db.query(InventoryOutboxEntry).count() == 4
+
+        outbox, calls = self.make_outbox()
+        assert asyncio.run(outbox.flush()) == {"shopify": 1, "amazon": 1, "ebay": 1, "etsy": 1}
+        assert sorted(calls) == sorted((p, {product: 70}) for p in ["shopify", "amazon", "ebay", "etsy"])
+        assert db.query(InventoryOutboxEntry).count() == 0
+
+    def test_failed_platform_retried_with_backoff(self, db, product):
+        """Test a failing platform keeps its entry with backoff while others clear."""
+        InventoryService(db).update_quantity(product, -5, "sale")
+
+        outbox, calls = self.make_outbox()
+
+        def broken_push(quantities):
+            raise ConnectionError("eBay unavailable")
+
+        outbox.aggregator.ebay.sync_inventory_bulk = broken_push
+
+        assert asyncio.run(outbox.flush())["ebay"] == 0
+
+        entries = db.query(InventoryOutboxEntry).all()
+        assert [(e.platform, e.attempts, e.last_error) for e in entries] == [
+            ("ebay", 1, "eBay unavailable")
+        ]
+        assert entries[0].next_attempt_at > datetime.utcnow()
+
+        # Not due again until the backoff passes
+        assert asyncio.run(outbox.flush()) == {}
+
+    def test_list_products_keyset(self, db, product):
+        """Test inventory pages follow SKU order via X-Next-Cursor."""
+        db.add_all(Product(sku=f"SKU-{i:02d}", name=f"Product {i}") for i in range(5))
+        db.commit()
+
+        first = client.get("/api/inventory?limit=4")
+        second = client.get(f"/api/inventory?limit=4&cursor={first.headers['X-Next-Cursor']}")
+
+        skus = [p["sku"] for p in first.json() + second.json()]
+        assert skus == ["HOT-001", "SKU-00", "SKU-01", "SKU-02", "SKU-03", "SKU-04"]
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_skip_platform_sync(self, db, product):
+        """Test manual updates can opt out of the platform push."""
+        InventoryService(db).update_quantity(product, 5, "restock", sync_platforms=False)
+        assert db.query(InventoryOutboxEntry).count() == 0
+
+
+class TestReorderEngine:
+    """Test demand-velocity reorder ranking."""
+
+    @pytest.fixture
+    def catalog(self, db):
+        """A fast seller, a slow seller with deep stock and an idle product below its reorder point."""
+        db.query(InventoryOutboxEntry).delete()
+        db.query(InventoryLog).delete()
+        db.query(Product).delete()
+        db.add_all([
+            Product(sku="FAST", name="Fast", quantity_available=20, reorder_quantity=50),
+            Product(sku="SLOW", name="Slow", quantity_available=500),
+            Product(sku="IDLE", name="Idle", quantity_available=5, reorder_point=10),
+        ])
+
+        now = datetime.utcnow()
+        sales = [("FAST", day, 10) for day in range(7)] + [("SLOW", 3, 1), ("SLOW", 60, 100)]
+        for i, (sku, days_ago, quantity) in enumerate(sales):
+            db.add(Order(
+                platform="shopify",
+                platform_order_id=f"REORDER-{i}",
+                status=OrderStatus.DELIVERED,
+                order_date=now - timedelta(days=days_ago, hours=1),
+                customer_name="Customer",
+                subtotal=Decimal("10.00"),
+                total=Decimal("10.00"),
+                items=[OrderItem(
+                    sku=sku,
+                    product_name=sku,
+                    quantity=quantity,
+                    unit_price=Decimal("1.00"),
+                    total_price=Decimal(quantity),
+                )],
+            ))
+        db.commit()
+        get_reorder_engine().invalidate()
+
+    def test_ranked_by_days_of_cover(self, db, catalog):
+        """Test products are ranked by how soon they run out."""
+        engine = ReorderEngine(lead_time_days=14, safety_days=7, cover_days=30)
+        suggestions = engine.get_reorder_list(db)
+
+        assert [s.sku for s in suggestions] == ["FAST", "IDLE"]
+
+        fast = suggestions[0]
+        # 70 units in both windows: 0.5 * 70/7 + 0.5 * 70/30 per day
+        assert fast.daily_velocity == pytest.approx(6.167, abs=0.001)
+        assert fast.days_of_cover == pytest.approx(3.2, abs=0.1)
+        assert fast.suggested_quantity == 295  # ceil(6.167 * 51 - 20)
+
+        idle = suggestions[1]
+        assert idle.days_of_cover is None
+        assert idle.suggested_quantity == 50  # its reorder_quantity
+
+    def test_incremental_refresh(self, db, catalog):
+        """Test dirty SKUs are re-queried without recomputing the catalog."""
+        engine = ReorderEngine()
+        engine.get_reorder_list(db)
+
+        loads = []
+        full_load = engine._load
+        engine._load = lambda session: loads.append(1) or full_load(session)
+
+        db.query(Product).filter(Product.sku == "SLOW").update({"quantity_available": 1})
+        db.commit()
+
+        assert "SLOW" not in [s.sku for s in engine.get_reorder_list(db)]
+        engine.mark_dirty(["SLOW"])
+        assert "SLOW" in [s.sku for s in engine.get_reorder_list(db)]
+        assert loads == []
+
+        # A new product needs a rebuild of the SKU index
+        db.add(Product(sku="NEW", name="New", quantity_available=0))
+        db.commit()
+        engine.mark_dirty(["NEW"])
+        assert "NEW" in [s.sku for s in engine.get_reorder_list(db)]
+        assert loads == [1]
+
+    def test_failed_refresh_is_retried(self, db, catalog):
+        """Test dirty SKUs and a pending full refresh survive a failed query."""
+        engine = ReorderEngine()
+        engine.get_reorder_list(db)
+
+        db.query(Product).filter(Product.sku == "SLOW").update({"quantity_available": 1})
+        db.commit()
+        engine.mark_dirty(["SLOW"])
+
+        def fail(session, snapshot, skus):
+            raise RuntimeError("database went away")
+
+        engine._patch = fail
+        with pytest.raises(RuntimeError):
+            engine.get_reorder_list(db)
+        del engine._patch
+        assert "SLOW" in [s.sku for s in engine.get_reorder_list(db)]
+
+        db.query(Product).filter(Product.sku == "SLOW").update({"quantity_available": 500})
+        db.commit()
+        engine.invalidate()
+
+        def fail_load(session):
+            raise RuntimeError("database went away")
+
+        engine._load = fail_load
+        with pytest.raises(RuntimeError):
+            engine.get_reorder_list(db)
+        del engine._load
+        assert "SLOW" not in [s.sku for s in engine.get_reorder_list(db)]
+
+    def test_reorder_endpoint(self, catalog):
+        """Test GET /api/inventory/reorder."""
+        response = client.get("/api/inventory/reorder?limit=1")
+        assert response.status_code == 200
+        assert [row["sku"] for row in response.json()] == ["FAST"]
+
+
+class TestOrderSync:
+    """Test syncing platform orders into the local store."""
+
+    def test_sync_upserts_orders(self, db):
+        """Test repeated syncs update stored orders instead of duplicating them."""
+        service = OrderSyncService(db)
+
+        first = asyncio.run(service.sync_orders(platforms=["shopify"]))
+        stored = db.query(Order).count()
+
+        assert first.orders_synced == stored > 0
+        assert first.platforms == ["shopify"]
+
+        # Re-fetching everything upserts the same platform orders again
+        db.query(PlatformConnection).update({"sync_cursor": None})
+        db.commit()
+        asyncio.run(service.sync_orders(platforms=["shopify"]))
+
+        assert db.query(Order).count() == stored
+
+    def test_sync_uses_high_water_mark(self, db):
+        """Test syncs only ask for orders updated since the stored cursor."""
+        aggregator = OrderAggregator()
+        seen = []
+
+        def get_orders(limit=50, updated_since=None):
+            seen.append(updated_since)
+            return [{
+                "id": "SHOP1", "platform": "shopify", "status": "pending",
+                "order_date": "2024-05-01T10:00:00",
+                "updated_at": "2024-05-02T10:00:00+00:00",
+                "customer": {"name": "Ada"},
+                "items": [{
+                    "sku": "WIDGET-001", "name": "Widget", "quantity": 1,
+                    "unit_price": 10.0, "total_price": 10.0,
+                }],
+                "subtotal": 10.0, "total": 10.0, "currency": "USD",
+            }]
+
+        aggregator.shopify.get_orders = get_orders
+        service = OrderSyncService(db, aggregator)
+
+        asyncio.run(service.sync_orders(platforms=["shopify"]))
+        asyncio.run(service.sync_orders(platforms=["shopify"]))
+
+        assert seen[0] is None
+        assert seen[1] == datetime(2024, 5, 2, 10, 0)
+
+        order = service.get_order("SHOP1")
+        assert order.customer_name == "Ada"
+        assert [item.sku for item in order.items] == ["WIDGET-001"]
+
+    def test_sync_pages_past_full_pages(self, db):
+        """Test a backlog larger than one page is synced without skipping orders."""
+        aggregator = OrderAggregator()
+        updates = [
+            {
+                "id": f"SHOP{i}", "platform": "shopify", "status": "pending",
+                "order_date": "2024-05-01T10:00:00",
+                "updated_at": (datetime(2024, 5, 2) + timedelta(minutes=i)).isoformat(),
+                "customer": {"name": "Ada"}, "items": [],
+                "subtotal": 10.0, "total": 10.0, "currency": "USD",
+            }
+            for i in range(25)
+        ]
+
+        def get_orders(limit=50, updated_since=None):
+            # Oldest update first, like the platform APIs
+            return [
+                o for o in updates
+                if updated_since is None or datetime.fromisoformat(o["updated_at"]) >= updated_since
+            ][:limit]
+
+        aggregator.shopify.get_orders = get_orders
+        service = OrderSyncService(db, aggregator)
+
+        result = asyncio.run(service.sync_orders(platforms=["shopify"], limit_per_platform=10))
+
+        stored = {o.platform_order_id for o in db.query(Order).filter(Order.platform == "shopify")}
+        assert stored == {o["id"] for o in updates}
+        assert result.orders_synced == 25
+
+        connection = db.query(PlatformConnection).filter_by(platform_type=PlatformType.SHOPIFY).one()
+        assert connection.sync_cursor == datetime(2024, 5, 2, 0, 24)
+
+    def test_failed_platform_keeps_cursor(self, db):
+        """Test a failing platform is reported and its cursor left alone."""
+        aggregator = OrderAggregator()
+
+        def broken_orders(limit=50, updated_since=None):
+            raise ConnectionError("Etsy unavailable")
+
+        aggregator.etsy.get_orders = broken_orders
+        result = asyncio.run(OrderSyncService(db, aggregator).sync_orders())
+
+        assert result.errors == {"etsy": "Etsy unavailable"}
+        assert "etsy" not in result.platforms
+
+        statuses = {
+            c.platform_type.value: (c.last_sync_status, c.sync_cursor)
+            for c in db.query(PlatformConnection)
+        }
+        assert statuses["etsy"] == ("error", None)
+        assert statuses["shopify"][0] == "success"
+
+
+class TestSyncScheduler:
+    """Test background sync scheduling."""
+
+    def test_overlapping_triggers_coalesce(self, db):
+        """Test a platform already syncing is not synced again."""
+        aggregator = OrderAggregator()
+        calls = []
+
+        def slow_orders(limit=50, updated_since=None):
+            calls.append(updated_since)
+            time.sleep(0.05)
+            return []
+
+        aggregator.shopify.get_orders = slow_orders
+        scheduler = SyncScheduler(session_factory=SessionLocal, aggregator=aggregator)
+
+        async def run():
+            first = scheduler.trigger(["shopify"])
+            second = scheduler.trigger(["shopify"])
+            await asyncio.gather(*scheduler._watchers)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert first.status == second.status == JobStatus.SUCCEEDED
+        assert scheduler.metrics["shopify"].runs == 1
+        assert scheduler.metrics["shopify"].last_success_at is not None
+
+    def test_failures_back_off(self, db):
+        """Test failing platforms are retried later, up to the backoff cap."""
+        aggregator = OrderAggregator()
+
+        def broken_orders(limit=50, updated_since=None):
+            raise ConnectionError("Amazon unavailable")
+
+        aggregator.amazon.get_orders = broken_orders
+        scheduler = SyncScheduler(
+            session_factory=SessionLocal,
+            aggregator=aggregator,
+            intervals={"amazon": 60},
+            jitter=0,
+            max_backoff_seconds=300,
+        )
+
+        async def run():
+            for _ in range(3):
+                scheduler.trigger(["amazon"])
+                await asyncio.gather(*scheduler._watchers)
+
+        assert scheduler.next_delay("amazon") == 60
+        asyncio.run(run())
+
+        metrics = scheduler.metrics["amazon"]
+        assert metrics.consecutive_failures == 3
+        assert metrics.last_error == "Amazon unavailable"
+        assert scheduler.next_delay("amazon") == 300
+
 
 class TestOrdersAPI:
     """Test orders API endpoints."""
 
+    @pytest.fixture(autouse=True)
+    def synced_orders(self, db):
+        """Sync demo orders into the store before each test."""
+        wait_for_job(client.post("/api/orders/sync").json()["job_id"])
+
     def test_list_orders(self):
         """Test GET /api/orders endpoint."""
         response = client.get("/api/orders?limit=20")
@@ -137,15 +881,126 @@ class TestOrdersAPI:
         if len(data) > 0:
             assert all(order["status"] == "shipped" for order in data)
 
+    def test_keyset_pagination(self):
+        """Test following X-Next-Cursor walks every order exactly once, newest first."""
+        everything = client.get("/api/orders?limit=500").json()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/api/orders", params=params)
+            seen.extend(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert [(o["platform"], o["id"]) for o in seen] == [
+            (o["platform"], o["id"]) for o in everything
+        ]
+        assert client.get("/api/orders?cursor=not-a-cursor").status_code == 400
+
+    def test_combined_filters(self):
+        """Test platform, status, date and SKU filters combine."""
+        response = client.get(
+            "/api/orders",
+            params={
+                "platform": ["shopify", "etsy"],
+                "status": ["shipped", "delivered"],
+                "date_from": "2000-01-01T00:00:00",
+                "sku": "WIDGET-001",
+            },
+        )
+        assert response.status_code == 200
+
+        for order in response.json():
+            assert order["platform"] in ("shopify", "etsy")
+            assert order["status"] in ("shipped", "delivered")
+            assert "WIDGET-001" in {item["sku"] for item in order["items"]}
+
+        assert client.get("/api/orders?date_to=2000-01-01T00:00:00").json() == []
+
+    def test_summaries(self):
+        """Test revenue and SKU summaries match the listed orders."""
+        orders = client.get("/api/orders?limit=500").json()
+
+        revenue = client.get("/api/orders/summary/revenue").json()
+        assert sum(row["orders"] for row in revenue) == len(orders)
+        assert sum(row["revenue"] for row in revenue) == pytest.approx(
+            sum(o["total"] for o in orders)
+        )
+
+        skus = client.get("/api/orders/summary/skus").json()
+        units = [row["units"] for row in skus]
+        assert units == sorted(units, reverse=True)
+        assert sum(units) == sum(i["quantity"] for o in orders for i in o["items"])
+
+        widget = client.get("/api/orders/summary/skus?sku=WIDGET-001").json()
+        assert [row["sku"] for row in widget] in ([], ["WIDGET-001"])
+
+    def test_serializer_matches_response_model(self, db):
+        """Test stored rows and platform dicts serialize to the OrderResponse shape."""
+        row = db.query(Order).first()
+        data = order_to_dict(row)
+        assert OrderResponse.model_validate(data).model_dump() == data
+
+        platform_order = ShopifyClient().get_orders(limit=1)[0]
+        data = order_to_dict(platform_order)
+        assert OrderResponse.model_validate(data).model_dump() == data
+
+        # Expired rows (after a commit) load their attributes on access
+        db.commit()
+        assert order_to_dict(row)["id"] == row.platform_order_id
+
     def test_sync_orders(self):
         """Test POST /api/orders/sync endpoint."""
+        # The sync fixture already pulled everything, so start from scratch
+        with SessionLocal() as session:
+            session.query(PlatformConnection).update({"sync_cursor": None})
+            session.commit()
+
         response = client.post("/api/orders/sync")
+        assert response.status_code == 202
+        assert response.json()["status"] == "queued"
+
+        data = wait_for_job(response.json()["job_id"])
+        assert data["status"] == "succeeded"
+        assert data["orders_synced"] > 0
+        assert len(data["platforms_synced"]) == 4
+        assert data["errors"] == {}
+
+    def test_sync_status(self):
+        """Test GET /api/orders/sync reports per-platform metrics."""
+        response = client.get("/api/orders/sync")
         assert response.status_code == 200
 
         data = response.json()
-        assert data["success"] is True
-        assert data["orders_synced"] > 0
-        assert len(data["platforms_synced"]) > 0
+        assert data["scheduler_running"] is False
+        assert {p["platform"] for p in data["platforms"]} == {"shopify", "amazon", "ebay", "etsy"}
+        assert all(p["runs"] > 0 and p["lag_seconds"] is not None for p in data["platforms"])
+
+        assert client.get("/api/orders/sync/unknown").status_code == 404
+
+    def test_get_order(self):
+        """Test GET /api/orders/{order_id} reads from the store."""
+        response = client.get("/api/orders/SHOP1000")
+        assert response.status_code == 200
+        assert response.json()["platform"] == "shopify"
+
+        response = client.get("/api/orders/UNKNOWN")
+        assert response.status_code == 404
+
+    def test_update_order(self):
+        """Test PATCH /api/orders/{order_id} persists the change."""
+        response = client.patch(
+            "/api/orders/SHOP1000",
+            json={"status": "shipped", "tracking_number": "1Z999", "carrier": "UPS"},
+        )
+        assert response.status_code == 200
+
+        data = client.get("/api/orders/SHOP1000").json()
+        assert data["status"] == "shipped"
+        assert data["tracking_number"] == "1Z999"
 
 
 class TestPlatformsAPI: